@@ -48,7 +48,7 @@ functionSignature
 funcAssign: functionSignature body;
 varAssign
     : ID op=(ADD | SUB | MUL | DIV | MOD)? ASSIGN expr
-    | MUTABLE? ID ASSIGN expr
+    | MUTABLE ID ASSIGN expr
     ;
 
 arg: (label=ID COLON)? expr;
@@ -62,19 +62,16 @@ genericParams: LT genericParam (COMMA genericParam)* GT;
 
 expr
     : LPAREN type RPAREN expr #cast
-    | ID LPAREN args? RPAREN #call
     | LPAREN expr RPAREN #paren
     | INT #int
     | FLOAT #float
     | STRING #string
     | BOOL #bool
-    | ID #id
-    | NEW type LPAREN args? RPAREN #new
-    | NEW type LBRACK RBRACK #newArray
+    | ID (LPAREN args? RPAREN)? #call // also a plain identifier
+    | NEW type (LPAREN args? RPAREN | LBRACK RBRACK) #new // also a new array
     | LBRACK args? RBRACK #arrayInit // make args optional so we can do the error message
     | expr IF expr ELSE expr #ternary
-    | expr DOT ID LPAREN args? RPAREN #method
-    | expr DOT ID #property
+    | expr DOT ID (LPAREN args? RPAREN)? #attribute // a method call or a property
     | expr op=(MUL | DIV | MOD) expr #multiplication
     | expr op=(ADD | SUB) expr #addition
     | expr op=(EEQ | NEQ | GT | LT | GTE | LTE) expr #relational
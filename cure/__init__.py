@@ -1,122 +1,34 @@
-from logging import debug, info, error
-from sys import exit as sys_exit
-# from pprint import pformat
-from subprocess import run
+from sys import exit as sys_exit, stderr
 from pathlib import Path
 
-from colorama import Fore, Style
+from cure.log import debug, info, error
 
-from cure.ir import Scope, STDLIB_PATH, Position
-from cure.ir_builder import IRBuilder
 
+def log_system_info():
+    from platform import system, platform, processor, machine
+    from struct import calcsize
 
-def parse(scope: Scope):
-    ir_builder = IRBuilder(scope)
-    program = ir_builder.build()
-    # debug(f'Parsed program: {pformat(program)}')
-    return program
-
-def compile_to_str(scope: Scope):
-    program = parse(scope)
-    return program.analyse(scope).codegen(scope)
-
-def compile_cmake(build_dir: Path = Path.cwd(), **kwargs):
-    kwargs_str = ' '.join(f'{k}={v}' for k, v in kwargs.items())
-    make_build_cmd = f'cmake -B {build_dir.as_posix()} {kwargs_str} -G "Ninja"'
-    build_cmd = f'cmake --build {build_dir.as_posix()}'
-    debug(f'Running CMake commands ({make_build_cmd} and {build_cmd})')
-    return run(f'{make_build_cmd} && {build_cmd}', shell=True)
-
-def compile_to_exe(scope: Scope):
-    code = compile_to_str(scope)
-
-    build_dir = scope.file.parent.absolute() / 'build'
-    build_dir.mkdir(exist_ok=True)
-    debug(f'Build Directory = {build_dir}')
-
-    cmake_name = scope.file.stem
-    build_type = 'Debug'
-    debug(f'Build Type = {build_type}')
-    debug(f'CMake Name = {cmake_name}')
-
-    main_file = build_dir / 'main.cpp'
-    main_file.write_text(code)
-    debug(f'main.cpp = {main_file}')
-
-    code_files = ' '.join([main_file.as_posix()] + [
-        dep.path.as_posix() for dep in scope.dependencies
-        if dep.type == 'src'
-    ])
-    
-    include_dirs = ' '.join([STDLIB_PATH.absolute().as_posix()] + [
-        dep.path.as_posix() for dep in scope.dependencies
-        if dep.type == 'hpp_dir'
-    ])
-
-    cmake_code = f"""cmake_minimum_required(VERSION 3.10)
-project({cmake_name})
-# set(CMAKE_MESSAGE_LOG_LEVEL "WARNING")
-set(CMAKE_CXX_STANDARD 17)
-set(CMAKE_BUILD_TYPE "{build_type}")
-set(SOURCES {code_files})
-
-add_executable({cmake_name} ${{SOURCES}})
-
-target_include_directories({cmake_name} PRIVATE {include_dirs})
-
-if (MSVC)
-    target_compile_options({cmake_name} PRIVATE /W4)
-else()
-    target_compile_options({cmake_name} PRIVATE -Wall -Wextra -Wpedantic)
-endif()
-
-add_definitions(-D{scope.target.macro_name}=1)
-"""
-
-    for dep in scope.dependencies:
-        match dep.type:
-            case 'lib':
-                cmake_code += f"""
-target_link_libraries({cmake_name} PRIVATE {dep.path.as_posix()})
-"""
-            case 'dep':
-                cmake_code += f"""
-add_subdirectory({dep.path.as_posix()} ${{CMAKE_BINARY_DIR}}/{dep.path.name})
-"""
-
-    cmakelists = build_dir / 'CMakeLists.txt'
-    cmakelists.write_text(cmake_code)
-
-    kwargs = {'-S': cmakelists.parent.as_posix()}
-    ret_code = compile_cmake(build_dir, **kwargs)
-    if ret_code.returncode != 0:
-        print(f'{Fore.RED}error: failed to build{Style.RESET_ALL}')
-        return
-    
-    exec_name = f'{cmake_name}.exe'
-    debug(f'Executable Name = {exec_name}')
-
-    exec_file = build_dir / exec_name
-    debug(f'Built Executable File = {exec_file}')
-
-    new_exec_path = scope.file.parent / exec_name
-    if new_exec_path.exists():
-        new_exec_path.unlink()
-    
-    exec_file.rename(new_exec_path)
-
-    debug(f'Executable File = {new_exec_path}')
-    return new_exec_path
-
-def create_scope(file: Path):
-    scope = Scope(file)
-    scope.use(Position(0, 0), 'builtins')
-    return scope
+    # platform.architecture() runs the `file` command on the interpreter, the pointer size gives
+    # the same answer without a subprocess
+    info(f"""Host system
+System = {system()}
+Architecture = {calcsize('P') * 8}bit
+Platform = {platform()}
+Processor = {processor()}
+Machine = {machine()}
+""")
 
 
 class ArgParser:
     def __init__(self, args: list[str]):
-        self.args = args
+        self.args = [arg for arg in args if not arg.startswith('--')]
+        self.options: dict[str, str | None] = {}
+        for arg in args:
+            if not arg.startswith('--'):
+                continue
+
+            name, _, value = arg.removeprefix('--').partition('=')
+            self.options[name] = value or None
     
     def parse(self):
         action = self.arg(0)
@@ -124,8 +36,20 @@ class ArgParser:
         match action:
             case 'build':
                 self.build()
+            case 'check':
+                self.check()
+            case 'daemon':
+                self.daemon()
             case 'test':
                 self.test()
+            case 'bench':
+                self.bench()
+            case 'profile':
+                self.profile()
+            case 'cache':
+                self.cache()
+            case 'stdlib':
+                self.stdlib()
             case _:
                 error(f'Unknown action {action}')
 
@@ -144,34 +68,223 @@ class ArgParser:
         debug(f'No arg at index {index}')
         return None
     
+    def option(self, name: str, default: str | None = None):
+        return self.options.get(name) or default
+    
+    def flag(self, name: str):
+        return name in self.options
+    
     def test(self):
         from cure.tests import test
         test()
     
-    def build(self, file_path: str | None = None):
+    def bench(self):
+        from cure.tests.bench import bench
+        bench(self.arg(1))
+    
+    def cache(self):
+        if self.arg(1) != 'clear':
+            print('Usage: cure cache clear')
+            print(f'Unknown cache action \'{self.arg(1)}\'' if self.arg(1) else 'No cache action')
+            sys_exit(1)
+        
+        from cure import cache
+
+        num_files, size = cache.clear()
+        print(f'Removed {num_files} files ({size / 1024 / 1024:.1f} MB) from {cache.CACHE_DIR}')
+    
+    def stdlib(self):
+        if self.arg(1) != 'manifest':
+            print('Usage: cure stdlib manifest')
+            print(f'Unknown stdlib action \'{self.arg(1)}\'' if self.arg(1) else 'No stdlib action')
+            sys_exit(1)
+        
+        from cure.manifest import MANIFEST_PATH, write_manifest
+
+        manifest = write_manifest()
+        print(f'Wrote the manifest of {len(manifest)} standard library modules to '\
+              f'{MANIFEST_PATH.as_posix()}')
+    
+    def profile(self):
+        files = [Path(file_path) for file_path in self.args[1:]]
+        if len(files) == 0:
+            print('Usage: cure profile <files> [--sll] [--json=<path>]')
+            print('No files')
+            sys_exit(1)
+        
+        for file in files:
+            if not file.is_file():
+                print('Usage: cure profile <files> [--sll] [--json=<path>]')
+                print(f'File \'{file.as_posix()}\' does not exist')
+                sys_exit(1)
+        
+        from cure.parse_profiler import profile_parse, profile_table, write_profile_json
+
+        decisions = profile_parse(files, self.flag('sll'))
+        print(profile_table(decisions))
+
+        json_file = self.option('json')
+        if json_file is not None:
+            write_profile_json(Path(json_file), decisions)
+            print(f'Profile written to {Path(json_file).as_posix()}')
+    
+    def file_arg(self, action: str, file_path: str | None = None):
         if file_path is None:
             file_path = self.arg(1)
         
         debug(f'File Path = {file_path}')
         if file_path is None:
-            print('Usage: cure build <file>')
+            print(f'Usage: cure {action} <file>')
             print('No file')
             sys_exit(1)
         
         path = Path(file_path)
         debug(f'Path = {path}')
         if not path.exists():
-            print('Usage: cure build <file>')
+            print(f'Usage: cure {action} <file>')
             print(f'File \'{file_path}\' does not exist')
             sys_exit(1)
         
         if not path.is_file():
-            print('Usage: cure build <file>')
+            print(f'Usage: cure {action} <file>')
             print(f'File \'{file_path}\' is not a file')
             sys_exit(1)
         
-        scope = create_scope(path)
+        return path
+    
+    def jobs(self, action: str):
+        jobs = self.option('jobs')
+        if jobs is None:
+            return None
+        
+        if not jobs.isdigit() or int(jobs) < 1:
+            print(f'Usage: cure {action} <file> [--jobs=<processes>]')
+            print(f'Invalid number of jobs \'{jobs}\'')
+            sys_exit(1)
+        
+        return int(jobs)
+    
+    def run_in_daemon(self, action: str, path: Path, jobs: int | None):
+        """Sends the command to the daemon (see `cure daemon`), returning False if none is running."""
+
+        from cure.daemon import request
+
+        response = request({
+            'action': action, 'file': path.resolve().as_posix(), 'cwd': Path.cwd().as_posix(),
+            'frontend': self.option('frontend', 'antlr'), 'separate': self.flag('separate'),
+            'jobs': jobs
+        })
+        if response is None:
+            info('No compiler daemon is running, compiling in this process')
+            return False
+        
+        print(response['stdout'], end='')
+        print(response['stderr'], end='', file=stderr)
+        if response['returncode'] != 0:
+            sys_exit(response['returncode'])
+        
+        return True
+    
+    def daemon(self):
+        action = self.arg(1)
+        if action not in ('start', 'stop', 'status'):
+            print('Usage: cure daemon start|stop|status')
+            print(f'Unknown daemon action \'{action}\'' if action else 'No daemon action')
+            sys_exit(1)
+        
+        from cure.daemon import SOCKET_PATH, HAS_UNIX_SOCKETS, request, serve
 
-        info('Compiling to executable')
-        exec_path = compile_to_exe(scope)
-        info(f'Compiled to executable at path {exec_path}')
+        if not HAS_UNIX_SOCKETS:
+            print('The daemon needs Unix domain sockets, which this platform does not support')
+            sys_exit(1)
+        
+        response = request({'action': 'status' if action == 'start' else action})
+        if action == 'start':
+            if response is not None:
+                print(f'A daemon is already running on {SOCKET_PATH.as_posix()}')
+                sys_exit(1)
+            
+            serve()
+        elif response is None:
+            print(f'No daemon is running on {SOCKET_PATH.as_posix()}')
+            sys_exit(1)
+        else:
+            print(response['stdout'], end='')
+    
+    def check(self):
+        path = self.file_arg('check')
+        jobs = self.jobs('check')
+        if self.flag('daemon') and self.run_in_daemon('check', path, jobs):
+            return
+        
+        from cure.compiler import create_scope, compile_to_str, FRONTENDS
+        from cure.diagnostics import CompileError
+
+        frontend = self.option('frontend', 'antlr')
+        if frontend not in FRONTENDS:
+            print('Usage: cure check <file> [--frontend=antlr|native]')
+            print(f'Unknown frontend \'{frontend}\'')
+            sys_exit(1)
+        
+        try:
+            compile_to_str(create_scope(path, frontend, jobs, self.flag('separate')))
+        except CompileError as e:
+            e.report()
+            sys_exit(1)
+        
+        print(f'No errors in {path.as_posix()}')
+    
+    def build(self, file_path: str | None = None):
+        path = self.file_arg('build', file_path)
+        jobs = self.jobs('build')
+        if self.flag('daemon') and self.run_in_daemon('build', path, jobs):
+            return
+        
+        # the compiler is only imported once the arguments are known to be valid, so a mistyped
+        # command fails fast
+        from cure.compiler import create_scope, compile_to_exe, FRONTENDS
+        from cure.diagnostics import CompileError
+        from cure.timings import timings
+
+        frontend = self.option('frontend', 'antlr')
+        debug(f'Frontend = {frontend}')
+        if frontend not in FRONTENDS:
+            print('Usage: cure build <file> [--frontend=antlr|native]')
+            print(f'Unknown frontend \'{frontend}\'')
+            sys_exit(1)
+        
+        log_system_info()
+        if self.flag('watch'):
+            from cure.watch import watch
+            watch(path, frontend, jobs, self.flag('separate'))
+            return
+        
+        timings.reset(self.flag('timings'))
+        try:
+            with timings.phase('build'):
+                with timings.phase('create scope'):
+                    scope = create_scope(path, frontend, jobs, self.flag('separate'))
+
+                info('Compiling to executable')
+                exec_path = compile_to_exe(scope)
+                info(f'Compiled to executable at path {exec_path}')
+        except CompileError as e:
+            e.report()
+            sys_exit(1)
+        
+        if timings.enabled:
+            self.report_timings(path)
+    
+    def report_timings(self, path: Path):
+        from cure.timings import timings
+
+        print(timings.table())
+
+        timings_file = self.option('timings')
+        if timings_file is None:
+            build_dir = path.parent.absolute() / 'build'
+            build_dir.mkdir(exist_ok=True)
+            timings_file = build_dir / 'timings.json'
+        
+        timings.write_json(Path(timings_file), path)
+        print(f'Timings written to {Path(timings_file).as_posix()}')
@@ -0,0 +1,211 @@
+from collections import OrderedDict
+from tempfile import NamedTemporaryFile
+from hashlib import sha256
+from pathlib import Path
+from os import environ, replace
+import pickle
+import zlib
+
+from cure.log import debug, info
+
+
+CACHE_DIR = Path(environ.get('CURE_CACHE_DIR', Path.home() / '.cure' / 'cache'))
+# the cache is trimmed to this many bytes (least recently used files first) after every store
+MAX_CACHE_SIZE = int(environ.get('CURE_CACHE_SIZE', 256 * 1024 * 1024))
+# the pickles this process loaded or stored are also kept in memory (least recently used first out
+# after this many bytes), so compiling many files in one process does not read and decompress the
+# same cache files, like the standard library's, again for every file
+MAX_MEMORY_SIZE = 64 * 1024 * 1024
+COMPILER_DIR = Path(__file__).parent
+
+_compiler_version: str | None = None
+_memory: OrderedDict[Path, bytes] = OrderedDict()
+_memory_size = 0
+
+
+def compiler_version():
+    """A hash of the compiler's own source code, so cached data is invalidated whenever the
+compiler (and therefore the layout of the pickled IR) changes."""
+
+    global _compiler_version
+    if _compiler_version is None:
+        hasher = sha256()
+        for file in sorted(COMPILER_DIR.glob('*.py')) + sorted(COMPILER_DIR.glob('parser/*.py')):
+            hasher.update(file.read_bytes())
+
+        _compiler_version = hasher.hexdigest()
+
+    return _compiler_version
+
+def content_hash(file: Path, *extra: str):
+    hasher = sha256(file.read_bytes())
+    hasher.update(compiler_version().encode())
+    for value in extra:
+        hasher.update(value.encode())
+    
+    return hasher.hexdigest()
+
+def cache_file(kind: str, key: str):
+    # named by the key only, files with the same contents (like the temporary files f-string
+    # expressions are parsed from) share one cache file
+    return CACHE_DIR / kind / f'{key[:32]}.pickle'
+
+def remember(path: Path, data: bytes):
+    global _memory_size
+    if path in _memory:
+        _memory_size -= len(_memory.pop(path))
+
+    _memory[path] = data
+    _memory_size += len(data)
+    while _memory_size > MAX_MEMORY_SIZE:
+        _, evicted = _memory.popitem(last=False)
+        _memory_size -= len(evicted)
+
+def write_atomically(path: Path, data: bytes):
+    """Writes the data to a new temporary file next to `path` and moves it into place, so another
+process reading the file, or the workers compiling modules in parallel writing it at the same time,
+never see a partly written file."""
+
+    temp = NamedTemporaryFile('wb', dir=path.parent, prefix=f'{path.name}.', suffix='.tmp',
+                              delete=False)
+    try:
+        with temp:
+            temp.write(data)
+
+        replace(temp.name, path)
+    except BaseException:
+        Path(temp.name).unlink(missing_ok=True)
+        raise
+
+def load(kind: str, file: Path, key: str):
+    path = cache_file(kind, key)
+    data = _memory.get(path)
+    if data is not None:
+        _memory.move_to_end(path)
+        debug(f'Loaded {kind} cache for {file} from memory')
+        # unpickled again every time, the caller may modify the value
+        return pickle.loads(data)
+
+    if not path.exists():
+        debug(f'No {kind} cache for {file} at {path}')
+        return None
+
+    try:
+        data = zlib.decompress(path.read_bytes())
+        value = pickle.loads(data)
+    except Exception as e: # a corrupted or outdated cache file is treated as a miss
+        info(f'Failed to load {kind} cache {path}: {e!r}')
+        path.unlink(missing_ok=True)
+        return None
+
+    remember(path, data)
+
+    try:
+        path.touch() # the modification time is the last use for the LRU eviction
+    except OSError:
+        pass
+
+    debug(f'Loaded {kind} cache for {file} from {path}')
+    return value
+
+def store(kind: str, file: Path, key: str, value):
+    path = cache_file(kind, key)
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    remember(path, data)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(path, zlib.compress(data, 1))
+    except OSError as e: # caching is best effort, a read-only cache directory is not an error
+        info(f'Failed to write {kind} cache {path}: {e!r}')
+        return
+
+    debug(f'Stored {kind} cache for {file} at {path}')
+    evict()
+
+def load_file(path: Path, key: str):
+    """Loads a value stored with `store_file`, or returns None if the file does not exist or was
+stored with a different key."""
+
+    data = _memory.get(path)
+    if data is None or data.partition(b'\n')[0] != key.encode():
+        # the file may have been written by another process since it was remembered
+        try:
+            data = path.read_bytes()
+        except OSError:
+            debug(f'No file at {path}')
+            return None
+
+        remember(path, data)
+
+    stored_key, _, compressed = data.partition(b'\n')
+    if stored_key != key.encode():
+        debug(f'{path} was stored with a different key')
+        return None
+
+    try:
+        value = pickle.loads(zlib.decompress(compressed))
+    except Exception as e: # a corrupted or outdated file is treated as a miss
+        info(f'Failed to load {path}: {e!r}')
+        return None
+
+    debug(f'Loaded {path}')
+    return value
+
+def store_file(path: Path, key: str, value):
+    """Stores the value in a file outside the cache directory, like the interface of a module in
+the module's build directory (see `Scope.compile_module`), preceded by its key. It is not evicted
+with the cache."""
+
+    data = key.encode() + b'\n' + zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), 1)
+    remember(path, data)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(path, data)
+    except OSError as e: # like the cache, a read-only directory is not an error
+        info(f'Failed to write {path}: {e!r}')
+        return
+
+    debug(f'Stored {path}')
+
+def cache_files():
+    return list(CACHE_DIR.glob('*/*.pickle'))
+
+def evict(max_size: int | None = None):
+    """Removes the least recently used cache files until the cache is at most `max_size` bytes."""
+
+    if max_size is None:
+        max_size = MAX_CACHE_SIZE
+
+    files = []
+    for path in cache_files():
+        try:
+            stat = path.stat()
+        except OSError: # removed by another compiler process
+            continue
+
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(file_size for _, file_size, _ in files)
+    for _, file_size, path in sorted(files):
+        if size <= max_size:
+            break
+
+        debug(f'Evicting cache file {path}')
+        path.unlink(missing_ok=True)
+        size -= file_size
+
+def clear():
+    """Removes every cache file, returning how many files and bytes were removed."""
+
+    global _memory_size
+    _memory.clear()
+    _memory_size = 0
+
+    files = cache_files()
+    size = 0
+    for path in files:
+        size += path.stat().st_size
+        path.unlink(missing_ok=True)
+
+    info(f'Cleared {len(files)} files ({size} bytes) from the cache at {CACHE_DIR}')
+    return len(files), size
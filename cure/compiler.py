@@ -0,0 +1,226 @@
+from importlib import import_module
+from dataclasses import dataclass
+# from pprint import pformat
+from subprocess import run
+from shutil import copy2
+from pathlib import Path
+import sys
+
+from colorama import Fore, Style
+
+from cure.ir import Scope, STDLIB_PATH, Position
+from cure.diagnostics import CompileError
+from cure.modules import compile_modules
+from cure.log import debug, info
+from cure.timings import timings
+from cure import cache
+
+
+# front end name -> (module, class), a front end is only imported once a file has to be parsed so
+# builds that only hit the IR cache never import ANTLR
+FRONTENDS = {
+    'antlr': ('cure.ir_builder', 'IRBuilder'),
+    'native': ('cure.native_parser', 'Parser')
+}
+
+def get_frontend(name: str):
+    module, cls = FRONTENDS[name]
+    return getattr(import_module(module), cls)
+
+def parse(scope: Scope):
+    with timings.phase(f'parse {scope.file.name}'):
+        # the IR is cached before analysis, which looks literal types up by name again, so the
+        # cached IR is the same whichever scope and front end it was built in
+        key = cache.content_hash(scope.file)
+        program = cache.load('ir', scope.file, key)
+        if program is None:
+            ir_builder = get_frontend(scope.frontend)(scope)
+            program = ir_builder.build()
+            cache.store('ir', scope.file, key, program)
+        else:
+            info(f'Loaded the IR of {scope.file} from the cache')
+    # debug(f'Parsed program: {pformat(program)}')
+    return program
+
+def compile_program(scope: Scope):
+    """The analysed program of the scope's file and its C++ code."""
+
+    program = parse(scope)
+    with timings.phase(f'analyse {scope.file.name}'):
+        program = program.analyse(scope)
+    
+    with timings.phase(f'codegen {scope.file.name}'):
+        return program, program.codegen(scope)
+
+def compile_to_str(scope: Scope):
+    return compile_program(scope)[1]
+
+def write_if_changed(file: Path, text: str):
+    """Writes `text` to `file` unless it already contains it, so the file's modification time (which
+Ninja rebuilds by) only changes with its contents. The file is replaced in one step (see
+`cache.write_atomically`), the headers of modules are written by parallel workers. Returns whether
+the file was written."""
+
+    if file.exists() and file.read_text() == text:
+        debug(f'{file} is unchanged')
+        return False
+
+    cache.write_atomically(file, text.encode())
+    return True
+
+def run_command(cmd: str, capture: bool):
+    if not capture:
+        return run(cmd, shell=True)
+    
+    # the daemon sends the output of the commands to its client instead of its own terminal
+    ret = run(cmd, shell=True, capture_output=True, text=True)
+    print(ret.stdout, end='')
+    print(ret.stderr, end='', file=sys.stderr)
+    return ret
+
+def compile_cmake(build_dir: Path = Path.cwd(), capture: bool = False, **kwargs):
+    kwargs_str = ' '.join(f'{k}={v}' for k, v in kwargs.items())
+    make_build_cmd = f'cmake -B {build_dir.as_posix()} {kwargs_str} -G "Ninja"'
+    build_cmd = f'cmake --build {build_dir.as_posix()}'
+    debug(f'Running CMake commands ({make_build_cmd} and {build_cmd})')
+    # once configured, the Ninja build re-runs CMake by itself whenever CMakeLists.txt changes
+    if not (build_dir / 'build.ninja').exists():
+        with timings.phase('cmake configure', children=True):
+            ret = run_command(make_build_cmd, capture)
+        
+        if ret.returncode != 0:
+            return ret
+    else:
+        debug(f'{build_dir} is already configured')
+    
+    with timings.phase('cmake build', children=True):
+        return run_command(build_cmd, capture)
+
+def write_build_files(scope: Scope, code: str, build_dir: Path, cmake_name: str):
+    build_dir.mkdir(exist_ok=True)
+    debug(f'Build Directory = {build_dir}')
+
+    build_type = 'Debug'
+    debug(f'Build Type = {build_type}')
+    debug(f'CMake Name = {cmake_name}')
+
+    main_file = build_dir / 'main.cpp'
+    write_if_changed(main_file, code)
+    debug(f'main.cpp = {main_file}')
+
+    code_files = ' '.join([main_file.as_posix()] + [
+        dep.path.as_posix() for dep in scope.dependencies
+        if dep.type == 'src'
+    ])
+    
+    include_dirs = ' '.join([STDLIB_PATH.absolute().as_posix()] + [
+        dep.path.as_posix() for dep in scope.dependencies
+        if dep.type == 'hpp_dir'
+    ])
+
+    cmake_code = f"""cmake_minimum_required(VERSION 3.10)
+project({cmake_name})
+# set(CMAKE_MESSAGE_LOG_LEVEL "WARNING")
+set(CMAKE_CXX_STANDARD 17)
+set(CMAKE_BUILD_TYPE "{build_type}")
+set(SOURCES {code_files})
+
+add_executable({cmake_name} ${{SOURCES}})
+
+target_include_directories({cmake_name} PRIVATE {include_dirs})
+
+if (MSVC)
+    target_compile_options({cmake_name} PRIVATE /W4)
+else()
+    target_compile_options({cmake_name} PRIVATE -Wall -Wextra -Wpedantic)
+endif()
+
+add_definitions(-D{scope.target.macro_name}=1)
+"""
+
+    for dep in scope.dependencies:
+        match dep.type:
+            case 'lib':
+                cmake_code += f"""
+target_link_libraries({cmake_name} PRIVATE {dep.path.as_posix()})
+"""
+            case 'dep':
+                cmake_code += f"""
+add_subdirectory({dep.path.as_posix()} ${{CMAKE_BINARY_DIR}}/{dep.path.name})
+"""
+
+    cmakelists = build_dir / 'CMakeLists.txt'
+    write_if_changed(cmakelists, cmake_code)
+    return cmakelists
+
+def compile_to_exe(scope: Scope, capture: bool = False):
+    code = compile_to_str(scope)
+
+    build_dir = scope.file.parent.absolute() / 'build'
+    cmake_name = scope.file.stem
+    with timings.phase('write build files'):
+        cmakelists = write_build_files(scope, code, build_dir, cmake_name)
+
+    kwargs = {'-S': cmakelists.parent.as_posix()}
+    ret_code = compile_cmake(build_dir, capture, **kwargs)
+    if ret_code.returncode != 0:
+        print(f'{Fore.RED}error: failed to build{Style.RESET_ALL}')
+        return
+    
+    exec_name = f'{cmake_name}.exe'
+    debug(f'Executable Name = {exec_name}')
+
+    exec_file = build_dir / exec_name
+    debug(f'Built Executable File = {exec_file}')
+
+    new_exec_path = scope.file.parent / exec_name
+    if new_exec_path.exists():
+        new_exec_path.unlink()
+    
+    # copied rather than moved, so Ninja finds its output up to date on the next build
+    copy2(exec_file, new_exec_path)
+
+    debug(f'Executable File = {new_exec_path}')
+    return new_exec_path
+
+def source_files(scope: Scope):
+    """The scope's file and every .cure module it was compiled from, including the ones used by
+the modules it uses."""
+
+    return list(dict.fromkeys(
+        [scope.file] + [dep.path for dep in scope.dependencies if dep.type == 'module']
+    ))
+
+def create_scope(file: Path, frontend: str = 'antlr', jobs: int | None = None,
+                 separate: bool = False):
+    """The root scope of a file. The local modules the file imports are compiled in `jobs`
+processes (by default one per CPU, see `modules.compile_modules`) before the file is analysed. With
+`separate`, each module is compiled to its own C++ source file (see `Scope.separate`)."""
+
+    scope = Scope(file, frontend=frontend, separate=separate)
+    scope.use(Position(0, 0), 'builtins')
+    # after builtins, so the worker processes find the standard library in the cache
+    compile_modules(file, frontend, jobs, separate)
+    return scope
+
+@dataclass
+class CompileResult:
+    file: Path
+    code: str | None = None
+    error: CompileError | None = None
+
+def compile_many(files: list[Path], frontend: str = 'antlr'):
+    """Compiles every file to C++ in this process, collecting each file's code or error instead of
+stopping at the first error. The standard library, the parser DFA and the cached IR are loaded
+once and reused for every file, and the local modules of a file are compiled in this process too."""
+
+    results: list[CompileResult] = []
+    for file in files:
+        try:
+            scope = create_scope(file, frontend, jobs=1)
+            results.append(CompileResult(file, code=compile_to_str(scope)))
+        except CompileError as e:
+            # the traceback would keep every scope of the failed compile alive
+            results.append(CompileResult(file, error=e.with_traceback(None)))
+    
+    return results
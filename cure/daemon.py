@@ -0,0 +1,178 @@
+from contextlib import redirect_stdout, redirect_stderr
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from os import environ, chdir
+from io import StringIO
+from time import time
+import socket
+import json
+
+from cure.log import debug, info
+
+
+SOCKET_PATH = Path(environ.get('CURE_DAEMON_SOCKET', Path.home() / '.cure' / 'daemon.sock'))
+# Windows builds of Python before 3.13 have no AF_UNIX, the daemon is not available there
+HAS_UNIX_SOCKETS = hasattr(socket, 'AF_UNIX')
+
+
+def request(message: dict, socket_path: Path | None = None):
+    """Sends one request to the daemon, returning its response, or None if no daemon is running."""
+
+    if socket_path is None:
+        socket_path = SOCKET_PATH
+
+    if not HAS_UNIX_SOCKETS or not socket_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path.as_posix())
+            sock.sendall(json.dumps(message).encode() + b'\n')
+            with sock.makefile('rb') as stream:
+                line = stream.readline()
+    except OSError as e: # a socket file left behind by a daemon that is no longer running
+        debug(f'Failed to connect to the daemon at {socket_path}: {e!r}')
+        return None
+
+    return json.loads(line) if line else None
+
+def inputs_hash(files: list[Path]):
+    hasher = sha256()
+    for file in files:
+        try:
+            hasher.update(file.read_bytes())
+        except OSError: # removed since the last compile
+            return None
+
+    return hasher.hexdigest()
+
+@dataclass
+class Check:
+    inputs: str | None
+    files: list[Path]
+    returncode: int
+    stdout: str
+    stderr: str
+
+@dataclass
+class Daemon:
+    """Serves `build` and `check` requests in one long running process, so the imports, the parser
+DFA, the standard library and the cached IR (see `cache.load`) stay warm between compiles and build
+directories stay configured. The result of `check` is kept until one of the files it was compiled
+from changes. The local modules of a file are compiled in the daemon's process unless the request
+asks for more `jobs` (see `modules.compile_modules`)."""
+
+    # by file, front end and working directory, which `use` resolves local modules from
+    checks: dict[tuple[Path, str, Path], Check] = field(default_factory=dict)
+    started: float = field(default_factory=time)
+    requests: int = 0
+    running: bool = True
+
+    def handle(self, message: dict):
+        self.requests += 1
+        action = message.get('action')
+        debug(f'Daemon request {message}')
+        match action:
+            case 'build' | 'check':
+                return self.compile(
+                    action, Path(message['file']), message.get('frontend', 'antlr'),
+                    Path(message.get('cwd', Path.cwd())), message.get('separate', False),
+                    message.get('jobs') or 1
+                )
+            case 'status':
+                return self.response(
+                    0, f'Daemon running for {time() - self.started:.0f}s, served '\
+                    f'{self.requests - 1} requests, {len(self.checks)} checked files\n'
+                )
+            case 'stop':
+                self.running = False
+                return self.response(0, 'Daemon stopped\n')
+            case _:
+                return self.response(1, stderr=f'Unknown daemon request \'{action}\'\n')
+
+    def response(self, returncode: int, stdout: str = '', stderr: str = ''):
+        return {'returncode': returncode, 'stdout': stdout, 'stderr': stderr}
+
+    def compile(self, action: str, file: Path, frontend: str, cwd: Path, separate: bool = False,
+                jobs: int = 1):
+        from cure.compiler import FRONTENDS
+
+        if frontend not in FRONTENDS:
+            return self.response(1, f'Usage: cure {action} <file> [--frontend=antlr|native]\n'\
+                                 f'Unknown frontend \'{frontend}\'\n')
+
+        if action == 'check':
+            check = self.checks.get((file, frontend, cwd))
+            if check is not None and check.inputs is not None and\
+                    check.inputs == inputs_hash(check.files):
+                info(f'{file} is unchanged since it was last checked')
+                return self.response(check.returncode, check.stdout, check.stderr)
+
+        stdout, stderr = StringIO(), StringIO()
+        chdir(cwd) # `use` resolves local modules from the working directory
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            returncode, files = self.run(action, file, frontend, separate, jobs)
+
+        if action == 'check':
+            self.checks[(file, frontend, cwd)] = Check(
+                inputs_hash(files), files, returncode, stdout.getvalue(), stderr.getvalue()
+            )
+
+        return self.response(returncode, stdout.getvalue(), stderr.getvalue())
+
+    def run(self, action: str, file: Path, frontend: str, separate: bool = False, jobs: int = 1):
+        from cure.compiler import create_scope, compile_to_str, compile_to_exe, source_files
+        from cure.diagnostics import CompileError
+
+        scope = None
+        try:
+            scope = create_scope(file, frontend, jobs, separate)
+            if action == 'check':
+                compile_to_str(scope)
+                print(f'No errors in {file.as_posix()}')
+                returncode = 0
+            else:
+                returncode = 0 if compile_to_exe(scope, capture=True) is not None else 1
+        except CompileError as e:
+            e.report()
+            returncode = 1
+
+        return returncode, [file] if scope is None else source_files(scope)
+
+def serve(socket_path: Path | None = None):
+    """Runs the daemon in this process until a `stop` request."""
+
+    if socket_path is None:
+        socket_path = SOCKET_PATH
+
+    from cure.compiler import get_frontend
+
+    get_frontend('antlr') # the compiler and ANTLR are imported once, before the first request
+
+    daemon = Daemon()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path.as_posix())
+        server.listen()
+        info(f'Daemon listening on {socket_path}')
+        print(f'Cure daemon listening on {socket_path.as_posix()}', flush=True)
+        try:
+            while daemon.running:
+                connection, _ = server.accept()
+                with connection, connection.makefile('rwb') as stream:
+                    line = stream.readline()
+                    if not line:
+                        continue
+
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except Exception as e: # a bug in the compiler must not stop the daemon
+                        info(f'Daemon request failed: {e!r}')
+                        response = daemon.response(1, stderr=f'Internal compiler error: {e!r}\n')
+
+                    stream.write(json.dumps(response).encode() + b'\n')
+                    stream.flush()
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,297 @@
+from importlib.metadata import version, PackageNotFoundError
+from hashlib import sha256
+from pathlib import Path
+import atexit
+
+from antlr4.PredictionContext import (
+    PredictionContext, SingletonPredictionContext, ArrayPredictionContext
+)
+from antlr4.atn.SemanticContext import SemanticContext, Predicate, PrecedencePredicate, AND, OR
+from antlr4.atn.ATNSimulator import ATNSimulator
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+from antlr4.atn.ATNConfig import ATNConfig
+from antlr4.dfa.DFA import DFA
+
+from cure.parser.CureParser import CureParser
+from cure.log import debug, info
+from cure import cache
+
+
+INTERP_FILE = Path(__file__).parent / 'parser' / 'Cure.interp'
+# bumped whenever the layout of the snapshot below changes
+SNAPSHOT_FORMAT = 1
+# references to singletons and to the ATN, which are not part of the snapshot
+NONE_ID = -1
+ERROR_ID = -1
+
+_loaded_states: int | None = None
+
+
+def snapshot_key():
+    """The snapshot is only valid for the grammar (and ATN) it was learned with and the runtime
+whose DFA classes it was taken from, so it is keyed by `Cure.interp` and the runtime version."""
+
+    try:
+        runtime_version = version('antlr4-python3-runtime')
+    except PackageNotFoundError:
+        runtime_version = 'unknown'
+
+    hasher = sha256(INTERP_FILE.read_bytes())
+    hasher.update(f'{runtime_version}:{SNAPSHOT_FORMAT}'.encode())
+    return hasher.hexdigest()
+
+def dfa_state_count(dfas: list[DFA]):
+    return sum(len(dfa.states) for dfa in dfas)
+
+
+class SnapshotWriter:
+    """Flattens the DFA of every decision into tuples of ints, so the snapshot holds no references
+to the ATN or to the runtime's singletons (which `pickle` would copy) and none of the hash codes the
+runtime caches (the hash of the empty prediction context is a string hash, which differs between
+processes)."""
+
+    def __init__(self):
+        self.contexts: list[tuple] = []
+        self.context_ids: dict[int, int] = {}
+        self.semantics: list[tuple] = []
+        self.semantic_ids: dict[int, int] = {}
+
+    def context(self, ctx: PredictionContext):
+        ctx_id = self.context_ids.get(id(ctx))
+        if ctx_id is not None:
+            return ctx_id
+
+        entry: tuple
+        if ctx is PredictionContext.EMPTY:
+            entry = ('empty',)
+        elif isinstance(ctx, SingletonPredictionContext):
+            parent = None if ctx.parentCtx is None else self.context(ctx.parentCtx)
+            entry = ('singleton', parent, ctx.returnState)
+        elif isinstance(ctx, ArrayPredictionContext):
+            parents = tuple(None if parent is None else self.context(parent)
+                            for parent in ctx.parents)
+            entry = ('array', parents, tuple(ctx.returnStates))
+        else:
+            raise TypeError(f'Unknown prediction context {type(ctx).__name__}')
+
+        ctx_id = len(self.contexts)
+        self.contexts.append(entry)
+        self.context_ids[id(ctx)] = ctx_id
+        return ctx_id
+
+    def semantic(self, semantic: SemanticContext):
+        if semantic is SemanticContext.NONE:
+            return NONE_ID
+
+        semantic_id = self.semantic_ids.get(id(semantic))
+        if semantic_id is not None:
+            return semantic_id
+
+        entry: tuple
+        if isinstance(semantic, Predicate):
+            entry = ('predicate', semantic.ruleIndex, semantic.predIndex, semantic.isCtxDependent)
+        elif isinstance(semantic, PrecedencePredicate):
+            entry = ('precedence', semantic.precedence)
+        elif isinstance(semantic, (AND, OR)):
+            kind = 'and' if isinstance(semantic, AND) else 'or'
+            entry = (kind, tuple(self.semantic(operand) for operand in semantic.opnds))
+        else:
+            raise TypeError(f'Unknown semantic context {type(semantic).__name__}')
+
+        semantic_id = len(self.semantics)
+        self.semantics.append(entry)
+        self.semantic_ids[id(semantic)] = semantic_id
+        return semantic_id
+
+    def configs(self, configs: ATNConfigSet):
+        return (
+            configs.fullCtx, configs.uniqueAlt,
+            None if configs.conflictingAlts is None else tuple(configs.conflictingAlts),
+            configs.hasSemanticContext, configs.dipsIntoOuterContext,
+            tuple(
+                (config.state.stateNumber, config.alt, self.context(config.context),
+                 self.semantic(config.semanticContext), config.reachesIntoOuterContext,
+                 config.precedenceFilterSuppressed)
+                for config in configs
+            )
+        )
+
+    def dfa(self, dfa: DFA):
+        states = list(dfa.states)
+        if dfa.precedenceDfa:
+            states.append(dfa.s0) # the precedence start state is not in `dfa.states`
+
+        state_ids = {id(state): i for i, state in enumerate(states)}
+        def edges(state: DFAState):
+            if state.edges is None:
+                return None
+
+            # the length is kept, the simulator only grows the edges of the precedence start state
+            return len(state.edges), tuple(
+                (symbol, ERROR_ID if target is ATNSimulator.ERROR else state_ids[id(target)])
+                for symbol, target in enumerate(state.edges) if target is not None
+            )
+
+        return (
+            dfa.decision, None if dfa.s0 is None else state_ids[id(dfa.s0)],
+            tuple(
+                (state.stateNumber, self.configs(state.configs), edges(state),
+                 state.isAcceptState, state.prediction, state.requiresFullContext,
+                 None if state.predicates is None else tuple(
+                     (self.semantic(pred.pred), pred.alt) for pred in state.predicates
+                 ))
+                for state in states
+            )
+        )
+
+    def snapshot(self, dfas: list[DFA]):
+        decisions = tuple(self.dfa(dfa) for dfa in dfas if len(dfa.states) > 0)
+        return tuple(self.contexts), tuple(self.semantics), decisions
+
+class SnapshotReader:
+    """Rebuilds the DFA written by `SnapshotWriter`, recomputing every hash code in this process."""
+
+    def __init__(self, parser_cls: type[CureParser], contexts: tuple, semantics: tuple):
+        self.atn = parser_cls.atn
+        self.contexts: list[PredictionContext] = []
+        for entry in contexts:
+            self.contexts.append(self.context(entry))
+
+        self.semantics: list[SemanticContext] = []
+        for entry in semantics:
+            self.semantics.append(self.semantic(entry))
+
+    def parent(self, ctx_id: int | None):
+        return None if ctx_id is None else self.contexts[ctx_id]
+
+    def context(self, entry: tuple):
+        # contexts are written parents first, so every parent has already been read
+        if entry[0] == 'empty':
+            return PredictionContext.EMPTY
+        elif entry[0] == 'singleton':
+            return SingletonPredictionContext(self.parent(entry[1]), entry[2])
+
+        return ArrayPredictionContext([self.parent(parent) for parent in entry[1]], list(entry[2]))
+
+    def semantic(self, entry: tuple):
+        if entry[0] == 'predicate':
+            return Predicate(entry[1], entry[2], entry[3])
+        elif entry[0] == 'precedence':
+            return PrecedencePredicate(entry[1])
+
+        # the constructors simplify their operands, which already happened before they were written
+        semantic = object.__new__(AND if entry[0] == 'and' else OR)
+        semantic.opnds = [self.get_semantic(operand) for operand in entry[1]]
+        return semantic
+
+    def get_semantic(self, semantic_id: int):
+        return SemanticContext.NONE if semantic_id == NONE_ID else self.semantics[semantic_id]
+
+    def configs(self, entry: tuple):
+        full_ctx, unique_alt, conflicting_alts, has_semantic, dips, configs = entry
+        config_set = ATNConfigSet(full_ctx)
+        for state_number, alt, ctx_id, semantic_id, outer_context, filter_suppressed in configs:
+            config = ATNConfig.__new__(ATNConfig) # the constructor's defaulting is not needed
+            config.state = self.atn.states[state_number]
+            config.alt = alt
+            config.context = self.contexts[ctx_id]
+            config.semanticContext = self.get_semantic(semantic_id)
+            config.reachesIntoOuterContext = outer_context
+            config.precedenceFilterSuppressed = filter_suppressed
+            config_set.configs.append(config)
+
+        config_set.uniqueAlt = unique_alt
+        config_set.conflictingAlts = None if conflicting_alts is None else set(conflicting_alts)
+        config_set.hasSemanticContext = has_semantic
+        config_set.dipsIntoOuterContext = dips
+        config_set.setReadonly(True)
+        return config_set
+
+    def dfa(self, entry: tuple):
+        decision, s0_id, state_entries = entry
+        dfa = DFA(self.atn.decisionToState[decision], decision)
+        states: list[DFAState] = []
+        for state_number, configs, _, is_accept, prediction, full_ctx, predicates in state_entries:
+            state = DFAState(state_number, self.configs(configs))
+            state.isAcceptState = is_accept
+            state.prediction = prediction
+            state.requiresFullContext = full_ctx
+            if predicates is not None:
+                state.predicates = [
+                    PredPrediction(self.get_semantic(pred), alt) for pred, alt in predicates
+                ]
+
+            states.append(state)
+
+        for state, (_, _, edges, *_) in zip(states, state_entries):
+            if edges is None:
+                continue
+
+            length, targets = edges
+            state.edges = [None] * length
+            for symbol, target_id in targets:
+                state.edges[symbol] = ATNSimulator.ERROR if target_id == ERROR_ID else\
+                    states[target_id]
+
+        if dfa.precedenceDfa:
+            # keep the fresh precedence start state, only its edges were learned
+            dfa.s0.edges = states.pop().edges
+        elif s0_id is not None:
+            dfa.s0 = states[s0_id]
+
+        for state in states:
+            dfa.states[state] = state
+
+        return dfa
+
+def take_snapshot(dfas: list[DFA]):
+    return SnapshotWriter().snapshot(dfas)
+
+def restore_snapshot(parser_cls: type[CureParser], snapshot: tuple):
+    contexts, semantics, decisions = snapshot
+    reader = SnapshotReader(parser_cls, contexts, semantics)
+    dfas = [DFA(state, i) for i, state in enumerate(parser_cls.atn.decisionToState)]
+    for entry in decisions:
+        dfa = reader.dfa(entry)
+        dfas[dfa.decision] = dfa
+
+    return dfas
+
+def load_dfa():
+    """Loads the DFA learned by earlier compiler runs into `CureParser` (once per process) and saves
+it again when the process exits if parsing taught it new states, so short-lived compiler
+invocations start with a warm parser instead of relearning every decision."""
+
+    global _loaded_states
+    if _loaded_states is not None:
+        return
+
+    _loaded_states = dfa_state_count(CureParser.decisionsToDFA)
+    atexit.register(save_dfa)
+    if _loaded_states > 0: # something already parsed in this process, keep what it learned
+        return
+
+    snapshot = cache.load('dfa', INTERP_FILE, snapshot_key())
+    if snapshot is None:
+        return
+
+    try:
+        dfas = restore_snapshot(CureParser, snapshot)
+    except Exception as e: # an unreadable snapshot is a miss, the DFA is simply relearned
+        info(f'Failed to restore the parser DFA: {e!r}')
+        return
+
+    # replaced in place, every parser's prediction simulator shares this list
+    CureParser.decisionsToDFA[:] = dfas
+    _loaded_states = dfa_state_count(dfas)
+    info(f'Loaded {_loaded_states} parser DFA states from the cache')
+
+def save_dfa():
+    states = dfa_state_count(CureParser.decisionsToDFA)
+    if _loaded_states is not None and states <= _loaded_states:
+        debug('The parser DFA did not grow, not saving it')
+        return
+
+    cache.store('dfa', INTERP_FILE, snapshot_key(), take_snapshot(CureParser.decisionsToDFA))
+    info(f'Saved {states} parser DFA states to the cache')
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+import sys
+
+from colorama import Fore, Style
+
+
+@dataclass(eq=False)
+class CompileError(Exception):
+    """An error in a source file, raised by `Position.comptime_error`. It is only reported and
+turned into an exit code by the command line, so tools that compile many files in one process
+(see `compiler.compile_many`) can carry on with the next file."""
+
+    message: str
+    file: Path
+    line: int
+    column: int
+    source_line: str
+
+    def __post_init__(self):
+        super().__init__(self.message)
+
+    def __reduce__(self):
+        return CompileError, (self.message, self.file, self.line, self.column, self.source_line)
+
+    def __str__(self):
+        return f'{self.file.as_posix()}:{self.line}:{self.column}: {self.message}'
+
+    def report(self, file: TextIO | None = None):
+        if file is None: # looked up when reporting, the daemon redirects stderr to its client
+            file = sys.stderr
+        
+        print(self.source_line, file=file)
+        print(' ' * self.column + '^', file=file)
+        print(f'{Style.BRIGHT}{Fore.RED}error: {self.message}{Style.RESET_ALL}', file=file)
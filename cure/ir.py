@@ -1,13 +1,18 @@
-from dataclasses import dataclass, field, fields
-from sys import exit as sys_exit, stderr
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
 from tempfile import NamedTemporaryFile
-from logging import debug, info, error
 from abc import ABC, abstractmethod
-from typing import Union, Any, cast
+from typing import Union, Any, Iterable, NoReturn, cast, get_type_hints, get_args, get_origin
 from pathlib import Path
-
-from colorama import Fore, Style
-
+from weakref import WeakValueDictionary
+from types import UnionType
+
+from cure.manifest import STDLIB_PATH, stdlib_library
+from cure.diagnostics import CompileError
+from cure.log import debug, info, error
+from cure.source import sources
+from cure.timings import timings
+from cure import cache
 from cure.target import Target
 
 
@@ -26,30 +31,46 @@ RESERVED_CPP_KEYWORDS = {'alignas', 'alignof', 'and', 'and_eq', 'asm', 'atomic_c
                          'struct', 'switch', 'synchronized', 'template', 'this', 'thread_local',
                          'throw', 'try', 'typedef', 'typeid', 'typename', 'union', 'unsigned',
                          'using', 'virtual', 'void', 'volatile', 'wchar_t', 'xor', 'xor_eq'}
-STDLIB_PATH = Path(__file__).parent / 'stdlib'
 op_map = {'+': 'add', '-': 'sub', '*': 'mul', '/': 'div', '%': 'mod', '==': 'eq', '!=': 'neq',
           '<': 'lt', '>': 'gt', '<=': 'lte', '>=': 'gte', '&&': 'and', '||': 'or', '!': 'not'}
 
-@dataclass
+@dataclass(frozen=True)
 class Dependency:
     path: Path
     type: str
 
-@dataclass
-class Position:
-    line: int
-    column: int
-
-    def comptime_error(self, scope: 'Scope', message: str):
-        src = scope.src
-        if self.line > len(src.splitlines()):
-            self.line = len(src.splitlines())
-        
-        print(src.splitlines()[self.line - 1], file=stderr)
-        print(' ' * self.column + '^', file=stderr)
-        print(f'{Style.BRIGHT}{Fore.RED}error: {message}{Style.RESET_ALL}', file=stderr)
+# the bits of a packed `Position` that hold the column, lines longer than this are not supported
+COLUMN_BITS = 24
+COLUMN_MASK = (1 << COLUMN_BITS) - 1
+
+class Position(int):
+    """A line and column packed into one int, so the position every node holds costs a small int
+instead of an object with a `__dict__`."""
+
+    __slots__ = ()
+
+    def __new__(cls, line: int, column: int):
+        return super().__new__(cls, (line << COLUMN_BITS) | column)
+    
+    def __getnewargs__(self): # type: ignore
+        return self.line, self.column
+    
+    @property
+    def line(self):
+        return int(self) >> COLUMN_BITS
+    
+    @property
+    def column(self):
+        return int(self) & COLUMN_MASK
+    
+    def __repr__(self):
+        return f'Position(line={self.line}, column={self.column})'
+    
+    def comptime_error(self, scope: 'Scope', message: str) -> NoReturn:
+        source = scope.source
+        line = min(self.line, source.line_count)
         error(message)
-        sys_exit(1)
+        raise CompileError(message, scope.file, line, self.column, source.line(line))
     
     @staticmethod
     def zero():
@@ -64,55 +85,157 @@ class Symbol:
 
 @dataclass
 class SymbolTable:
-    symbols: dict[str, Symbol] = field(default_factory=dict)
+    """The symbols defined in one scope. Lookups fall through to the parent scope's table, so a
+child scope only stores its own definitions (which shadow the parent's) instead of a copy of every
+symbol. A removed symbol that is still defined in a parent is kept as None, which hides it."""
+
+    symbols: dict[str, Symbol | None] = field(default_factory=dict)
+    parent: Union['SymbolTable', None] = None
 
     def add(self, symbol: Symbol, name: str | None = None):
         self.symbols[name or symbol.name] = symbol
     
     def get(self, name: str):
-        return self.symbols.get(name)
+        table: SymbolTable | None = self
+        while table is not None:
+            if name in table.symbols:
+                return table.symbols[name]
+            
+            table = table.parent
+        
+        return None
     
     def has(self, name: str):
-        return name in self.symbols
+        return self.get(name) is not None
     
     def remove(self, name: str):
-        if self.has(name):
+        if not self.has(name):
+            return False
+        
+        if self.parent is not None and self.parent.has(name):
+            self.symbols[name] = None
+        else:
             self.symbols.pop(name)
-            return True
         
-        return False
+        return True
+    
+    def flatten(self) -> dict[str, Symbol]:
+        if self.parent is None:
+            return cast(dict[str, Symbol], self.symbols)
+        
+        symbols = self.parent.flatten() | self.symbols
+        return {name: symbol for name, symbol in symbols.items() if symbol is not None}
     
     def merge(self, other: 'SymbolTable'):
-        self.symbols.update(other.symbols)
+        self.symbols.update(other.flatten())
     
-    def clone(self):
-        return SymbolTable(self.symbols.copy())
+    def child(self):
+        return SymbolTable(parent=self)
 
 @dataclass
 class TypeMap:
-    types: dict[str, 'Type'] = field(default_factory=dict)
+    """The types of one scope, looked up through the parent scope's map like `SymbolTable`."""
+
+    types: dict[str, Union['Type', None]] = field(default_factory=dict)
+    parent: Union['TypeMap', None] = None
     
     def add(self, type: 'Type'):
-        self.types[type.type] = type
+        self.types[type.type] = type.intern()
     
     def get(self, display: str):
-        return self.types.get(display)
+        type_map: TypeMap | None = self
+        while type_map is not None:
+            if display in type_map.types:
+                return type_map.types[display]
+            
+            type_map = type_map.parent
+        
+        return None
     
     def has(self, display: str):
-        return display in self.types
+        return self.get(display) is not None
     
     def remove(self, display: str):
-        if self.has(display):
+        if not self.has(display):
+            return False
+        
+        if self.parent is not None and self.parent.has(display):
+            self.types[display] = None
+        else:
             self.types.pop(display)
-            return True
         
-        return False
+        return True
+    
+    def flatten(self) -> dict[str, 'Type']:
+        if self.parent is None:
+            return cast(dict[str, 'Type'], self.types)
+        
+        types = self.parent.flatten() | self.types
+        return {display: typ for display, typ in types.items() if typ is not None}
     
     def merge(self, other: 'TypeMap'):
-        self.types.update(other.types)
+        self.types.update(other.flatten())
     
-    def clone(self):
-        return TypeMap(self.types.copy())
+    def child(self):
+        return TypeMap(parent=self)
+
+@dataclass
+class ModuleInterface:
+    """Everything an importing scope needs from a compiled module."""
+
+    symbol_table: SymbolTable
+    type_map: TypeMap
+    dependencies: list[Dependency]
+    code: str
+    # content hash of every other file the module was compiled from, the modules it uses and their
+    # dependencies.txt files
+    sources: dict[Path, str] = field(default_factory=dict)
+    # the declarations of the module's functions and variables, the header of a module compiled to
+    # its own translation unit (see `Scope.separate`)
+    declarations: str = ''
+
+    def is_current(self):
+        """Whether the files the module was compiled from are unchanged and the headers generated for
+the modules it uses (and their translation units) still exist."""
+
+        for file, key in self.sources.items():
+            if not file.exists() or cache.content_hash(file) != key:
+                return False
+        
+        return all(
+            dep.path.exists() for dep in self.dependencies
+            if dep.type in ('hpp', 'src') and dep.path.is_absolute() # standard library headers are relative
+        )
+
+def interface_file(file: Path):
+    """Where the interface of a local module is stored, in the build directory next to it."""
+
+    return file.parent.absolute() / 'build' / 'modules' / f'{file.stem}.interface'
+
+def interface_key(file: Path, separate: bool = False):
+    """The key of a local module's interface file. As `use` resolves paths from the working
+directory it is part of the key, and so is whether the module was compiled to its own translation
+unit, as the interface then lists the translation units of the modules it uses."""
+
+    return cache.content_hash(file, Path.cwd().as_posix(), 'separate' if separate else '')
+
+def translation_unit(file: Path):
+    """The C++ file a local module is compiled to when it is compiled separately (see
+`Scope.separate`), next to its interface file."""
+
+    return interface_file(file).with_suffix('.cpp')
+
+@dataclass
+class ClassInstances:
+    """The generic class instantiations of a compilation (see `Class.define`) by class type, with the
+symbols and types each one added to the scope it was first defined in. A scope that does not see an
+instantiation, including the scope of another module, gets these added again instead of defining the
+class's methods again. Every use of an instantiation gets the same class from `classes`."""
+
+    instances: dict['Type', tuple[SymbolTable, TypeMap]] = field(default_factory=dict)
+    classes: dict['Type', 'Class'] = field(default_factory=dict)
+    defined: int = 0
+    reused: int = 0
 
 @dataclass
 class Scope:
@@ -125,112 +248,184 @@ class Scope:
     prepended_nodes: list['Node'] = field(default_factory=list)
     target: Target = Target.get_current()
     in_loop: bool = False
+    frontend: str = 'antlr'
+    # see `Call.resolve`, shared by all scopes of a compilation, including the scopes modules are
+    # compiled in, whose calls resolve to the same functions of the modules they share
+    overload_indexes: dict[int, 'OverloadIndex'] = field(default_factory=dict)
+    resolved_calls: dict[tuple, tuple['Function', 'Function', list[int | None]]] = field(
+        default_factory=dict
+    )
+    class_instances: 'ClassInstances' = field(default_factory=lambda: ClassInstances())
+    # the modules used while compiling the file by canonical path, shared with the scopes the
+    # modules are compiled in, so a module used by several modules is only compiled once
+    modules: dict[Path, 'ModuleInterface'] = field(default_factory=dict)
+    # whether every local module is compiled to its own translation unit, included through a header
+    # of its declarations, instead of to a header with all of its code
+    separate: bool = False
     
     @property
     def unique_name(self):
         self._unique_name_idx += 1
         return f'_{self._unique_name_idx}'
+    
+    @property
+    def src(self):
+        return self.source.text
 
     def __post_init__(self):
-        self.src = self.file.read_text()
+        # child scopes share their parent's source instead of reading the file again
+        if self.parent is not None and self.parent.file == self.file:
+            self.source = self.parent.source
+        else:
+            self.source = sources.get(self.file)
+        
         if self.parent is not None:
             self._unique_name_idx = self.parent._unique_name_idx + 1
 
-            self.symbol_table = self.parent.symbol_table.clone()
-            self.type_map = self.parent.type_map.clone()
+            self.symbol_table = self.parent.symbol_table.child()
+            self.type_map = self.parent.type_map.child()
 
             self.in_loop = self.parent.in_loop
+            self.frontend = self.parent.frontend
+            self.overload_indexes = self.parent.overload_indexes
+            self.resolved_calls = self.parent.resolved_calls
+            self.class_instances = self.parent.class_instances
+            self.modules = self.parent.modules
+            self.separate = self.parent.separate
         else:
             self._unique_name_idx = -1
             
-            self.type_map.add(PrimitiveType(Position.zero(), 'int'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'float'))
-            self.type_map.add(ClassType(Position.zero(), 'string'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'bool'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'nil'))
-
-            self.type_map.add(PrimitiveType(Position.zero(), 'any'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'function'))
-
-            self.type_map.add(PrimitiveType(Position.zero(), 'Math'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'System'))
-            self.type_map.add(PrimitiveType(Position.zero(), 'Random'))
+            for typ in BUILTIN_TYPES:
+                self.type_map.add(typ)
     
     def use(self, pos: Position, name: str):
-        file = Path(name).resolve()
-        debug(f'Using {name} at Path {file}')
-        if file.exists():
-            self.use_local(file)
-            return
-        
-        stdlib_path = STDLIB_PATH / name
-        debug(f'{file} doesn\'t exist, checking if {name} is part of the standard library at '\
-              f'{stdlib_path}')
-        if not stdlib_path.is_dir():
-            pos.comptime_error(self, f'unknown library \'{name}\'')
-        
-        for header in stdlib_path.glob('*.hpp'):
-            debug(f'Found header file {header}, relative path = {header.relative_to(STDLIB_PATH)}')
-            self.dependencies.append(Dependency(header.relative_to(STDLIB_PATH), 'hpp'))
-        
-        for cfile in stdlib_path.glob('*.cpp'):
-            debug(f'Found source file {cfile}')
-            self.dependencies.append(Dependency(cfile, 'src'))
-        
-        for cure in stdlib_path.glob('*.cure'):
-            debug(f'Found cure file {cure}')
-            self.use_local(cure)
-        
-        if (deps := stdlib_path / 'dependencies.txt').exists():
-            self.read_dependencies(deps)
-    
-    def read_dependencies(self, file: Path):
-        lines = file.read_text().splitlines()
-        for line in lines:
-            if line.startswith('#'):
-                continue
-            elif line.startswith('sources = '):
-                line = line.removeprefix('sources = ')
-                for source in line.split(','):
-                    self.dependencies.append(Dependency(file.parent / Path(source.strip()), 'src'))
-            elif line.startswith('include_dirs = '):
-                line = line.removeprefix('include_dirs = ')
-                for directory in line.split(','):
-                    self.dependencies.append(Dependency(
-                        file.parent / Path(directory.strip()), 'hpp_dir'
-                    ))
-            elif line.startswith('deps = '):
-                line = line.removeprefix('deps = ')
-                for dependency in line.split(','):
-                    self.dependencies.append(Dependency(file.parent / Path(dependency.strip()), 'dep'))
-            elif line.startswith('libs = '):
-                line = line.removeprefix('libs = ')
-                for library in line.split(','):
-                    self.dependencies.append(Dependency(Path(library.strip()), 'lib'))
+        with timings.phase(f'use {name}'):
+            file = Path(name).resolve()
+            debug(f'Using {name} at Path {file}')
+            if file.exists():
+                self.use_local(file)
+                return
+            
+            stdlib_path = STDLIB_PATH / name
+            debug(f'{file} doesn\'t exist, checking if {name} is part of the standard library at '\
+                  f'{stdlib_path}')
+            library = stdlib_library(name)
+            if library is None:
+                pos.comptime_error(self, f'unknown library \'{name}\'')
+            
+            # headers are included relative to the standard library, see `write_build_files`
+            self.add_dependencies(
+                Dependency(Path(name) / header, 'hpp') for header in library['headers']
+            )
+            self.add_dependencies(
+                Dependency(stdlib_path / source, 'src') for source in library['sources']
+            )
+            for module in library['modules']:
+                self.use_local(stdlib_path / module)
+            
+            if library['dependencies_file'] is not None:
+                self.add_dependencies([
+                    Dependency(stdlib_path / library['dependencies_file'], 'manifest')
+                ])
+                self.add_dependencies(
+                    Dependency(Path(value) if dependency_type == 'lib' else stdlib_path / value,
+                               dependency_type)
+                    for dependency_type, value in library['dependencies']
+                )
     
-    def use_local(self, file: Path):
-        from cure import compile_to_str
+    def add_dependencies(self, dependencies: Iterable[Dependency]):
+        """Adds the dependencies the scope does not have yet, in order."""
 
-        info(f'{file} is a local file')
-        scope = Scope(file)
-        code = compile_to_str(scope)
-        debug(f'Compiled {file} to string')
-        if not file.stem.endswith('_wrapper'): # wrapper files do not need .hpp files generated
-            header_file = file.with_suffix('.hpp').with_stem(f'{file.stem}_header')
-            header_file.write_text(f"""#pragma once
-{code}""")
+        known = set(self.dependencies)
+        for dependency in dependencies:
+            if dependency not in known:
+                known.add(dependency)
+                self.dependencies.append(dependency)
+    
+    def use_local(self, file: Path):
+        from cure.compiler import write_if_changed
+
+        with timings.phase(f'use_local {file.name}'):
+            info(f'{file} is a local file')
+            # the .cure files a file was compiled from, see `compiler.source_files`. Added before the
+            # module is compiled, so a module that fails to compile is one of them too
+            self.add_dependencies([Dependency(file, 'module')])
+            module = self.modules.get(file.resolve())
+            is_used = module is not None
+            if module is None:
+                module = self.modules[file.resolve()] = self.compile_module(file)
+            else:
+                info(f'{file} was already used while compiling {self.file}')
             
-            self.dependencies.append(Dependency(header_file, 'hpp'))
-            info(f'Compiled {file} to header file {header_file}')
+            if not file.stem.endswith('_wrapper'): # wrapper files do not need .hpp files generated
+                header_file = file.with_suffix('.hpp').with_stem(f'{file.stem}_header')
+                # only written when it changes, its modification time makes Ninja rebuild the C++
+                # files including it
+                if not is_used and write_if_changed(header_file, f"""#pragma once
+{module.declarations if self.separate else module.code}"""):
+                    info(f'Compiled {file} to header file {header_file}')
+                
+                self.add_dependencies([Dependency(header_file, 'hpp')])
+                if self.separate:
+                    # a source of its own, so a change to the module only recompiles this file and
+                    # the modules are compiled in parallel
+                    source_file = translation_unit(file)
+                    source = f"""#include "{header_file.as_posix()}"
+{module.code}"""
+                    if not is_used and write_if_changed(source_file, source):
+                        info(f'Compiled {file} to source file {source_file}')
+                    
+                    self.add_dependencies([Dependency(source_file, 'src')])
+            else:
+                info(f'{file} is a wrapper file, no .hpp file generated')
+            
+            self.merge(module)
+    
+    def compile_module(self, file: Path):
+        from cure.compiler import compile_program
+
+        # standard library modules only change with the compiler, so their analysed symbols are
+        # cached on disk instead of being re-parsed and re-analysed on every compile. The interfaces
+        # of local modules are stored in their build directory and only used while the files they
+        # were compiled from (the module and the modules it uses) are unchanged
+        if file.is_relative_to(STDLIB_PATH):
+            key = cache.content_hash(file)
+            module = cache.load('stdlib', file, key)
+            if module is not None:
+                info(f'Loaded {file} from the stdlib cache')
+                return cast(ModuleInterface, module)
         else:
-            info(f'{file} is a wrapper file, no .hpp file generated')
+            key = interface_key(file, self.separate)
+            module = cache.load_file(interface_file(file), key)
+            if module is not None and cast(ModuleInterface, module).is_current():
+                info(f'Loaded the interface of {file} from {interface_file(file)}')
+                return cast(ModuleInterface, module)
+        
+        scope = Scope(
+            file, frontend=self.frontend, overload_indexes=self.overload_indexes,
+            resolved_calls=self.resolved_calls, class_instances=self.class_instances,
+            modules=self.modules, separate=self.separate
+        )
+        program, code = compile_program(scope)
+        debug(f'Compiled {file} to string')
+
+        module = ModuleInterface(
+            scope.symbol_table, scope.type_map, scope.dependencies, code, {
+                dep.path: cache.content_hash(dep.path) for dep in scope.dependencies
+                if dep.type in ('module', 'manifest')
+            }, program.declarations(scope) if self.separate else ''
+        )
+        if file.is_relative_to(STDLIB_PATH):
+            cache.store('stdlib', file, key, module)
+        else:
+            cache.store_file(interface_file(file), key, module)
         
-        self.merge(scope)
-    
-    def merge(self, other: 'Scope'):
+        return module
+        
+    def merge(self, other: Union['Scope', 'ModuleInterface']):
         self.symbol_table.merge(other.symbol_table)
         self.type_map.merge(other.type_map)
-        self.dependencies.extend(other.dependencies)
+        self.add_dependencies(other.dependencies)
 
     def make_child(self) -> 'Scope':
         child = Scope(file=self.file, parent=self)
@@ -245,21 +440,53 @@ class Scope:
         return cast(Class, symbol.value).define(self, generic_types)
 
 
-@dataclass(unsafe_hash=True)
+def is_node_hint(hint: Any):
+    return isinstance(hint, type) and issubclass(hint, Node)
+
+# by node class, see `child_fields`
+node_child_fields: dict[type['Node'], tuple[tuple[str, bool], ...]] = {}
+
+def child_fields(cls: type['Node']):
+    """The fields of a node class that hold child nodes, as (name, is_list) pairs. Computed once
+per class from the field annotations, so `Node.children` and the passes in `cure.visitor` do not
+look the fields up and check the type of every value on each visit."""
+
+    known = node_child_fields.get(cls)
+    if known is not None:
+        return known
+    
+    hints = get_type_hints(cls)
+    child_fields: list[tuple[str, bool]] = []
+    for f in fields(cls):
+        hint = hints[f.name]
+        for option in get_args(hint) if isinstance(hint, UnionType) else (hint,):
+            if get_origin(option) is list and is_node_hint(get_args(option)[0]):
+                child_fields.append((f.name, True))
+                break
+            
+            if is_node_hint(option):
+                child_fields.append((f.name, False))
+                break
+    
+    known = node_child_fields[cls] = tuple(child_fields)
+    return known
+
+@dataclass(unsafe_hash=True, slots=True)
 class Node(ABC):
     pos: Position = field(compare=False, repr=False, hash=False)
     type: 'Type'
 
     @property
     def children(self):
-        children = []
-        for f in fields(self):
-            child = getattr(self, f.name)
-            if isinstance(child, list):
-                for c in child:
-                    if isinstance(c, Node):
-                        children.append(c)
-            elif isinstance(child, Node):
+        children: list[Node] = []
+        for name, is_list in child_fields(self.__class__):
+            child = getattr(self, name)
+            if child is None:
+                continue
+            
+            if is_list:
+                children.extend(child)
+            else:
                 children.append(child)
         
         return children
@@ -268,43 +495,150 @@ class Node(ABC):
     def codegen(self, scope: Scope) -> str:
         ...
     
+    def declare(self, scope: Scope) -> str:
+        """The declaration of a top-level node in the header of a module compiled to its own
+translation unit (see `Scope.separate`), empty for nodes other files cannot refer to."""
+
+        return ''
+    
     def analyse(self, scope: Scope) -> 'Node':
+        """Resolves the node's types and callees. The node is annotated in place and returned, a new
+node is only created when it is lowered to another kind of node (e.g. an `Operation` to a `Call`),
+so analysis consumes the IR it is given (see `compiler.parse`, which caches the IR before)."""
+
         return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Program(Node):
     nodes: list[Node] = field(default_factory=list)
 
-    def codegen(self, scope):
-        code = '\n'.join(f'{node.codegen(scope)};' for node in self.nodes)
-        includes = '\n'.join(
+    def includes(self, scope: Scope):
+        return '\n'.join(
             f'#include "{dep.path.as_posix()}"' for dep in scope.dependencies
             if dep.type == 'hpp'
         )
 
-        return f"""{includes}
+    def codegen(self, scope):
+        code = '\n'.join(f'{node.codegen(scope)};' for node in self.nodes)
+        return f"""{self.includes(scope)}
 
 {code}
+"""
+    
+    def declarations(self, scope: Scope):
+        declarations = '\n'.join(
+            f'{declaration};' for node in self.nodes if (declaration := node.declare(scope))
+        )
+        return f"""{self.includes(scope)}
+
+{declarations}
 """
     
     def analyse(self, scope):
-        return Program(self.pos, self.type.analyse(scope), [node.analyse(scope) for node in self.nodes])
+        self.type = self.type.analyse(scope)
+        self.nodes = [node.analyse(scope) for node in self.nodes]
+        return self
+
+class TypeKey:
+    """What identifies a type (see `Type.key`). Keys are interned by their parts, so equal keys are
+one object and are compared and hashed by identity."""
+
+    __slots__ = ('parts', '__weakref__')
+
+    def __init__(self, parts: tuple):
+        self.parts = parts
+
+    def __repr__(self):
+        return f'TypeKey{self.parts!r}'
+
+# every distinct analysed type and every distinct type key, see `Type.intern` and `type_key`. A type
+# or key is only kept while it is used, so a long running process (see `daemon`) does not keep the
+# types of every file it compiled
+interned_types: 'WeakValueDictionary[tuple, Type]' = WeakValueDictionary()
+interned_keys: 'WeakValueDictionary[tuple, TypeKey]' = WeakValueDictionary()
 
-@dataclass(unsafe_hash=True)
+def type_key(*parts: Any):
+    key = interned_keys.get(parts)
+    if key is None:
+        key = interned_keys[parts] = TypeKey(parts)
+    
+    return key
+
+def unpickle_type(cls: type['Type'], state: dict[str, Any]):
+    typ = cls.__new__(cls)
+    for name, value in state.items():
+        setattr(typ, name, value)
+    
+    return typ.intern()
+
+@dataclass(eq=False)
 class Type(Node):
+    """Types are compared and hashed by their `key`. Keys are interned, so two types are equal when
+their keys are the same object. The types of analysed code are interned as well, each distinct type
+is one object shared between scopes and files and must not be modified."""
+
     type: str # type: ignore
 
-    def object_type(self, scope: Scope):
+    @cached_property
+    def key(self) -> TypeKey:
+        """What identifies the type, the type's name and the keys of the types it is made of."""
+
+        return type_key(self.__class__.__name__, self.type)
+
+    def intern(self):
+        return interned_types.setdefault((self.__class__, self.type, self.key), self)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        
+        try:
+            return self.key is other.key
+        except AttributeError: # not a type, isinstance is slow as Node is an ABC
+            return NotImplemented
+    
+    def __ne__(self, other):
+        # not derived from __eq__, `!=` is as common in analysis (`cond.type != bool_type`)
+        if self is other:
+            return False
+        
+        try:
+            return self.key is not other.key
+        except AttributeError:
+            return NotImplemented
+
+    def __hash__(self):
+        return id(self.key)
+
+    def __reduce__(self):
+        # interned again when unpickled, like the standard library's types loaded from the cache,
+        # the cached properties are computed again
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        return unpickle_type, (self.__class__, state)
+
+    @cached_property
+    def spelling(self):
+        """The C++ type name, computed once as types do not change."""
+
+        return self.type
+
+    @cached_property
+    def mangled(self):
+        """See `object_type`."""
+
+        return self.spelling
+
+    def object_type(self, _: Scope):
         """The type that will be used in mangled function names and to access methods and properties
-in the symbol table. Defaults to the C++ type name (by calling `.codegen`)."""
+in the symbol table. Defaults to the C++ type name (see `.codegen`)."""
 
-        return self.codegen(scope)
+        return self.mangled
 
     def __str__(self):
         return self.type
 
     def codegen(self, _):
-        return self.type
+        return self.spelling
 
     def analyse(self, scope: Scope):
         typ = scope.type_map.get(self.type)
@@ -313,60 +647,73 @@ in the symbol table. Defaults to the C++ type name (by calling `.codegen`)."""
         
         return typ
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class PrimitiveType(Type):
     pass
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class ArrayType(Type):
     element_type: Type
 
-    def codegen(self, scope):
-        return f'array<{self.element_type.codegen(scope)}>'
+    @cached_property
+    def key(self):
+        return type_key('ArrayType', self.type, self.element_type.key)
+
+    @cached_property
+    def spelling(self):
+        return f'array<{self.element_type.spelling}>'
     
     def analyse(self, scope):
         elem_type = self.element_type.analyse(scope)
         array_cls = scope.define_class(self.pos, 'array', [elem_type])
         return array_cls.type
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class ClassType(Type):
     generic_types: list[Type] = field(default_factory=list)
 
-    def codegen(self, scope):
+    @cached_property
+    def key(self):
+        return type_key('ClassType', self.type, *(typ.key for typ in self.generic_types))
+
+    @cached_property
+    def spelling(self):
         if self.generic_types:
-            generic_types_str = ', '.join(typ.codegen(scope) for typ in self.generic_types)
+            generic_types_str = ', '.join(typ.spelling for typ in self.generic_types)
             return f'{self.type}<{generic_types_str}>'
     
         return self.type
     
     def analyse(self, scope):
-        return ClassType(self.pos, self.type, [typ.analyse(scope) for typ in self.generic_types])
+        return ClassType(
+            self.pos, self.type, [typ.analyse(scope) for typ in self.generic_types]
+        ).intern()
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class ReferenceType(Type):
     type: str # type: ignore
     inner: Type
 
-    def __eq__(self, other):
-        if not isinstance(other, Type):
-            return False
-        
-        return self.inner == other
+    @cached_property
+    def key(self):
+        # a reference is the same type as the type it refers to
+        return self.inner.key
 
-    def object_type(self, scope):
-        return self.inner.object_type(scope)
+    @cached_property
+    def mangled(self):
+        return self.inner.mangled
 
-    def codegen(self, scope):
-        return f'{self.inner.codegen(scope)}&'
+    @cached_property
+    def spelling(self):
+        return f'{self.inner.spelling}&'
     
     def analyse(self, scope):
         return ReferenceType(
             self.pos, self.type if self.type.endswith('&') else f'{self.type}&',
             self.inner.analyse(scope)
-        )
+        ).intern()
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class FunctionType(Type):
     return_type: Type
     param_types: list[Type] = field(default_factory=list)
@@ -377,42 +724,43 @@ class FunctionType(Type):
         return FunctionType(
             pos, f'({param_types_str}) -> {return_type}',
             return_type, param_types
-        )
+        ).intern()
 
-    def __eq__(self, other):
-        if not isinstance(other, FunctionType):
-            return False
-        
-        return self.return_type == other.return_type and self.param_types == other.param_types
+    @cached_property
+    def key(self):
+        return type_key(
+            'FunctionType', self.return_type.key, *(typ.key for typ in self.param_types)
+        )
 
-    def object_type(self, _):
+    @cached_property
+    def mangled(self):
         return 'function'
 
-    def codegen(self, scope):
-        param_types_str = ', '.join(typ.codegen(scope) for typ in self.param_types)
-        return f'std::function<{self.return_type.codegen(scope)}({param_types_str})>'
+    @cached_property
+    def spelling(self):
+        param_types_str = ', '.join(typ.spelling for typ in self.param_types)
+        return f'std::function<{self.return_type.spelling}({param_types_str})>'
     
     def analyse(self, scope):
         param_types = [typ.analyse(scope) for typ in self.param_types]
         return_type = self.return_type.analyse(scope)
         return FunctionType.new(self.pos, return_type, param_types)
 
-@dataclass(unsafe_hash=True)
+@dataclass(eq=False)
 class GenericType(Type):
     real_type: Type | None = None
 
-    def __eq__(self, other):
-        if not isinstance(other, GenericType):
-            return False
-        
+    @cached_property
+    def key(self):
         if self.real_type is None:
-            return self.type == other.type
+            return type_key('GenericType', self.type)
         
-        return self.real_type == other.real_type
+        return type_key('GenericType', self.real_type.key)
     
-    def codegen(self, scope):
+    @cached_property
+    def spelling(self):
         if self.real_type is not None:
-            return self.real_type.codegen(scope)
+            return self.real_type.spelling
         
         return self.type
     
@@ -420,9 +768,25 @@ class GenericType(Type):
         return GenericType(
             self.pos, self.type,
             self.real_type.analyse(scope) if self.real_type is not None else None
-        )
+        ).intern()
 
-@dataclass
+# the types every file's scope starts with, one object shared by all scopes
+BUILTIN_TYPES = [
+    PrimitiveType(Position.zero(), 'int'),
+    PrimitiveType(Position.zero(), 'float'),
+    ClassType(Position.zero(), 'string'),
+    PrimitiveType(Position.zero(), 'bool'),
+    PrimitiveType(Position.zero(), 'nil'),
+
+    PrimitiveType(Position.zero(), 'any'),
+    PrimitiveType(Position.zero(), 'function'),
+
+    PrimitiveType(Position.zero(), 'Math'),
+    PrimitiveType(Position.zero(), 'System'),
+    PrimitiveType(Position.zero(), 'Random')
+]
+
+@dataclass(slots=True)
 class Arg(Node):
     value: Node
     label: str | None = None
@@ -431,10 +795,11 @@ class Arg(Node):
         return self.value.codegen(scope)
     
     def analyse(self, scope):
-        value = self.value.analyse(scope)
-        return Arg(self.pos, value.type, value, self.label)
+        self.value = self.value.analyse(scope)
+        self.type = self.value.type
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Param(Node):
     name: str
     is_mutable: bool = False
@@ -449,12 +814,13 @@ class Param(Node):
         return f'{typ} {self.name}'
     
     def analyse(self, scope):
-        return Param(
-            self.pos, self.type.analyse(scope), self.name, self.is_mutable,
-            self.default.analyse(scope) if self.default is not None else None
-        )
+        self.type = self.type.analyse(scope)
+        if self.default is not None:
+            self.default = self.default.analyse(scope)
+        
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Body(Node):
     nodes: list[Node] = field(default_factory=list)
 
@@ -471,9 +837,11 @@ class Body(Node):
             
             nodes.append(node)
         
-        return Body(self.pos, self.type.analyse(scope), nodes)
+        self.type = self.type.analyse(scope)
+        self.nodes = nodes
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Return(Node):
     value: Node
 
@@ -481,10 +849,11 @@ class Return(Node):
         return f'return {self.value.codegen(scope)}'
     
     def analyse(self, scope):
-        value = self.value.analyse(scope)
-        return Return(self.pos, value.type, value)
+        self.value = self.value.analyse(scope)
+        self.type = self.value.type
+        return self
 
-@dataclass(kw_only=True, unsafe_hash=True)
+@dataclass(kw_only=True, unsafe_hash=True, slots=True)
 class FunctionFlags:
     static: bool = False
     property: bool = False
@@ -492,7 +861,7 @@ class FunctionFlags:
     public: bool = False
     internal: bool = False
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Function(Node):
     name: str
     ret_type: Type
@@ -515,18 +884,27 @@ class Function(Node):
             if self.ret_type.type != 'int':
                 self.pos.comptime_error(scope, 'main function must return int')
             
-            params_str = 'int argc, char* argv[]'
+            signature = f'{self.ret_type.codegen(scope)} {self.name}(int argc, char* argv[])'
             body = f"""cure_init(argc, argv);
 {body}"""
         else:
-            params_str = ', '.join(param.codegen(scope) for param in self.params)\
-                if len(self.params) > 0 else 'void'
+            signature = self.signature(scope)
         
-        signature = f'{self.ret_type.codegen(scope)} {self.name}({params_str})'
         return f"""{signature} {{
 {body}
 }}"""
     
+    def signature(self, scope: Scope):
+        params_str = ', '.join(param.codegen(scope) for param in self.params)\
+            if len(self.params) > 0 else 'void'
+        return f'{self.ret_type.codegen(scope)} {self.name}({params_str})'
+    
+    def declare(self, scope):
+        if self.body is None or self.name == 'main':
+            return ''
+        
+        return self.signature(scope)
+    
     def analyse(self, scope):
         extend_type = self.extend_type.analyse(scope) if self.extend_type is not None else None
         name = self.name
@@ -590,7 +968,7 @@ class Function(Node):
         
         return func
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Variable(Node):
     name: str
     value: Node
@@ -600,6 +978,9 @@ class Variable(Node):
     def codegen(self, scope):
         return f'{self.type.codegen(scope)} {self.name} = {self.value.codegen(scope)}'
     
+    def declare(self, scope):
+        return f'extern {self.type.codegen(scope)} {self.name}'
+    
     def analyse(self, scope):
         name = self.name
         if name in RESERVED_CPP_KEYWORDS:
@@ -612,9 +993,11 @@ class Variable(Node):
             return Assignment(self.pos, value.type, self.name, value, self.op).analyse(scope)
 
         scope.symbol_table.add(Symbol(name, value.type, value, self.is_mutable), self.name)
-        return Variable(self.pos, value.type, name, value, self.is_mutable, self.op)
+        self.type = value.type
+        self.value = value
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Assignment(Node):
     name: str
     value: Node
@@ -635,9 +1018,12 @@ class Assignment(Node):
                 value
             ).analyse(scope)
 
-        return Assignment(self.pos, value.type, symbol.name, value, self.op)
+        self.type = value.type
+        self.name = symbol.name
+        self.value = value
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Class(Node):
     name: str
     members: list[Node] = field(default_factory=list)
@@ -654,7 +1040,8 @@ class Class(Node):
         if not self.generic_names:
             self.define(scope, [])
         
-        return Class(self.pos, typ, self.members, self.generic_names)
+        self.type = typ
+        return self
     
     def replace_type(self, scope: Scope, typ: Type, cls_type: Type, **generics: Type):
         out_type = None
@@ -666,16 +1053,20 @@ class Class(Node):
             info(f'Replacing return type with generic type {generics[typ.type]}')
             out_type = generics[typ.type]
         
+        # a copy with the types it is made of replaced, the type may be interned and shared
+        changes = {}
         for f in fields(out_type):
             child = getattr(out_type, f.name)
             if isinstance(child, Type):
-                setattr(out_type, f.name, self.replace_type(scope, child, cls_type, **generics))
+                changes[f.name] = self.replace_type(scope, child, cls_type, **generics)
             elif isinstance(child, list):
-                for i, item in enumerate(child):
-                    if not isinstance(item, Type):
-                        continue
-
-                    child[i] = self.replace_type(scope, item, cls_type, **generics)
+                changes[f.name] = [
+                    self.replace_type(scope, item, cls_type, **generics)
+                    if isinstance(item, Type) else item for item in child
+                ]
+        
+        if changes:
+            out_type = replace(out_type, **changes)
         
         return out_type.analyse(scope)
     
@@ -741,7 +1132,7 @@ class Class(Node):
             generics[generic_name] = generic_type
             info(f'Added generic type {generic_name} = {str(generic_type)}')
         
-        info(f'Generics = {generics}')
+        info(lambda: f'Generics = {generics}')
 
         typ = scope.type_map.get(self.name)
         if self.generic_names:
@@ -756,17 +1147,52 @@ class Class(Node):
             #     cls_type = PrimitiveType(self.pos, 'string')
             else:
                 cls_type = ClassType(self.pos, cls_display_str, list(generics.values()))
-
-            debug(f'Created generic class type {cls_type} (Type = {cls_type.codegen(scope)})')
+            
+            cls_type = cls_type.intern()
+            debug(lambda: f'Created generic class type {cls_type} '\
+                  f'(Type = {cls_type.codegen(scope)})')
+            instances = scope.class_instances
             if scope.type_map.has(str(cls_type)):
                 info('Generic class already defined')
-                return Class(self.pos, cls_type, self.name, self.members, self.generic_names,
-                             self.is_internal)
+                instances.reused += 1
+                cls = instances.classes.get(cls_type)
+                if cls is None: # defined by a module loaded from its interface
+                    cls = instances.classes[cls_type] = Class(
+                        self.pos, cls_type, self.name, self.members, self.generic_names,
+                        self.is_internal
+                    )
+                
+                return cls
+            
+            instance = instances.instances.get(cls_type)
+            if instance is not None:
+                info('Generic class already defined in another scope')
+                instances.reused += 1
+                symbol_table, type_map = instance
+                scope.symbol_table.merge(symbol_table)
+                scope.type_map.merge(type_map)
+                return instances.classes[cls_type]
             
+            instances.defined += 1
+            symbols_before = set(scope.symbol_table.symbols)
+            types_before = set(scope.type_map.types)
             scope.type_map.add(cls_type)
-        else:
-            cls_type = typ
-
+            cls = self.define_members(scope, cls_type, typ, generics)
+
+            # everything defining the class added, including the classes its methods instantiated
+            instances.instances[cls_type] = (SymbolTable({
+                name: symbol for name, symbol in scope.symbol_table.symbols.items()
+                if name not in symbols_before
+            }), TypeMap({
+                name: added_type for name, added_type in scope.type_map.types.items()
+                if name not in types_before
+            }))
+            instances.classes[cls_type] = cls
+            return cls
+        
+        return self.define_members(scope, typ, typ, generics)
+    
+    def define_members(self, scope: Scope, cls_type: Type, typ: Type, generics: dict[str, Type]):
         members: list[Node] = []
         for member in self.members:
             if isinstance(member, Function):
@@ -784,7 +1210,7 @@ class Class(Node):
         
         return Class(self.pos, cls_type, self.name, members, self.generic_names, self.is_internal)
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Elseif(Node):
     cond: Node
     body: Body
@@ -796,9 +1222,11 @@ class Elseif(Node):
     
     def analyse(self, scope):
         body_scope = scope.make_child()
-        return Elseif(self.pos, self.type, self.cond.analyse(scope), self.body.analyse(body_scope))
+        self.cond = self.cond.analyse(scope)
+        self.body = self.body.analyse(body_scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class If(Node):
     cond: Node
     body: Body
@@ -822,13 +1250,15 @@ class If(Node):
         
         body_scope = scope.make_child()
         else_scope = scope.make_child()
-        return If(
-            self.pos, self.type, cond, self.body.analyse(body_scope),
-            self.else_body.analyse(else_scope) if self.else_body is not None else None,
-            [elseif.analyse(scope) for elseif in self.elseifs]
-        )
+        self.cond = cond
+        self.body = self.body.analyse(body_scope)
+        if self.else_body is not None:
+            self.else_body = self.else_body.analyse(else_scope)
+        
+        self.elseifs = [elseif.analyse(scope) for elseif in self.elseifs]
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class While(Node):
     cond: Node
     body: Body
@@ -845,9 +1275,12 @@ class While(Node):
         
         body_scope = scope.make_child()
         body_scope.in_loop = True
-        return While(self.pos, self.type.analyse(scope), cond, self.body.analyse(body_scope))
+        self.type = self.type.analyse(scope)
+        self.cond = cond
+        self.body = self.body.analyse(body_scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Break(Node):
     def codegen(self, _):
         return 'break'
@@ -858,7 +1291,7 @@ class Break(Node):
         
         return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Continue(Node):
     def codegen(self, _):
         return 'continue'
@@ -869,7 +1302,7 @@ class Continue(Node):
         
         return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Use(Node):
     path: str
 
@@ -880,7 +1313,7 @@ class Use(Node):
         scope.use(self.pos, self.path)
         return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Int(Node):
     value: int
 
@@ -888,9 +1321,10 @@ class Int(Node):
         return str(self.value)
     
     def analyse(self, scope):
-        return Int(self.pos, self.type.analyse(scope), self.value)
+        self.type = self.type.analyse(scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Float(Node):
     value: float
 
@@ -898,9 +1332,10 @@ class Float(Node):
         return f'{self.value}f'
     
     def analyse(self, scope):
-        return Float(self.pos, self.type.analyse(scope), self.value)
+        self.type = self.type.analyse(scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class String(Node):
     value: str
 
@@ -908,10 +1343,11 @@ class String(Node):
         return f'string("{self.value}")'
     
     def analyse(self, scope):
-        return String(self.pos, self.type.analyse(scope), self.value)
+        self.type = self.type.analyse(scope)
+        return self
 
 # TODO: add support for String interpolation
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class FormattedString(Node):
     value: str
 
@@ -936,15 +1372,17 @@ class FormattedString(Node):
     
     def compile(self, src: str):
         with NamedTemporaryFile() as f:
-            from cure import parse
+            from cure.compiler import parse
 
             f.write(src.encode('utf-8'))
 
             scope = Scope(Path(f.name))
             program = parse(scope)
-            return program.analyse(scope).nodes
+            nodes = program.analyse(scope).nodes
+            sources.forget(scope.file)
+            return nodes
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Bool(Node):
     value: bool
 
@@ -952,17 +1390,19 @@ class Bool(Node):
         return str(self.value).lower()
     
     def analyse(self, scope):
-        return Bool(self.pos, self.type.analyse(scope), self.value)
+        self.type = self.type.analyse(scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Nil(Node):
     def codegen(self, _):
         return 'nil()'
     
     def analyse(self, scope):
-        return Nil(self.pos, self.type.analyse(scope))
+        self.type = self.type.analyse(scope)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Id(Node):
     name: str
 
@@ -976,11 +1416,48 @@ class Id(Node):
             self.pos.comptime_error(scope, f'undefined name \'{self.name}\'')
         
         if typ is not None:
-            return Id(self.pos, typ, self.name)
+            self.type = typ
+        else:
+            self.type = symbol.type
+            self.name = symbol.name
         
-        return Id(self.pos, symbol.type, symbol.name)
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass
+class OverloadIndex:
+    """The overloads of a function (including itself) by the number of arguments they can be called
+with. An overload that takes exactly that many arguments of concrete types (no `any` or generic
+parameters) is found by the keys of its parameter types, all others are checked one by one."""
+
+    function: 'Function'
+    count: int
+    exact: dict[tuple, list['Function']] = field(default_factory=dict)
+    other: dict[int, list['Function']] = field(default_factory=dict)
+
+    @staticmethod
+    def new(function: 'Function'):
+        index = OverloadIndex(function, len(function.overloads))
+        for func in [function] + function.overloads:
+            params = func.params
+            is_exact = all(
+                param.type.type != 'any' and param.type.type not in func.generic_names
+                for param in params
+            )
+            if is_exact:
+                key = (len(params), tuple(param.type.key for param in params))
+                index.exact.setdefault(key, []).append(func)
+            else:
+                index.other.setdefault(len(params), []).append(func)
+            
+            # the trailing parameters with default values can be left out
+            arity = len(params)
+            while arity > 0 and params[arity - 1].default is not None:
+                arity -= 1
+                index.other.setdefault(arity, []).append(func)
+        
+        return index
+
+@dataclass(unsafe_hash=True, slots=True)
 class Call(Node):
     callee: Id
     args: list[Arg] = field(default_factory=list)
@@ -1009,70 +1486,106 @@ class Call(Node):
                     scope, f'cannot call function type with argument types {arg_types_str}'
                 )
             
-            return Call(self.pos, func.type.return_type, self.callee, args)
+            self.type = func.type.return_type
+            self.args = args
+            return self
 
         info(f'Calling function {symbol.name} with {len(args)} arguments')
 
+        call_func, indices = self.resolve(scope, func, args)
+        args = self.make_args(args, call_func.params, indices)
+        for arg, param in zip(args, call_func.params):
+            if isinstance(param.type, ReferenceType) and not isinstance(arg, Id):
+                arg.pos.comptime_error(scope, 'cannot pass values to reference types')
+        
+        debug(f'Found valid callable function {call_func.name}')
+        self.type = call_func.ret_type
+        self.callee = Id(self.pos, call_func.type, call_func.name)
+        self.args = args
+        return self
+    
+    def resolve(self, scope: Scope, func: 'Function', args: list[Arg]):
+        """The overload of `func` to call with the arguments and the index of the argument passed
+to each of its parameters (see `arg_indices`). The result is remembered for the compilation by the
+function, its number of overloads, the argument types and labels."""
+
+        # keys are interned (see `Type.key`) and hashed by identity, they identify the argument types
+        arg_keys = tuple(arg.type.key for arg in args)
+        labels = tuple(arg.label for arg in args)
+        key = (id(func), len(func.overloads), arg_keys, labels)
+        resolved = scope.resolved_calls.get(key)
+        if resolved is not None and resolved[0] is func: # not a function that reused a freed id
+            return resolved[1], resolved[2]
+
         functions = [func] + func.overloads
-        functions_str = ', '.join(
+        debug(lambda: 'Possible function signatures = [' + ', '.join(
             '(' + ', '.join(str(param.type) for param in func.params) + ')'
             for func in functions
-        )
-        debug(f'Possible function signatures = [{functions_str}]')
+        ) + ']')
 
-        call_func = None
-        for func in functions:
-            func_args = self.build_args(args, func.params)
-            if func_args is None:
+        if any(label is not None for label in labels):
+            # labelled arguments can be passed to any overload, they are checked one by one
+            candidates = functions
+            matches: list[tuple[Function, list[int | None]]] = []
+        else:
+            index = scope.overload_indexes.get(id(func))
+            if index is None or index.function is not func or index.count != len(func.overloads):
+                index = OverloadIndex.new(func)
+                scope.overload_indexes[id(func)] = index
+
+            candidates = index.other.get(len(args), [])
+            matches = [
+                (match, list(range(len(args))))
+                for match in index.exact.get((len(args), arg_keys), [])
+            ]
+
+        for candidate in candidates:
+            indices = self.arg_indices(args, candidate.params)
+            if indices is None:
                 continue
 
             are_params_valid = self.check_params(
-                [param.type for param in func.params], [arg.type for arg in func_args],
-                func.generic_names
+                [param.type for param in candidate.params],
+                [args[i].type if i is not None else param.type
+                 for i, param in zip(indices, candidate.params)],
+                candidate.generic_names
             )
-            if not are_params_valid:
-                continue
-            
-            if call_func is not None:
-                self.pos.comptime_error(
-                    scope, 'ambiguous function call (multiple overloads with the same signature)'
-                )
-            
-            call_func = (func, func_args)
+            if are_params_valid:
+                matches.append((candidate, indices))
         
-        if call_func is None:
+        if len(matches) > 1:
+            self.pos.comptime_error(
+                scope, 'ambiguous function call (multiple overloads with the same signature)'
+            )
+        elif len(matches) == 0:
+            arg_types = [arg.type for arg in args]
             arg_types_str = ', '.join(str(t) for t in arg_types)
             error(f"""Arg Type Display = {', '.join(str(t) for t in arg_types)}
 Arg C++ Type = {', '.join(t.codegen(scope) for t in arg_types)}
 Arg Object Type = {', '.join(t.object_type(scope) for t in arg_types)}""")
             return self.pos.comptime_error(scope, f'no matching overload with types [{arg_types_str}]')
         
-        call_func, args = call_func
-        for arg, param in zip(args, call_func.params):
-            if isinstance(param.type, ReferenceType) and not isinstance(arg, Id):
-                arg.pos.comptime_error(scope, 'cannot pass values to reference types')
-        
-        debug(f'Found valid callable function {call_func.name}')
-        return Call(
-            self.pos, call_func.ret_type,
-            Id(self.pos, call_func.type, call_func.name),
-            args
-        )
+        call_func, indices = matches[0]
+        scope.resolved_calls[key] = (func, call_func, indices)
+        return call_func, indices
     
     def index_param_name(self, params: list[Param], name: str):
         for i, param in enumerate(params):
             if param.name == name:
                 return i
     
-    def build_args(self, args: list[Arg], params: list[Param]):
+    def arg_indices(self, args: list[Arg], params: list[Param]):
+        """The index of the argument passed to each parameter, None for a parameter that takes its
+default value, or None if the arguments cannot be passed to the parameters."""
+
         # no ideas why these two if statements break everything if you remove them
         if len(params) == 0 and len(args) > 0:
             return None
         elif len(params) == 0:
-            return args
+            return []
 
         debug(f'Building arguments with {len(params)} parameters')
-        new_args: list[Arg | None] = [None] * len(params)
+        indices: list[int | None] = [None] * len(params)
         for i, arg in enumerate(args):
             if arg.label is not None:
                 debug(f'Argument {i} has label \'{arg.label}\'')
@@ -1081,29 +1594,34 @@ Arg Object Type = {', '.join(t.object_type(scope) for t in arg_types)}""")
                     return None
                 
                 debug(f'Found parameter at index {param_index}')
-                new_args[param_index] = arg
+                indices[param_index] = i
             else:
                 debug(f'Argument {i} has no label, assuming positional argument')
-                try:
-                    new_args[i] = arg
-                except IndexError:
+                if i >= len(params):
                     debug(f'Argument {i} is out of range')
                     return None
+                
+                indices[i] = i
         
         for i, param in enumerate(params):
-            if new_args[i] is not None:
+            if indices[i] is not None:
                 continue
             
             if param.default is None:
                 return None # missing non-optional parameter
 
             debug(f'Parameter {i} has no argument, using default value')
-            new_args[i] = Arg(self.pos, param.type, param.default)
         
-        if any(arg is None for arg in new_args):
-            return None
+        return indices
+    
+    def make_args(self, args: list[Arg], params: list[Param], indices: list[int | None]):
+        if len(params) == 0:
+            return args
         
-        return new_args
+        return [
+            args[i] if i is not None else Arg(self.pos, param.type, cast(Node, param.default))
+            for i, param in zip(indices, params)
+        ]
     
     def check_params(self, param_types: list[Type], arg_types: list[Type],
                      generic_names: list[str] | None = None):
@@ -1114,14 +1632,14 @@ Arg Object Type = {', '.join(t.object_type(scope) for t in arg_types)}""")
             if param_type == arg_type or param_type.type == 'any' or param_type.type in generic_names:
                 continue
 
-            debug(f"""Type mismatch with Param Type {param_type} and Arg Type {arg_type}
+            debug(lambda: f"""Type mismatch with Param Type {param_type} and Arg Type {arg_type}
 Param Type = {param_type!r}
 Arg Type = {arg_type!r}""")
             return False
         
         return True
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Cast(Node):
     object: Node
 
@@ -1136,7 +1654,7 @@ class Cast(Node):
         callee = f'{object.type.object_type(scope)}_to_{self.type.object_type(scope)}'
         symbol = scope.symbol_table.get(callee)
 
-        debug(f"""Analysing Cast node
+        debug(lambda: f"""Analysing Cast node
 Type Display = {object.type}
 C++ Type = {object.type.codegen(scope)}
 Object Type = {object.type.object_type(scope)}
@@ -1152,7 +1670,7 @@ Callee Symbol = {symbol}""")
             [Arg(object.pos, object.type, object)]
         ).analyse(scope)
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Operation(Node):
     op: str
     left: Node
@@ -1170,7 +1688,7 @@ class Operation(Node):
         left = self.left.analyse(scope)
         op_name = op_map[self.op]
 
-        debug(f"""Analysing Operation node
+        debug(lambda: f"""Analysing Operation node
 Left Type Display = {left.type}
 Left C++ Type = {left.type.codegen(scope)}
 Left Object Type = {left.type.object_type(scope)}""")
@@ -1181,7 +1699,7 @@ Left Object Type = {left.type.object_type(scope)}""")
             args = [Arg(left.pos, left.type, left)]
         else:
             right = self.right.analyse(scope)
-            debug(f"""Right Type Display = {right.type}
+            debug(lambda: f"""Right Type Display = {right.type}
 Right C++ Type = {right.type.codegen(scope)}
 Right Object Type = {right.type.object_type(scope)}
 """)
@@ -1192,7 +1710,7 @@ Right Object Type = {right.type.object_type(scope)}
             args = [Arg(left.pos, left.type, left), Arg(right.pos, right.type, right)]
         
         symbol = scope.symbol_table.get(callee)
-        debug(f"""Callee = {callee}
+        debug(lambda: f"""Callee = {callee}
 Callee Symbol = {symbol}""")
         if symbol is None:
             self.pos.comptime_error(scope, error_message)
@@ -1202,13 +1720,16 @@ Callee Symbol = {symbol}""")
             self.pos.comptime_error(scope, f'invalid function \'{callee}\'')
         
         if func.flags.internal:
-            return Operation(self.pos, func.ret_type, self.op, left, right)
+            self.type = func.ret_type
+            self.left = left
+            self.right = right
+            return self
         
         return Call(
             self.pos, self.type, Id(self.pos, scope.type_map.get('function'), callee), args
         ).analyse(scope)
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Ternary(Node):
     cond: Node
     true: Node
@@ -1227,9 +1748,13 @@ class Ternary(Node):
         if true.type != false.type:
             self.pos.comptime_error(scope, 'both branches must be the same type')
 
-        return Ternary(self.pos, self.type.analyse(scope), cond, true, false)
+        self.type = self.type.analyse(scope)
+        self.cond = cond
+        self.true = true
+        self.false = false
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Bracketed(Node):
     value: Node
 
@@ -1237,10 +1762,11 @@ class Bracketed(Node):
         return f'({self.value.codegen(scope)})'
     
     def analyse(self, scope):
-        value = self.value.analyse(scope)
-        return Bracketed(self.pos, value.type, value)
+        self.value = self.value.analyse(scope)
+        self.type = self.value.type
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Attribute(Node):
     object: Node
     attr: str
@@ -1263,7 +1789,7 @@ class Attribute(Node):
         callee = f'{object.type.object_type(scope)}_{self.attr}'
         symbol = scope.symbol_table.get(callee)
 
-        debug(f"""Analysing Attribute node
+        debug(lambda: f"""Analysing Attribute node
 Type Display = {object.type}
 C++ Type = {object.type.codegen(scope)}
 Object Type = {object.type.object_type(scope)}
@@ -1298,15 +1824,17 @@ Symbol = {symbol}""")
         if self.attr == 'new':
             return New(self.pos, res.type, res.type, args)
         
-        attr = Attribute(self.pos, res.type, object, self.attr, args)
+        self.type = res.type
+        self.object = object
+        self.args = args
         if res.type == scope.type_map.get('nil'):
-            return attr
+            return self
         
         # because they're internal, there's a chance that they could not return the right type
         # e.g. string length in C++ returns size_type but should return an int
-        return Cast(self.pos, res.type, attr)
+        return Cast(self.pos, res.type, self)
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class New(Node):
     new_type: Type
     args: list[Node] = field(default_factory=list)
@@ -1321,7 +1849,7 @@ class New(Node):
             self.pos, new_type, Id(self.pos, new_type, str(new_type)), 'new', self.args
         ).analyse(scope)
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class NewArray(Node):
     element_type: Type
     size: Node | None = None
@@ -1332,9 +1860,11 @@ class NewArray(Node):
     def analyse(self, scope):
         typ = self.element_type.analyse(scope)
         array_cls = scope.define_class(self.pos, 'array', [typ])
-        return NewArray(self.pos, array_cls.type, typ, self.size)
+        self.type = array_cls.type
+        self.element_type = typ
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class ArrayInit(Node):
     elements: list[Node] = field(default_factory=list)
 
@@ -1355,9 +1885,11 @@ class ArrayInit(Node):
             self.pos.comptime_error(scope, 'array initialization type mismatch')
         
         array_cls = scope.define_class(self.pos, 'array', [elem_type])
-        return ArrayInit(self.pos, array_cls.type, elements)
+        self.type = array_cls.type
+        self.elements = elements
+        return self
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class ForRange(Node):
     name: str
     start: Node
@@ -1393,5 +1925,7 @@ class ForRange(Node):
         body_scope.symbol_table.add(Symbol(name, start.type, self))
         body_scope.in_loop = True
 
-        body = self.body.analyse(body_scope)
-        return ForRange(self.pos, self.type, name, start, end, body)
+        self.start = start
+        self.end = end
+        self.body = self.body.analyse(body_scope)
+        return self
@@ -1,10 +1,15 @@
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ErrorListener as ANTLRErrorListener
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.atn.PredictionMode import PredictionMode
 from antlr4 import InputStream, CommonTokenStream
 from antlr4.Token import CommonToken
 
 from cure.parser.CureVisitor import CureVisitor
 from cure.parser.CureParser import CureParser
 from cure.parser.CureLexer import CureLexer
+from cure.dfa_cache import load_dfa
+from cure.log import debug
 from cure.ir import (
     Program, Scope, Position, Function, Param, Int, Float, String, Bool, Id, Return, Body, Call,
     Cast, Operation, Use, If, While, Variable, Ternary, Bracketed, Attribute, Break, Continue, Type,
@@ -23,20 +28,44 @@ class ErrorListener(ANTLRErrorListener):
 class IRBuilder(CureVisitor):
     def __init__(self, scope: Scope):
         self.scope = scope
+
+        # the placeholder type of nodes before analysis, looked up once instead of for every node
+        self.any_type = scope.type_map.get('any')
     
     def pos(self, ctx):
         return Position(ctx.start.line, ctx.start.column)
     
-    def build(self):
+    def parse(self, sll: bool = True):
+        """Parse the scope's source into a parse tree. With `sll` the parser first tries the much
+faster SLL prediction mode and bails out on the first error, only re-parsing with full LL
+prediction (and reporting syntax errors) when SLL fails. The first parse of a process loads the
+parser DFA that earlier runs learned."""
+
+        load_dfa()
         lexer = CureLexer(InputStream(self.scope.src))
-        parser = CureParser(CommonTokenStream(lexer))
+        tokens = CommonTokenStream(lexer)
+        parser = CureParser(tokens)
         parser.removeErrorListeners()
+        if sll:
+            parser._interp.predictionMode = PredictionMode.SLL
+            parser._errHandler = BailErrorStrategy()
+            try:
+                return parser.program()
+            except ParseCancellationException:
+                debug(f'SLL parse of {self.scope.file} failed, retrying with LL prediction')
+                parser.reset()
+                parser._interp.predictionMode = PredictionMode.LL
+                parser._errHandler = DefaultErrorStrategy()
+        
         parser.addErrorListener(ErrorListener(self.scope))
-        return self.visitProgram(parser.program())
+        return parser.program()
+    
+    def build(self):
+        return self.visitProgram(self.parse())
     
     def visitProgram(self, ctx):
         return Program(
-            self.pos(ctx), self.scope.type_map.get('any'), [self.visit(stmt) for stmt in ctx.stmt()]
+            self.pos(ctx), self.any_type, [self.visit(stmt) for stmt in ctx.stmt()]
         )
     
     def visitType(self, ctx):
@@ -52,7 +81,7 @@ class IRBuilder(CureVisitor):
         #         self.pos(ctx), f'{cls_type.type}',
         #         [self.visitType(type_) for type_ in ctx.type_()[1:]]
         #     )
-        elif len(ctx.type_()) > 1 and ctx.LPAREN() is not None:
+        elif ctx.RETURNS() is not None:
             return_type = self.visitType(ctx.type_()[-1])
             param_types = [self.visitType(type_) for type_ in ctx.type_()[:-1]]
             param_types_str = ', '.join(t.codegen(self.scope) for t in param_types)
@@ -79,14 +108,14 @@ class IRBuilder(CureVisitor):
         return Return(self.pos(ctx), expr.type, expr)
     
     def visitBreak(self, ctx):
-        return Break(self.pos(ctx), self.scope.type_map.get('any'))
+        return Break(self.pos(ctx), self.any_type)
     
     def visitContinue(self, ctx):
-        return Continue(self.pos(ctx), self.scope.type_map.get('any'))
+        return Continue(self.pos(ctx), self.any_type)
     
     def visitBody(self, ctx):
         return Body(
-            self.pos(ctx), self.scope.type_map.get('any'),
+            self.pos(ctx), self.any_type,
             [self.visit(stmt) for stmt in ctx.bodyStmt()]
         )
     
@@ -146,20 +175,20 @@ class IRBuilder(CureVisitor):
     
     def visitExternClass(self, ctx):
         return Class(
-            self.pos(ctx), self.scope.type_map.get('any'), ctx.ID().getText(),
+            self.pos(ctx), self.any_type, ctx.ID().getText(),
             self.visitBody(ctx.body()).nodes, self.visitGenericParams(ctx.genericParams()),
             ctx.INTERNAL() is not None
         )
     
     def visitVarAssign(self, ctx):
         return Variable(
-            self.pos(ctx), self.scope.type_map.get('any'), ctx.ID().getText(), self.visit(ctx.expr()),
+            self.pos(ctx), self.any_type, ctx.ID().getText(), self.visit(ctx.expr()),
             ctx.MUTABLE() is not None, ctx.op.text if ctx.op is not None else None
         )
     
     def visitIfStmt(self, ctx):
         return If(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visit(ctx.expr()),
+            self.pos(ctx), self.any_type, self.visit(ctx.expr()),
             self.visitBody(ctx.body()), self.visitElseStmt(ctx.elseStmt()),
             [self.visitElseifStmt(elseif) for elseif in ctx.elseifStmt()]
         )
@@ -169,24 +198,24 @@ class IRBuilder(CureVisitor):
     
     def visitElseifStmt(self, ctx):
         return Elseif(
-            self.pos(ctx), self.scope.type_map.get('any'),
+            self.pos(ctx), self.any_type,
             self.visit(ctx.expr()), self.visitBody(ctx.body())
         )
     
     def visitWhileStmt(self, ctx):
         return While(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visit(ctx.expr()),
+            self.pos(ctx), self.any_type, self.visit(ctx.expr()),
             self.visitBody(ctx.body())
         )
     
     def visitForRangeStmt(self, ctx):
         return ForRange(
-            self.pos(ctx), self.scope.type_map.get('any'), ctx.ID().getText(),
+            self.pos(ctx), self.any_type, ctx.ID().getText(),
             self.visit(ctx.expr(0)), self.visit(ctx.expr(1)), self.visitBody(ctx.body())
         )
     
     def visitUseStmt(self, ctx):
-        return Use(self.pos(ctx), self.scope.type_map.get('any'), ctx.STRING().getText()[1:-1])
+        return Use(self.pos(ctx), self.any_type, ctx.STRING().getText()[1:-1])
     
     def visitInt(self, ctx):
         return Int(self.pos(ctx), self.scope.type_map.get('int'), int(ctx.getText()))
@@ -200,25 +229,27 @@ class IRBuilder(CureVisitor):
     def visitBool(self, ctx):
         return Bool(self.pos(ctx), self.scope.type_map.get('bool'), ctx.getText() == 'true')
     
-    def visitId(self, ctx):
-        return Id(self.pos(ctx), self.scope.type_map.get('any'), ctx.getText())
-    
     def visitNew(self, ctx):
+        if ctx.LPAREN() is None:
+            return NewArray(
+                self.pos(ctx), self.any_type, self.visitType(ctx.type_())
+            )
+        
         return New(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visitType(ctx.type_()),
+            self.pos(ctx), self.any_type, self.visitType(ctx.type_()),
             self.visitArgs(ctx.args())
         )
     
-    def visitNewArray(self, ctx):
-        return NewArray(self.pos(ctx), self.scope.type_map.get('any'), self.visitType(ctx.type_()))
-    
     def visitArrayInit(self, ctx):
-        return ArrayInit(self.pos(ctx), self.scope.type_map.get('any'), self.visitArgs(ctx.args()))
+        return ArrayInit(self.pos(ctx), self.any_type, self.visitArgs(ctx.args()))
     
     def visitCall(self, ctx):
+        if ctx.LPAREN() is None:
+            return Id(self.pos(ctx), self.any_type, ctx.ID().getText())
+        
         return Call(
-            self.pos(ctx), self.scope.type_map.get('any'),
-            Id(self.pos(ctx), self.scope.type_map.get('any'), ctx.ID().getText()),
+            self.pos(ctx), self.any_type,
+            Id(self.pos(ctx), self.any_type, ctx.ID().getText()),
             self.visitArgs(ctx.args())
         )
     
@@ -229,20 +260,15 @@ class IRBuilder(CureVisitor):
     def visitCast(self, ctx):
         return Cast(self.pos(ctx), self.visitType(ctx.type_()), self.visit(ctx.expr()))
     
-    def visitProperty(self, ctx):
+    def visitAttribute(self, ctx):
         return Attribute(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visit(ctx.expr()), ctx.ID().getText()
-        )
-    
-    def visitMethod(self, ctx):
-        return Attribute(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visit(ctx.expr()), ctx.ID().getText(),
-            self.visitArgs(ctx.args())
+            self.pos(ctx), self.any_type, self.visit(ctx.expr()), ctx.ID().getText(),
+            self.visitArgs(ctx.args()) if ctx.LPAREN() is not None else None
         )
     
     def visitTernary(self, ctx):
         return Ternary(
-            self.pos(ctx), self.scope.type_map.get('any'), self.visit(ctx.expr(1)),
+            self.pos(ctx), self.any_type, self.visit(ctx.expr(1)),
             self.visit(ctx.expr(0)), self.visit(ctx.expr(2))
         )
     
@@ -254,7 +280,7 @@ class IRBuilder(CureVisitor):
         else:
             left, right = self.visit(ctx.expr()), None
         
-        return Operation(pos, self.scope.type_map.get('any'), op, left, right)
+        return Operation(pos, self.any_type, op, left, right)
     
     def visitAddition(self, ctx):
         return self.visitOperation(ctx)
@@ -0,0 +1,28 @@
+from logging import getLogger, NullHandler, DEBUG, INFO, ERROR
+from typing import Callable
+
+
+# every message of the compiler goes to this logger, which drops them unless the command line (see
+# `--verbose` and `--log-file` in main.py) or a tool embedding the compiler configures logging
+logger = getLogger('cure')
+logger.addHandler(NullHandler())
+
+Message = str | Callable[[], str]
+
+
+def log(level: int, message: Message):
+    # stacklevel 3 reports the caller of debug/info/error as the message's file and line
+    if logger.isEnabledFor(level):
+        logger.log(level, message() if callable(message) else message, stacklevel=3)
+
+def debug(message: Message):
+    """Logs a debug message. Messages that are expensive to build (like ones calling `codegen`) are
+passed as a function returning the message, which is only called when debug logging is enabled."""
+
+    log(DEBUG, message)
+
+def info(message: Message):
+    log(INFO, message)
+
+def error(message: Message):
+    log(ERROR, message)
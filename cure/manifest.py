@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Any
+import json
+
+from cure.log import debug, info
+
+
+STDLIB_PATH = Path(__file__).parent / 'stdlib'
+MANIFEST_PATH = STDLIB_PATH / 'manifest.json'
+# the settings of a library's dependencies.txt and the type of dependency each one adds
+DEPENDENCY_SETTINGS = {'sources': 'src', 'include_dirs': 'hpp_dir', 'deps': 'dep', 'libs': 'lib'}
+
+_manifest: dict[str, dict[str, Any]] | None = None
+
+
+def read_dependencies(file: Path):
+    """The (type, value) pairs of a dependencies.txt file in the order they are listed. Values are
+paths relative to the file's directory, except the names of libraries to link."""
+
+    dependencies: list[tuple[str, str]] = []
+    for line in file.read_text().splitlines():
+        if line.startswith('#'):
+            continue
+
+        for setting, dependency_type in DEPENDENCY_SETTINGS.items():
+            if line.startswith(f'{setting} = '):
+                values = line.removeprefix(f'{setting} = ').split(',')
+                dependencies.extend((dependency_type, value.strip()) for value in values)
+
+    return dependencies
+
+def library_manifest(directory: Path):
+    """What `use` needs to know about a standard library directory, its files relative to it."""
+
+    dependencies_file = directory / 'dependencies.txt'
+    return {
+        'headers': sorted(file.name for file in directory.glob('*.hpp')),
+        'sources': sorted(file.name for file in directory.glob('*.cpp')),
+        'modules': sorted(file.name for file in directory.glob('*.cure')),
+        'dependencies_file': dependencies_file.name if dependencies_file.exists() else None,
+        'dependencies': read_dependencies(dependencies_file) if dependencies_file.exists() else []
+    }
+
+def generate_manifest():
+    return {
+        directory.name: library_manifest(directory)
+        for directory in sorted(STDLIB_PATH.iterdir()) if directory.is_dir()
+    }
+
+def write_manifest():
+    """Regenerates the manifest (see `cure stdlib manifest`), which has to be done whenever a file
+is added to or removed from the standard library."""
+
+    manifest = generate_manifest()
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=4) + '\n')
+    info(f'Wrote the manifest of {len(manifest)} standard library modules to {MANIFEST_PATH}')
+    return manifest
+
+def stdlib_library(name: str):
+    """The manifest of the standard library module, or None if there is no such module. The
+manifest is read once per process, so resolving a `use` does not list the library's directory."""
+
+    global _manifest
+    if _manifest is None:
+        if MANIFEST_PATH.exists():
+            _manifest = json.loads(MANIFEST_PATH.read_text())
+        else:
+            debug(f'{MANIFEST_PATH} does not exist, listing the standard library')
+            _manifest = generate_manifest()
+
+    return _manifest.get(name)
@@ -0,0 +1,120 @@
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from pathlib import Path
+from os import cpu_count
+
+from cure.ir import Scope, ModuleInterface, Use, STDLIB_PATH, interface_file, interface_key
+from cure.visitor import NodeVisitor
+from cure.diagnostics import CompileError
+from cure.log import debug, info
+from cure.timings import timings
+from cure import cache
+
+
+DEFAULT_JOBS = cpu_count() or 1
+
+
+class UseCollector(NodeVisitor):
+    def __init__(self):
+        self.paths: list[str] = []
+
+    def visit_Use(self, node: Use):
+        self.paths.append(node.path)
+
+def module_uses(file: Path, frontend: str = 'antlr'):
+    """The local .cure modules the file's `use` statements name, resolved like `Scope.use` resolves
+them. The file is parsed (or its IR loaded from the cache, where the compile of the file finds it
+again), so a `use` inside a string or a comment is not one."""
+
+    from cure.compiler import parse
+
+    collector = UseCollector()
+    collector.visit(parse(Scope(file, frontend=frontend)))
+    uses: list[Path] = []
+    for path in collector.paths:
+        module = Path(path).resolve()
+        if module.is_file() and module not in uses:
+            uses.append(module)
+
+    return uses
+
+def import_graph(file: Path, frontend: str = 'antlr'):
+    """Every local module the file uses directly or through other modules, mapped to the local
+modules it uses."""
+
+    graph: dict[Path, list[Path]] = {}
+    stack = module_uses(file, frontend)
+    while stack:
+        module = stack.pop()
+        if module in graph:
+            continue
+
+        try:
+            graph[module] = module_uses(module, frontend)
+        except (OSError, CompileError): # reported by the compile that uses it
+            graph[module] = []
+
+        stack.extend(graph[module])
+
+    return graph
+
+def is_cached(file: Path, separate: bool = False):
+    module = cache.load_file(interface_file(file), interface_key(file, separate))
+    return module is not None and isinstance(module, ModuleInterface) and module.is_current()
+
+def compile_module(file: Path, frontend: str, separate: bool = False):
+    # runs in a worker process, the module interface reaches the importing process through its
+    # interface file
+    Scope(file, frontend=frontend, separate=separate).compile_module(file)
+    return file
+
+def compile_modules(file: Path, frontend: str = 'antlr', jobs: int | None = None,
+                    separate: bool = False):
+    """Compiles the local modules the file imports in `jobs` processes before the file is analysed,
+a module as soon as the modules it uses are compiled. Each module stores its interface in its build
+directory (see `Scope.compile_module`), where the serial analysis of the file picks it up and merges
+it in the order of the `use` statements. Returns the number of modules compiled."""
+
+    if jobs is None:
+        jobs = DEFAULT_JOBS
+
+    if jobs < 2 or file.is_relative_to(STDLIB_PATH):
+        return 0
+
+    graph = import_graph(file, frontend)
+    pending = {module: uses for module, uses in graph.items() if not is_cached(module, separate)}
+    debug(f'{len(pending)} of the {len(graph)} modules used by {file} are not cached')
+    if len(pending) < 2:
+        return 0
+
+    compiled = 0
+    processes = min(jobs, len(pending))
+    with timings.phase('compile modules'), ProcessPoolExecutor(processes) as pool:
+        running: dict[Future, Path] = {}
+        failed = False
+        while True:
+            if not failed:
+                unfinished = set(pending) | set(running.values())
+                ready = [
+                    module for module, uses in pending.items()
+                    if not any(use in unfinished for use in uses)
+                ]
+                # a module of an import cycle never becomes ready and is left to the serial analysis
+                for module in ready:
+                    pending.pop(module)
+                    running[pool.submit(compile_module, module, frontend, separate)] = module
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                module = running.pop(future)
+                if future.exception() is not None:
+                    # the analysis of the file compiles the module again and reports the error
+                    info(f'Failed to compile {module} in a worker: {future.exception()!r}')
+                    failed = True
+                else:
+                    compiled += 1
+
+    info(f'Compiled {compiled} modules used by {file} in {processes} processes')
+    return compiled
@@ -0,0 +1,519 @@
+from dataclasses import dataclass
+import re
+
+from cure.ir import (
+    Program, Scope, Position, Function, Param, Int, Float, String, Bool, Id, Return, Body, Call,
+    Cast, Operation, Use, If, While, Variable, Ternary, Bracketed, Attribute, Break, Continue, Type,
+    Class, NewArray, ArrayInit, ForRange, New, Elseif, ArrayType, ReferenceType, FunctionType, Arg,
+    Node
+)
+
+
+KEYWORDS = {'if', 'in', 'for', 'use', 'fn', 'else', 'mut', 'static', 'return', 'extern', 'method',
+            'property', 'internal', 'while', 'break', 'continue', 'new', 'class'}
+# the alternatives are tried in order, which together with the patterns themselves gives the same
+# longest match (and keyword over ID) behaviour as the ANTLR lexer
+TOKEN_REGEX = re.compile(r"""
+    (?P<WHITESPACE>[\t\r\n ]+)
+    |(?P<COMMENT>//[^\n]*\n)
+    |(?P<MULTILINE_COMMENT>/\*[\s\S]*?\*/)
+    |(?P<FLOAT>-?[0-9]*\.[0-9]+)
+    |(?P<INT>-?[0-9]+)
+    |(?P<STRING>"[\s\S]*?"|'[\s\S]*?')
+    |(?P<ID>[a-zA-Z_][a-zA-Z_0-9]*)
+    |(?P<OP>==|!=|>=|<=|&&|\|\||\.\.|->|[-+*/%><!.,:=(){}\[\]&'])
+    |(?P<OTHER>[\s\S])
+""", re.VERBOSE)
+SKIPPED = {'WHITESPACE', 'COMMENT', 'MULTILINE_COMMENT'}
+
+EXPR_START = {'(', 'ID', 'INT', 'FLOAT', 'STRING', 'BOOL', 'new', '[', '!', '-', '+'}
+UNARY_OPS = {'!', '-', '+'}
+ASSIGN_OPS = {'+', '-', '*', '/', '%'}
+FUNC_NAME_OPS = {'+', '-', '*', '/', '%', '==', '!=', '<', '>', '<=', '>=', '&&', '||', '!'}
+# binary operator -> (precedence, precedence of the right operand)
+BINARY_OPS = {
+    '*': (5, 6), '/': (5, 6), '%': (5, 6),
+    '+': (4, 5), '-': (4, 5),
+    '==': (3, 4), '!=': (3, 4), '>': (3, 4), '<': (3, 4), '>=': (3, 4), '<=': (3, 4),
+    '&&': (2, 3), '||': (2, 3)
+}
+TERNARY_PRECEDENCE = 7
+ATTRIBUTE_PRECEDENCE = 6
+CAST_OPERAND_PRECEDENCE = 16
+UNARY_OPERAND_PRECEDENCE = 1
+TERNARY_ELSE_PRECEDENCE = 8
+
+
+@dataclass(slots=True)
+class Token:
+    kind: str
+    text: str
+    line: int
+    column: int
+
+    @property
+    def pos(self):
+        return Position(self.line, self.column)
+
+def tokenize(src: str):
+    tokens = []
+    line, column = 1, 0
+    for match in TOKEN_REGEX.finditer(src):
+        kind = match.lastgroup or 'OTHER'
+        text = match.group()
+        if kind == 'ID':
+            if text in KEYWORDS:
+                kind = text
+            elif text == 'true' or text == 'false':
+                kind = 'BOOL'
+        elif kind == 'OP':
+            kind = text
+
+        if kind not in SKIPPED:
+            tokens.append(Token(kind, text, line, column))
+
+        newlines = text.count('\n')
+        if newlines:
+            line += newlines
+            column = len(text) - text.rfind('\n') - 1
+        else:
+            column += len(text)
+
+    tokens.append(Token('EOF', '<EOF>', line, column))
+    return tokens
+
+
+class ParseError(Exception):
+    def __init__(self, token: Token):
+        super().__init__(token.text)
+        self.token = token
+
+# a hand-written alternative to the ANTLR lexer and parser that builds exactly the same IR as
+# IRBuilder, expressions are parsed by precedence climbing using the precedences ANTLR derives from
+# the order of the `expr` alternatives in Cure.g4 (earlier alternatives bind tighter)
+class Parser:
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.tokens: list[Token] = []
+        self.index = 0
+
+        self.any_type = scope.type_map.get('any')
+
+    def build(self):
+        self.tokens = tokenize(self.scope.src)
+        self.index = 0
+        try:
+            return self.parse_program()
+        except ParseError as e:
+            return e.token.pos.comptime_error(self.scope, f'invalid syntax \'{e.token.text}\'')
+
+    # token helpers
+    def peek(self, offset: int = 0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else self.tokens[-1]
+
+    def next(self):
+        token = self.tokens[self.index]
+        if token.kind != 'EOF':
+            self.index += 1
+
+        return token
+
+    def accept(self, kind: str):
+        if self.tokens[self.index].kind == kind:
+            return self.next()
+
+        return None
+
+    def expect(self, kind: str):
+        token = self.tokens[self.index]
+        if token.kind != kind:
+            raise ParseError(token)
+
+        return self.next()
+
+    # statements
+    def parse_program(self):
+        pos = self.peek().pos
+        nodes = []
+        while self.peek().kind != 'EOF':
+            nodes.append(self.parse_stmt())
+
+        return Program(pos, self.any_type, nodes)
+
+    def parse_stmt(self) -> Node:
+        token = self.peek()
+        match token.kind:
+            case 'mut':
+                return self.parse_var_assign()
+            case 'ID' if self.is_assignment():
+                return self.parse_var_assign()
+            case 'fn':
+                func = self.parse_function_signature()
+                func.body = self.parse_body()
+                return func
+            case 'while':
+                return self.parse_while()
+            case 'if':
+                return self.parse_if()
+            case 'for':
+                return self.parse_for_range()
+            case 'use':
+                self.next()
+                path = self.expect('STRING')
+                return Use(token.pos, self.any_type, path.text[1:-1])
+            case 'extern':
+                return self.parse_extern()
+            case kind if kind in EXPR_START:
+                return self.parse_expr()
+
+        raise ParseError(token)
+
+    def is_assignment(self):
+        return self.peek(1).kind == '=' or (
+            self.peek(1).kind in ASSIGN_OPS and self.peek(2).kind == '='
+        )
+
+    def parse_body_stmt(self) -> Node:
+        token = self.peek()
+        match token.kind:
+            case 'return':
+                self.next()
+                expr = self.parse_expr()
+                return Return(token.pos, expr.type, expr)
+            case 'break':
+                self.next()
+                return Break(token.pos, self.any_type)
+            case 'continue':
+                self.next()
+                return Continue(token.pos, self.any_type)
+
+        return self.parse_stmt()
+
+    def parse_body(self):
+        start = self.expect('{')
+        nodes = []
+        while self.peek().kind != '}':
+            if self.peek().kind == 'EOF':
+                raise ParseError(self.peek())
+
+            nodes.append(self.parse_body_stmt())
+
+        self.next()
+        return Body(start.pos, self.any_type, nodes)
+
+    def parse_var_assign(self):
+        start = self.peek()
+        is_mutable = self.accept('mut') is not None
+        name = self.expect('ID').text
+        op = None
+        if not is_mutable and self.peek().kind in ASSIGN_OPS:
+            op = self.next().text
+
+        self.expect('=')
+        return Variable(start.pos, self.any_type, name, self.parse_expr(), is_mutable, op)
+
+    def parse_if(self):
+        start = self.expect('if')
+        cond = self.parse_expr()
+        body = self.parse_body()
+        elseifs = []
+        while self.peek().kind == 'else' and self.peek(1).kind == 'if':
+            elseif_start = self.next()
+            self.next()
+            elseif_cond = self.parse_expr()
+            elseifs.append(Elseif(elseif_start.pos, self.any_type, elseif_cond, self.parse_body()))
+
+        else_body = None
+        if self.accept('else') is not None:
+            else_body = self.parse_body()
+
+        return If(start.pos, self.any_type, cond, body, else_body, elseifs)
+
+    def parse_while(self):
+        start = self.expect('while')
+        cond = self.parse_expr()
+        return While(start.pos, self.any_type, cond, self.parse_body())
+
+    def parse_for_range(self):
+        start = self.expect('for')
+        name = self.expect('ID').text
+        self.expect('in')
+        range_start = self.parse_expr()
+        self.expect('..')
+        range_end = self.parse_expr()
+        return ForRange(start.pos, self.any_type, name, range_start, range_end, self.parse_body())
+
+    def parse_extern(self):
+        start = self.expect('extern')
+        is_internal = self.accept('internal') is not None
+        if self.accept('class') is not None:
+            name = self.expect('ID').text
+            generic_names = self.parse_generic_params()
+            return Class(
+                start.pos, self.any_type, name, self.parse_body().nodes, generic_names, is_internal
+            )
+
+        is_static = self.accept('static') is not None
+        is_property = self.accept('property') is not None
+        is_method = not is_property and self.accept('method') is not None
+        func = self.parse_function_signature()
+        func.flags.static = is_static
+        func.flags.property = is_property
+        func.flags.method = is_method
+        func.flags.internal = is_internal
+        return func
+
+    def parse_function_signature(self):
+        start = self.expect('fn')
+        extend_type, name = self.parse_func_name()
+        generic_names = self.parse_generic_params()
+        self.expect('(')
+        params = []
+        if self.peek().kind != ')':
+            params.append(self.parse_param())
+            while self.accept(',') is not None:
+                params.append(self.parse_param())
+
+        self.expect(')')
+        ret_type = self.parse_type() if self.accept('->') is not None\
+            else self.scope.type_map.get('nil')
+        return Function(
+            start.pos, self.scope.type_map.get('function'), name, ret_type, params,
+            generic_names=generic_names, extend_type=extend_type
+        )
+
+    def parse_func_name(self) -> tuple[Type | None, str]:
+        token = self.peek()
+        if token.kind in FUNC_NAME_OPS:
+            self.next()
+            return None, token.text
+        elif token.kind == 'new':
+            self.next()
+            return None, 'new'
+        elif token.kind == '(' or (token.kind == 'ID' and self.peek(1).kind in ('.', '[', '&')):
+            extend_type = self.parse_type()
+            self.expect('.')
+            if self.accept('new') is not None:
+                return extend_type, 'new'
+
+            return extend_type, self.expect('ID').text
+
+        return None, self.expect('ID').text
+
+    def parse_generic_params(self):
+        if self.accept('<') is None:
+            return []
+
+        names = [self.expect('ID').text]
+        while self.accept(',') is not None:
+            names.append(self.expect('ID').text)
+
+        self.expect('>')
+        return names
+
+    def parse_param(self):
+        start = self.peek()
+        is_mutable = self.accept('mut') is not None
+        typ = self.parse_type()
+        name = self.expect('ID').text
+        default = self.parse_expr() if self.accept('=') is not None else None
+        return Param(start.pos, typ, name, is_mutable, default)
+
+    def parse_type(self, stop: int | None = None) -> Type:
+        start = self.peek()
+        typ: Type
+        if start.kind == 'ID':
+            self.next()
+            typ = Type(start.pos, start.text)
+        elif start.kind == '(':
+            self.next()
+            param_types = []
+            if self.peek().kind in ('ID', '('):
+                param_types.append(self.parse_type())
+                while self.accept(',') is not None:
+                    param_types.append(self.parse_type())
+
+            self.expect(')')
+            self.expect('->')
+            return_type = self.parse_type(stop)
+            param_types_str = ', '.join(t.codegen(self.scope) for t in param_types)
+            typ = FunctionType(
+                start.pos, f'({param_types_str}) -> {return_type.codegen(self.scope)}',
+                return_type, param_types
+            )
+        else:
+            raise ParseError(start)
+
+        while True:
+            if self.index != stop and self.peek().kind == '[' and self.peek(1).kind == ']':
+                self.index += 2
+                typ = ArrayType(start.pos, f'{typ}[]', typ)
+            elif self.accept('&') is not None:
+                typ = ReferenceType(start.pos, f'{typ.type}', typ)
+            else:
+                return typ
+
+    # expressions
+    def parse_args(self, end: str):
+        args: list[Arg] = []
+        if self.peek().kind == end:
+            self.next()
+            return args
+
+        while True:
+            start = self.peek()
+            label = None
+            if start.kind == 'ID' and self.peek(1).kind == ':':
+                label = start.text
+                self.index += 2
+
+            value = self.parse_expr()
+            args.append(Arg(start.pos, value.type, value, label))
+            if self.accept(',') is None:
+                break
+
+        self.expect(end)
+        return args
+
+    def parse_expr(self, precedence: int = 0) -> Node:
+        left = self.parse_primary()
+        while True:
+            token = self.peek()
+            kind = token.kind
+            if kind in BINARY_OPS:
+                op_precedence, right_precedence = BINARY_OPS[kind]
+                if op_precedence < precedence:
+                    return left
+
+                self.next()
+                right = self.parse_expr(right_precedence)
+                left = Operation(
+                    Position(left.pos.line, left.pos.column), self.any_type, token.text, left, right
+                )
+            elif kind == '.' and ATTRIBUTE_PRECEDENCE >= precedence:
+                if self.peek(1).kind != 'ID':
+                    raise ParseError(self.peek(1))
+
+                pos = Position(left.pos.line, left.pos.column)
+                attr = self.tokens[self.index + 1].text
+                args = self.parse_call_args(2) if self.peek(2).kind == '(' else None
+                if args is None:
+                    self.index += 2
+
+                left = Attribute(pos, self.any_type, left, attr, args)
+            elif kind == 'if' and TERNARY_PRECEDENCE >= precedence and self.is_ternary():
+                self.next()
+                cond = self.parse_expr()
+                self.expect('else')
+                false = self.parse_expr(TERNARY_ELSE_PRECEDENCE)
+                left = Ternary(
+                    Position(left.pos.line, left.pos.column), self.any_type, cond, left, false
+                )
+            else:
+                return left
+
+    def parse_call_args(self, offset: int):
+        """Parses the arguments of a call whose `(` is `offset` tokens ahead. Newlines are not
+significant, so if the arguments are invalid the `(` may instead start the next statement
+(`x.y\n(z)`), in which case nothing is consumed and None is returned."""
+
+        index = self.index
+        self.index += offset + 1
+        try:
+            return self.parse_args(')')
+        except ParseError:
+            self.index = index
+            return None
+
+    def is_ternary(self):
+        """An `if` after an expression is either a ternary or the start of an if statement, which
+is only known once the condition has been parsed and we can see if an `else` follows."""
+
+        index = self.index
+        try:
+            self.next()
+            self.parse_expr()
+            return self.peek().kind == 'else'
+        except ParseError:
+            return False
+        finally:
+            self.index = index
+
+    def is_cast(self):
+        """`(x) y` is a cast if `x` is a type and the closing parenthesis is followed by something
+that can start an expression (but not an assignment statement on the next line), otherwise it
+is a bracketed expression."""
+
+        index = self.index
+        try:
+            self.next()
+            self.parse_type()
+            self.expect(')')
+            return self.peek().kind in EXPR_START and not (
+                self.peek().kind == 'ID' and self.is_assignment()
+            )
+        except ParseError:
+            return False
+        finally:
+            self.index = index
+
+    def parse_primary(self) -> Node:
+        token = self.peek()
+        pos = token.pos
+        match token.kind:
+            case 'INT':
+                self.next()
+                return Int(pos, self.scope.type_map.get('int'), int(token.text))
+            case 'FLOAT':
+                self.next()
+                return Float(pos, self.scope.type_map.get('float'), float(token.text))
+            case 'STRING':
+                self.next()
+                return String(pos, self.scope.type_map.get('string'), token.text[1:-1])
+            case 'BOOL':
+                self.next()
+                return Bool(pos, self.scope.type_map.get('bool'), token.text == 'true')
+            case 'ID':
+                args = self.parse_call_args(1) if self.peek(1).kind == '(' else None
+                if args is None:
+                    self.next()
+                    return Id(pos, self.any_type, token.text)
+
+                return Call(pos, self.any_type, Id(token.pos, self.any_type, token.text), args)
+            case '(':
+                if self.is_cast():
+                    self.next()
+                    typ = self.parse_type()
+                    self.expect(')')
+                    return Cast(pos, typ, self.parse_expr(CAST_OPERAND_PRECEDENCE))
+
+                self.next()
+                expr = self.parse_expr()
+                self.expect(')')
+                return Bracketed(pos, expr.type, expr)
+            case 'new':
+                self.next()
+                type_start = self.index
+                typ = self.parse_type()
+                if self.accept('(') is not None:
+                    return New(pos, self.any_type, typ, self.parse_args(')'))
+                elif self.tokens[self.index - 1].kind != ']':
+                    raise ParseError(self.peek())
+
+                # `new T[]` is a new array of T, so parse the type again without its last []
+                array_start = self.index - 2
+                self.index = type_start
+                typ = self.parse_type(array_start)
+                self.expect('[')
+                self.expect(']')
+                return NewArray(pos, self.any_type, typ)
+            case '[':
+                self.next()
+                return ArrayInit(pos, self.any_type, self.parse_args(']'))
+            case kind if kind in UNARY_OPS:
+                self.next()
+                operand = self.parse_expr(UNARY_OPERAND_PRECEDENCE)
+                return Operation(pos, self.any_type, token.text, operand, None)
+
+        raise ParseError(token)
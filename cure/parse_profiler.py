@@ -0,0 +1,157 @@
+from dataclasses import dataclass, asdict
+from time import perf_counter
+from pathlib import Path
+import json
+
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.PredictionContext import PredictionContextCache
+from antlr4.atn.PredictionMode import PredictionMode
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.dfa.DFA import DFA
+
+from cure.parser.CureParser import CureParser
+from cure.parser.CureLexer import CureLexer
+
+
+@dataclass
+class DecisionInfo:
+    """Statistics for one parse decision, the Python runtime's equivalent of ANTLR's Java
+`DecisionInfo`. Lookahead is counted in tokens, including the first token of the decision."""
+
+    decision: int
+    rule: str
+    invocations: int = 0
+    time: float = 0.0
+    sll_lookahead: int = 0
+    sll_max_lookahead: int = 0
+    sll_atn_transitions: int = 0
+    ll_fallbacks: int = 0
+    ll_lookahead: int = 0
+    ll_max_lookahead: int = 0
+    ll_atn_transitions: int = 0
+    ambiguities: int = 0
+    context_sensitivities: int = 0
+
+    @property
+    def sll_average_lookahead(self):
+        return self.sll_lookahead / self.invocations if self.invocations else 0.0
+
+class ProfilingATNSimulator(ParserATNSimulator):
+    """A prediction simulator that records how much lookahead, time and full-context prediction
+every decision of the grammar needs. The Python runtime has no `ParserATNSimulator` profiling
+support (`Parser.setProfile`), so this mirrors the Java `ProfilingATNSimulator`."""
+
+    def __init__(self, parser: CureParser):
+        super().__init__(parser, parser.atn, parser.decisionsToDFA, parser.sharedContextCache)
+        self.decisions = [
+            DecisionInfo(i, parser.ruleNames[state.ruleIndex])
+            for i, state in enumerate(parser.atn.decisionToState)
+        ]
+        self.current_decision = -1
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+
+    def adaptivePredict(self, input, decision: int, outerContext):
+        self.current_decision = decision
+        self.sll_stop_index = -1
+        self.ll_stop_index = -1
+        start = perf_counter()
+        try:
+            return super().adaptivePredict(input, decision, outerContext)
+        finally:
+            info = self.decisions[decision]
+            info.time += perf_counter() - start
+            info.invocations += 1
+
+            sll_lookahead = self.sll_stop_index - self._startIndex + 1
+            info.sll_lookahead += sll_lookahead
+            info.sll_max_lookahead = max(info.sll_max_lookahead, sll_lookahead)
+            if self.ll_stop_index >= 0:
+                ll_lookahead = self.ll_stop_index - self._startIndex + 1
+                info.ll_lookahead += ll_lookahead
+                info.ll_max_lookahead = max(info.ll_max_lookahead, ll_lookahead)
+
+            self.current_decision = -1
+
+    def getExistingTargetState(self, previousD, t: int):
+        self.sll_stop_index = self._input.index
+        existing = super().getExistingTargetState(previousD, t)
+        if existing is None:
+            self.decisions[self.current_decision].sll_atn_transitions += 1
+
+        return existing
+
+    def computeReachSet(self, closure, t: int, fullCtx: bool):
+        if fullCtx:
+            self.ll_stop_index = self._input.index
+            self.decisions[self.current_decision].ll_atn_transitions += 1
+
+        return super().computeReachSet(closure, t, fullCtx)
+
+    def reportAttemptingFullContext(self, dfa, conflictingAlts, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].ll_fallbacks += 1
+        super().reportAttemptingFullContext(dfa, conflictingAlts, configs, startIndex, stopIndex)
+
+    def reportContextSensitivity(self, dfa, prediction, configs, startIndex, stopIndex):
+        self.decisions[dfa.decision].context_sensitivities += 1
+        super().reportContextSensitivity(dfa, prediction, configs, startIndex, stopIndex)
+
+    def reportAmbiguity(self, dfa, D, startIndex, stopIndex, exact, ambigAlts, configs):
+        self.decisions[dfa.decision].ambiguities += 1
+        super().reportAmbiguity(dfa, D, startIndex, stopIndex, exact, ambigAlts, configs)
+
+
+def reset_parser_dfa():
+    """Clears the DFA that ANTLR caches (per process) for every parse decision."""
+
+    CureParser.decisionsToDFA[:] = [
+        DFA(state, i) for i, state in enumerate(CureParser.atn.decisionToState)
+    ]
+    CureParser.sharedContextCache = PredictionContextCache()
+
+def profile_parse(files: list[Path], sll: bool = False):
+    """Parses every file with an empty DFA cache, returning the statistics of every decision the
+parser had to predict. By default full LL prediction is used so ambiguities are detected, with
+`sll` the SLL prediction that `IRBuilder.parse` tries first is profiled instead."""
+
+    reset_parser_dfa()
+    simulator = None
+    for file in files:
+        parser = CureParser(CommonTokenStream(CureLexer(InputStream(file.read_text('utf-8')))))
+        parser.removeErrorListeners()
+        if simulator is None:
+            simulator = ProfilingATNSimulator(parser)
+        else:
+            simulator.parser = parser
+
+        simulator.predictionMode = PredictionMode.SLL if sll else\
+            PredictionMode.LL_EXACT_AMBIG_DETECTION
+        parser._interp = simulator
+        parser.program()
+
+    if simulator is None:
+        return []
+
+    return [decision for decision in simulator.decisions if decision.invocations > 0]
+
+def profile_table(decisions: list[DecisionInfo]):
+    header = f'{"Decision":>8}  {"Rule":<20}  {"Calls":>7}  {"Time (ms)":>10}  {"SLL avg":>7}  '\
+        f'{"SLL max":>7}  {"LL calls":>8}  {"LL max":>6}  {"Ambig":>5}  {"Ctx sens":>8}'
+    lines = [header, '-' * len(header)]
+    for d in sorted(decisions, key=lambda d: d.time, reverse=True):
+        lines.append(
+            f'{d.decision:>8}  {d.rule:<20}  {d.invocations:>7}  {d.time * 1000:>10.2f}  '\
+            f'{d.sll_average_lookahead:>7.2f}  {d.sll_max_lookahead:>7}  {d.ll_fallbacks:>8}  '\
+            f'{d.ll_max_lookahead:>6}  {d.ambiguities:>5}  {d.context_sensitivities:>8}'
+        )
+
+    lines.append('-' * len(header))
+    total_time = sum(d.time for d in decisions) * 1000
+    total_calls = sum(d.invocations for d in decisions)
+    total_ll = sum(d.ll_fallbacks for d in decisions)
+    lines.append(f'{"Total":>8}  {"":<20}  {total_calls:>7}  {total_time:>10.2f}  {"":>7}  {"":>7}  '\
+        f'{total_ll:>8}')
+    return '\n'.join(lines)
+
+def write_profile_json(path: Path, decisions: list[DecisionInfo]):
+    path.write_text(json.dumps([asdict(decision) for decision in decisions], indent=4))
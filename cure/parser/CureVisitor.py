@@ -1,4 +1,4 @@
-# Generated from cure/Cure.g4 by ANTLR 4.13.0
+# Generated from cure/Cure.g4 by ANTLR 4.13.2
 from antlr4 import *
 if "." in __name__:
     from .CureParser import CureParser
@@ -159,21 +159,11 @@ class CureVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CureParser#method.
-    def visitMethod(self, ctx:CureParser.MethodContext):
-        return self.visitChildren(ctx)
-
-
     # Visit a parse tree produced by CureParser#arrayInit.
     def visitArrayInit(self, ctx:CureParser.ArrayInitContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CureParser#newArray.
-    def visitNewArray(self, ctx:CureParser.NewArrayContext):
-        return self.visitChildren(ctx)
-
-
     # Visit a parse tree produced by CureParser#unary.
     def visitUnary(self, ctx:CureParser.UnaryContext):
         return self.visitChildren(ctx)
@@ -209,23 +199,18 @@ class CureVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CureParser#property.
-    def visitProperty(self, ctx:CureParser.PropertyContext):
-        return self.visitChildren(ctx)
-
-
     # Visit a parse tree produced by CureParser#relational.
     def visitRelational(self, ctx:CureParser.RelationalContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CureParser#id.
-    def visitId(self, ctx:CureParser.IdContext):
+    # Visit a parse tree produced by CureParser#multiplication.
+    def visitMultiplication(self, ctx:CureParser.MultiplicationContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CureParser#multiplication.
-    def visitMultiplication(self, ctx:CureParser.MultiplicationContext):
+    # Visit a parse tree produced by CureParser#attribute.
+    def visitAttribute(self, ctx:CureParser.AttributeContext):
         return self.visitChildren(ctx)
 
 
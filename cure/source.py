@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from itertools import accumulate
+from pathlib import Path
+
+from cure.log import debug
+
+
+@dataclass
+class SourceFile:
+    """The text of a source file and the offset every line starts at, shared by every scope of the
+file."""
+
+    path: Path
+    text: str
+    mtime_ns: int
+    line_offsets: list[int]
+
+    @staticmethod
+    def read(path: Path):
+        text = path.read_text()
+        lines = text.split('\n')
+        if len(lines) > 1 and lines[-1] == '': # a trailing newline does not start another line
+            lines.pop()
+
+        line_offsets = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+        return SourceFile(path, text, path.stat().st_mtime_ns, line_offsets)
+
+    @property
+    def line_count(self):
+        return len(self.line_offsets) if self.text else 0
+
+    def line(self, number: int):
+        """The text of line `number` (starting at 1) without its line ending."""
+
+        if number < 1 or number > self.line_count:
+            return ''
+
+        start = self.line_offsets[number - 1]
+        end = self.line_offsets[number] if number < len(self.line_offsets) else len(self.text)
+        return self.text[start:end].rstrip('\r\n')
+
+@dataclass
+class SourceManager:
+    """Loads every source file once per process. A file is only read again when it changed on disk
+since it was loaded."""
+
+    files: dict[Path, SourceFile] = field(default_factory=dict)
+    reads: int = 0
+
+    def get(self, path: Path):
+        source = self.files.get(path)
+        if source is not None and source.mtime_ns == path.stat().st_mtime_ns:
+            return source
+
+        debug(f'Reading source file {path}')
+        source = SourceFile.read(path)
+        self.files[path] = source
+        self.reads += 1
+        return source
+
+    def forget(self, path: Path):
+        self.files.pop(path, None)
+
+
+sources = SourceManager()
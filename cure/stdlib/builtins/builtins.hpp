@@ -19,7 +19,7 @@
 
 using nil = std::nullptr_t;
 
-void error(const char* s, ...) {
+inline void error(const char* s, ...) {
     va_list args;
     va_start(args, s);
     
@@ -345,9 +345,9 @@ public:
 };
 
 
-static array<string> args;
+inline array<string> args;
 
-void error(const string s, ...) {
+inline void error(const string s, ...) {
     va_list args;
     va_start(args, s);
     
@@ -360,13 +360,13 @@ void error(const string s, ...) {
 }
 
 
-string to_string(int i) { return std::to_string(i); }
-string to_string(float f) { return std::to_string(f); }
-string to_string(const string& s) { return s; }
-string to_string(bool b) { return b ? "true" : "false"; }
-string to_string(nil _) { return (string)"nil"; }
-string to_string(const StringBuilder& sb) { return sb.ss.str(); }
-string to_string(const Vector2& v) {
+inline string to_string(int i) { return std::to_string(i); }
+inline string to_string(float f) { return std::to_string(f); }
+inline string to_string(const string& s) { return s; }
+inline string to_string(bool b) { return b ? "true" : "false"; }
+inline string to_string(nil _) { return (string)"nil"; }
+inline string to_string(const StringBuilder& sb) { return sb.ss.str(); }
+inline string to_string(const Vector2& v) {
     return "Vector2(x=" + to_string(v.x()) + ", y=" + to_string(v.y()) + ")";
 }
 
@@ -384,39 +384,39 @@ string to_string(const array<T>& arr) {
     return ss.str();
 }
 
-int int_max(void) { return std::numeric_limits<int>::max(); }
-int int_min(void) { return std::numeric_limits<int>::min(); }
-
-float float_max(void) { return std::numeric_limits<float>::max(); }
-float float_min(void) { return std::numeric_limits<float>::min(); }
-float float_decimal(float x) { return std::fmod(x, 1); }
-int float_integer(float x) { return static_cast<int>(x); }
-
-float Math_pi(void) { return M_PI; }
-float Math_e(void) { return M_E; }
-float Math_abs(float x) { return std::abs(x); }
-int Math_abs(int x) { return std::abs(x); }
-float Math_sqrt(float x) { return std::sqrtf((int)x); }
-int Math_sqrt(int x) { return std::sqrtf((int)x); }
-int Math_floor(float x) { return std::floorf(x); }
-int Math_ceil(float x) { return std::ceilf(x); }
-int Math_round(float x) { return std::roundf(x); }
-float Math_round(float x, int precision) {
+inline int int_max(void) { return std::numeric_limits<int>::max(); }
+inline int int_min(void) { return std::numeric_limits<int>::min(); }
+
+inline float float_max(void) { return std::numeric_limits<float>::max(); }
+inline float float_min(void) { return std::numeric_limits<float>::min(); }
+inline float float_decimal(float x) { return std::fmod(x, 1); }
+inline int float_integer(float x) { return static_cast<int>(x); }
+
+inline float Math_pi(void) { return M_PI; }
+inline float Math_e(void) { return M_E; }
+inline float Math_abs(float x) { return std::abs(x); }
+inline int Math_abs(int x) { return std::abs(x); }
+inline float Math_sqrt(float x) { return std::sqrtf((int)x); }
+inline int Math_sqrt(int x) { return std::sqrtf((int)x); }
+inline int Math_floor(float x) { return std::floorf(x); }
+inline int Math_ceil(float x) { return std::ceilf(x); }
+inline int Math_round(float x) { return std::roundf(x); }
+inline float Math_round(float x, int precision) {
     precision = std::pow(10, precision);
     return std::roundf(x * precision) / precision;
 }
 
 
-void cure_init(int argc, char* argv[]) {
+inline void cure_init(int argc, char* argv[]) {
     args = array<string>(argc);
     for (int i = 0; i < argc; ++i)
         args.set(i, argv[i]);
 }
 
-array<string> System_args(void) { return args; }
+inline array<string> System_args(void) { return args; }
 
-string System_cwd(void) { return std::filesystem::current_path().string(); }
-int System_pid(void) { // TODO: test if this works on all the target platforms
+inline string System_cwd(void) { return std::filesystem::current_path().string(); }
+inline int System_pid(void) { // TODO: test if this works on all the target platforms
 #if WINDOWS
     return _getpid();
 #else
@@ -424,43 +424,43 @@ int System_pid(void) { // TODO: test if this works on all the target platforms
 #endif
 }
 
-nil System_exit(int code = 0) {
+inline nil System_exit(int code = 0) {
     std::exit(code);
     return nil();
 }
 
-nil System_sleep(int ms) {
+inline nil System_sleep(int ms) {
     std::this_thread::sleep_for(std::chrono::milliseconds(ms));
     return nil();
 }
 
 
-int Random_next(int min, int max) {
+inline int Random_next(int min, int max) {
     std::random_device dev;
     std::mt19937 rng(dev());
     std::uniform_int_distribution<std::mt19937::result_type> dist(min, max);
     return dist(rng);
 }
 
-int Random_next(int max) { return Random_next(0, max); }
-float Random_next_float() { return static_cast<float>(Random_next(0, 100) / 100); }
-float Random_next_float(float min, float max) { return min + (max - min) * Random_next_float(); }
-float Random_next_float(float max) { return Random_next_float(0, max); }
+inline int Random_next(int max) { return Random_next(0, max); }
+inline float Random_next_float() { return static_cast<float>(Random_next(0, 100) / 100); }
+inline float Random_next_float(float min, float max) { return min + (max - min) * Random_next_float(); }
+inline float Random_next_float(float max) { return Random_next_float(0, max); }
 
 
-int int_add_int(int a, int b) {
+inline int int_add_int(int a, int b) {
     if ((b > 0) && (a > std::numeric_limits<int>::max() - b)) error("overflow");
     if ((b < 0) && (a < std::numeric_limits<int>::min() - b)) error("underflow");
     return a + b;
 }
 
-int int_sub_int(int a, int b) {
+inline int int_sub_int(int a, int b) {
     if ((b < 0) && (a > std::numeric_limits<int>::max() + b)) error("overflow");
     if ((b > 0) && (a < std::numeric_limits<int>::min() + b)) error("underflow");
     return a - b;
 }
 
-int int_mul_int(int a, int b) {
+inline int int_mul_int(int a, int b) {
     if (a == 0 || b == 0) return 0;
     if ((a == -1 && b == std::numeric_limits<int>::min())
         || (b == -1 && a == std::numeric_limits<int>::min())
@@ -470,61 +470,61 @@ int int_mul_int(int a, int b) {
     return a * b;
 }
 
-int int_div_int(int a, int b) {
+inline int int_div_int(int a, int b) {
     if (b == 0) error("division by zero");
     return a / b;
 }
 
-int int_mod_int(int a, int b) {
+inline int int_mod_int(int a, int b) {
     if (b == 0) error("modulo by zero");
     return a % b;
 }
 
-int add_int(int a) { return +a; }
-int sub_int(int a) { return -a; }
+inline int add_int(int a) { return +a; }
+inline int sub_int(int a) { return -a; }
 
-float float_add_float(float a, float b) {
+inline float float_add_float(float a, float b) {
     float c = a + b;
     if (std::isinf(c)) error("overflow");
     return c;
 }
 
-float float_sub_float(float a, float b) {
+inline float float_sub_float(float a, float b) {
     float c = a - b;
     if (std::isinf(c)) error("underflow");
     return c;
 }
 
-float float_mul_float(float a, float b) {
+inline float float_mul_float(float a, float b) {
     float c = a * b;
     if (std::isinf(c)) error("overflow");
     return c;
 }
 
-float float_div_float(float a, float b) {
+inline float float_div_float(float a, float b) {
     if (b == 0) error("division by zero");
     return a / b;
 }
 
-float float_mod_float(float a, float b) {
+inline float float_mod_float(float a, float b) {
     if (b == 0) error("modulo by zero");
     return std::fmod(a, b);
 }
 
-float add_float(float a) { return +a; }
-float sub_float(float a) { return -a; }
+inline float add_float(float a) { return +a; }
+inline float sub_float(float a) { return -a; }
 
-float float_add_int(float a, int b) { return float_add_float(a, (float)b); }
-float float_sub_int(float a, int b) { return float_sub_float(a, (float)b); }
-float float_mul_int(float a, int b) { return float_mul_float(a, (float)b); }
-float float_div_int(float a, int b) { return float_div_float(a, (float)b); }
-float float_mod_int(float a, int b) { return float_mod_float(a, (float)b); }
+inline float float_add_int(float a, int b) { return float_add_float(a, (float)b); }
+inline float float_sub_int(float a, int b) { return float_sub_float(a, (float)b); }
+inline float float_mul_int(float a, int b) { return float_mul_float(a, (float)b); }
+inline float float_div_int(float a, int b) { return float_div_float(a, (float)b); }
+inline float float_mod_int(float a, int b) { return float_mod_float(a, (float)b); }
 
-float int_add_float(int a, float b) { return float_add_float((float)a, b); }
-float int_sub_float(int a, float b) { return float_sub_float((float)a, b); }
-float int_mul_float(int a, float b) { return float_mul_float((float)a, b); }
-float int_div_float(int a, float b) { return float_div_float((float)a, b); }
-float int_mod_float(int a, float b) { return float_mod_float((float)a, b); }
+inline float int_add_float(int a, float b) { return float_add_float((float)a, b); }
+inline float int_sub_float(int a, float b) { return float_sub_float((float)a, b); }
+inline float int_mul_float(int a, float b) { return float_mul_float((float)a, b); }
+inline float int_div_float(int a, float b) { return float_div_float((float)a, b); }
+inline float int_mod_float(int a, float b) { return float_mod_float((float)a, b); }
 
 template<typename T>
 nil print(const T& s) {
@@ -532,42 +532,42 @@ nil print(const T& s) {
     return nil();
 }
 
-nil print_literal(const string& s) {
+inline nil print_literal(const string& s) {
     std::cout << s;
     return nil();
 }
 
-string input(void) {
+inline string input(void) {
     std::string s;
     std::getline(std::cin, s);
     return s;
 }
 
-string input(const string& prompt) {
+inline string input(const string& prompt) {
     std::cout << prompt;
     return input();
 }
 
-nil assert(bool b, const string& msg) {
+inline nil assert(bool b, const string& msg) {
     if (!b) error(msg);
     return nil();
 }
 
-nil assert(bool b) { return assert(b, "assertion failed"); }
+inline nil assert(bool b) { return assert(b, "assertion failed"); }
 
-array<int> range(int end) {
+inline array<int> range(int end) {
     array<int> arr;
     for (int i = 0; i < end; i++) arr.add(i);
     return arr;
 }
 
-array<int> range(int start, int end) {
+inline array<int> range(int start, int end) {
     array<int> arr;
     for (int i = start; i < end; i++) arr.add(i);
     return arr;
 }
 
-array<int> range(int start, int end, int step) {
+inline array<int> range(int start, int end, int step) {
     array<int> arr;
     for (int i = start; i < end; i += step) arr.add(i);
     return arr;
@@ -33,7 +33,7 @@ public:
     }
 };
 
-string to_string(const Color& color) {
+inline string to_string(const Color& color) {
     return "Color(r=" + to_string(color.r()) + ", g=" + to_string(color.g()) + ", b=" +
         to_string(color.b()) + ")";
 }
@@ -72,4 +72,4 @@ public:
     }
 };
 
-string to_string(const File& file) { return "File('" + file.path.string() + "')"; }
+inline string to_string(const File& file) { return "File('" + file.path.string() + "')"; }
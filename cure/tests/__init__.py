@@ -1,61 +1,567 @@
-from contextlib import suppress
-from subprocess import run
+from dataclasses import dataclass, field, is_dataclass, fields
+from contextlib import contextmanager
+from subprocess import run, Popen, PIPE
+from tempfile import TemporaryDirectory
 from shutil import rmtree
 from pathlib import Path
+from os import environ, chdir
+import json
+import sys
 
 from colorama import Fore, Style
 
-from cure import create_scope, compile_to_str, compile_to_exe
+from cure.compiler import (
+    create_scope, compile_to_exe, compile_many, get_frontend, CompileResult, FRONTENDS
+)
+from cure.diagnostics import CompileError
 
 
-def format_file(file: Path):
-    return file.relative_to(Path.cwd()).as_posix()
+def format_file(file: Path | str):
+    return file.relative_to(Path.cwd()).as_posix() if isinstance(file, Path) else file
 
-def test_compiler():
-    compiler_dir = Path.cwd() / 'cure' / 'tests' / 'compiler'
-    files = list(compiler_dir.glob('*.cure'))
-    num_files = len(files)
+def check_results(results: list[CompileResult]):
+    """Files starting with `pass` must compile and files starting with `fail` must not."""
 
     fails = []
-    for file in files:
-        print(f'Compiling file {file.as_posix()}')
-        if file.stem.startswith('pass'):
-            try:
-                scope = create_scope(file)
-                compile_to_str(scope)
-            except SystemExit:
-                fails.append(file)
-        elif file.stem.startswith('fail'):
-            with suppress(SystemExit):
-                scope = create_scope(file)
-                compile_to_str(scope)
-                fails.append(file)
+    for result in results:
+        print(f'Compiled file {result.file.as_posix()}' if result.error is None else\
+              f'Compiled file {result.file.as_posix()} ({result.error})')
+        if result.file.stem.startswith('pass') and result.error is not None:
+            fails.append(result.file)
+        elif result.file.stem.startswith('fail') and result.error is None:
+            fails.append(result.file)
     
-    return fails, num_files
+    return fails
+
+@dataclass
+class Checks:
+    """The checks a test ran and the ones that failed."""
+
+    fails: list[Path | str] = field(default_factory=list)
+    count: int = 0
+
+    def check(self, passed: bool, failure: Path | str):
+        self.count += 1
+        if not passed:
+            self.fails.append(failure)
+        
+        return passed
+    
+    def result(self):
+        return self.fails, self.count
+
+@contextmanager
+def temporary_project(message: str):
+    """Prints what the test does and runs it in a temporary directory, which is the working
+directory meanwhile as `use` resolves local modules from it."""
+
+    print(message)
+    cwd = Path.cwd()
+    with TemporaryDirectory() as directory:
+        chdir(directory)
+        try:
+            yield Path(directory)
+        finally:
+            chdir(cwd)
+
+def test_compiler():
+    compiler_dir = Path.cwd() / 'cure' / 'tests' / 'compiler'
+    files = list(compiler_dir.glob('*.cure'))
+    return check_results(compile_many(files)), len(files)
 
 def test_examples():
     examples_dir = Path.cwd() / 'examples'
     files = list(examples_dir.rglob('*.cure'))
+    return check_results(compile_many(files)), len(files)
+
+def same_ir(a, b) -> bool:
+    if type(a) is not type(b):
+        return False
+    elif isinstance(a, list):
+        return len(a) == len(b) and all(same_ir(x, y) for x, y in zip(a, b))
+    elif is_dataclass(a):
+        return all(same_ir(getattr(a, f.name), getattr(b, f.name)) for f in fields(a))
+    
+    return a == b
+
+def test_frontends():
+    """Every front end must build the same IR (including positions) for every file, or all of them
+must fail on it."""
+
+    root = Path.cwd()
+    files = list((root / 'cure' / 'tests' / 'compiler').glob('*.cure'))
+    files += list((root / 'examples').rglob('*.cure'))
     num_files = len(files)
 
     fails = []
     for file in files:
-        print(f'Compiling file {file.as_posix()}')
-        scope = create_scope(file)
-        if file.stem.startswith('pass'):
+        print(f'Parsing file {file.as_posix()} with {", ".join(FRONTENDS)}')
+        results = []
+        for name in FRONTENDS:
             try:
-                scope = create_scope(file)
-                compile_to_str(scope)
-            except SystemExit:
-                fails.append(file)
-        elif file.stem.startswith('fail'):
-            with suppress(SystemExit):
-                scope = create_scope(file)
-                compile_to_str(scope)
-                fails.append(file)
+                results.append(get_frontend(name)(create_scope(file)).build())
+            except CompileError:
+                results.append(None)
+        
+        first = results[0]
+        if not all(
+            (first is None and result is None) or
+            (first is not None and result is not None and same_ir(first, result))
+            for result in results[1:]
+        ):
+            fails.append(file)
     
     return fails, num_files
 
+def test_dfa_snapshot():
+    """Parsing with a parser DFA restored from a snapshot must give the same parse tree as parsing
+with the DFA it was taken from."""
+
+    from cure.dfa_cache import take_snapshot, restore_snapshot, load_dfa
+    from cure.parse_profiler import reset_parser_dfa
+    from cure.parser.CureParser import CureParser
+    from cure.ir_builder import IRBuilder
+
+    root = Path.cwd()
+    files = list((root / 'cure' / 'tests' / 'compiler').glob('*.cure'))
+    files += list((root / 'examples').rglob('*.cure'))
+
+    def parse_trees():
+        trees = []
+        for file in files:
+            try:
+                trees.append(IRBuilder(create_scope(file)).parse().toStringTree(recog=CureParser))
+            except CompileError:
+                trees.append(None)
+        
+        return trees
+
+    print(f'Parsing {len(files)} files with a snapshot of the parser DFA')
+    load_dfa() # the cached DFA is loaded before resetting, so the first parse starts empty
+    reset_parser_dfa()
+    expected = parse_trees()
+    snapshot = take_snapshot(CureParser.decisionsToDFA)
+    reset_parser_dfa()
+    CureParser.decisionsToDFA[:] = restore_snapshot(CureParser, snapshot)
+    fails = [file for file, tree, expected_tree in zip(files, parse_trees(), expected)
+             if tree != expected_tree]
+    return fails, len(files)
+
+def test_daemon():
+    """A daemon must report the same errors as compiling in-process, also when it answers from the
+result of an earlier check, which it must not do once a module the file uses changed."""
+
+    from cure.daemon import HAS_UNIX_SOCKETS, Daemon, request
+
+    if not HAS_UNIX_SOCKETS:
+        print('Skipping the daemon tests, this platform has no Unix domain sockets')
+        return [], 0
+
+    files = list((Path.cwd() / 'cure' / 'tests' / 'compiler').glob('*.cure'))
+    expected = {result.file: result.error is None for result in compile_many(files)}
+
+    checks = Checks()
+    with TemporaryDirectory() as directory:
+        socket_path = Path(directory) / 'daemon.sock'
+        main_file = Path(__file__).parent.parent.parent / 'main.py'
+        daemon = Popen([sys.executable, main_file.as_posix(), 'daemon', 'start'], stdout=PIPE,
+                       env=environ | {'CURE_DAEMON_SOCKET': socket_path.as_posix()}, text=True)
+        try:
+            assert daemon.stdout is not None
+            daemon.stdout.readline() # printed once the daemon is listening
+            for _ in range(2): # the second round is answered from the daemon's earlier checks
+                for file in files:
+                    print(f'Checking file {file.as_posix()} with the daemon')
+                    response = request({
+                        'action': 'check', 'file': file.as_posix(), 'cwd': Path.cwd().as_posix()
+                    }, socket_path)
+                    checks.check(
+                        response is not None and (response['returncode'] == 0) == expected[file],
+                        f'{format_file(file)} (daemon)'
+                    )
+        finally:
+            request({'action': 'stop'}, socket_path)
+            daemon.wait(10)
+    
+    with temporary_project('Checking a file again with the daemon after fixing the module it uses')\
+            as directory:
+        module_file = directory / 'module.cure'
+        main_file = directory / 'main.cure'
+        module_file.write_text('fn helper() -> int {\n    return missing\n}\n')
+        main_file.write_text('use "module.cure"\n\nfn main() -> int {\n    return helper()\n}\n')
+        server = Daemon()
+        server.compile('check', main_file, 'antlr', directory)
+        module_file.write_text('fn helper() -> int {\n    return 1\n}\n')
+        checks.check(
+            server.compile('check', main_file, 'antlr', directory)['returncode'] == 0,
+            'daemon (fixed module not checked again)'
+        )
+    
+    return checks.result()
+
+def test_watch():
+    """Watch mode must notice a change to a used module, also one that failed to compile, and the
+rebuild must compile the changed module again instead of using the cached one."""
+
+    from threading import Timer
+
+    from cure.watch import watched_files, wait_for_changes, rebuild
+    from cure.compiler import compile_to_str
+
+    def change_while_waiting(files: list[Path], file: Path, text: str):
+        timer = Timer(0.2, file.write_text, [text])
+        timer.start()
+        changed = wait_for_changes(files, interval=0.05, debounce=0.05, timeout=5)
+        timer.join()
+        return changed
+
+    checks = Checks()
+    with temporary_project('Testing watch mode') as directory:
+        module_file = directory / 'module.cure'
+        main_file = directory / 'main.cure'
+        module_file.write_text('fn helper() -> int {\n    return 1\n}\n')
+        main_file.write_text(f'use "{module_file.as_posix()}"\n\nfn main() -> int {{\n'\
+                             '    print(helper())\n    return 0\n}\n')
+        header_file = directory / 'module_header.hpp'
+
+        print(f'Watching {main_file.as_posix()}')
+        scope = create_scope(main_file)
+        compile_to_str(scope)
+        files = watched_files(scope)
+        checks.check(main_file in files and module_file in files, 'watch (module not watched)')
+
+        changed = change_while_waiting(
+            files, module_file, 'fn helper() -> int {\n    return 2\n}\n'
+        )
+        checks.check(changed == [module_file], f'watch (changed files {changed})')
+
+        compile_to_str(create_scope(main_file))
+        checks.check(
+            'return 2' in header_file.read_text(), 'watch (changed module not compiled again)'
+        )
+
+        print(f'Watching {main_file.as_posix()} while the module it uses has an error')
+        module_file.write_text('fn helper() -> int {\n    return missing\n}\n')
+        files = rebuild(main_file, 'antlr', 1)
+        changed = change_while_waiting(
+            files, module_file, 'fn helper() -> int {\n    return 3\n}\n'
+        )
+        checks.check(changed == [module_file], f'watch (fixed module, changed files {changed})')
+    
+    return checks.result()
+
+def test_symbol_tables():
+    """A child scope must see its parent's symbols and types, shadow them with its own definitions
+and hide a removed one, without changing the parent."""
+
+    from cure.ir import Symbol, PrimitiveType, Position
+
+    checks = Checks()
+    with temporary_project('Testing scope lookups') as directory:
+        file = directory / 'scopes.cure'
+        file.write_text('')
+        scope = create_scope(file)
+        int_type = scope.type_map.get('int')
+        scope.symbol_table.add(Symbol('x', int_type, None))
+        child = scope.make_child().make_child()
+        checks.check(
+            child.symbol_table.get('x') is not None and child.symbol_table.get('print') is not None,
+            'scopes (parent symbol not found)'
+        )
+
+        child.symbol_table.add(Symbol('x', scope.type_map.get('float'), None))
+        checks.check(
+            scope.symbol_table.get('x').type == int_type, 'scopes (shadowing changed the parent)'
+        )
+
+        child.type_map.add(PrimitiveType(Position.zero(), 'T'))
+        child.type_map.remove('int')
+        checks.check(
+            not child.type_map.has('int') and child.type_map.has('T') and\
+                scope.type_map.has('int') and not scope.type_map.has('T'),
+            'scopes (removed type)'
+        )
+
+        # a child must see what its parent defines after the child was created, also when the
+        # parent was empty before
+        parent = scope.make_child()
+        child = parent.make_child()
+        parent.symbol_table.add(Symbol('y', int_type, None))
+        parent.type_map.add(PrimitiveType(Position.zero(), 'U'))
+        checks.check(
+            child.symbol_table.get('y') is not None and child.type_map.has('U'),
+            'scopes (symbol defined after the child scope)'
+        )
+    
+    return checks.result()
+
+def test_interned_types():
+    """Every use of a type, including generic class instances, must get its one interned object, and
+the interned types of compiled files must be freed once nothing uses them, so a long running
+process does not keep every type it analysed."""
+
+    from gc import collect
+
+    from cure.compiler import parse
+    from cure.ir import interned_types, interned_keys
+
+    checks = Checks()
+    with temporary_project('Testing interned types') as directory:
+        file = directory / 'arrays.cure'
+        file.write_text('fn main() -> int {\n    a = [1, 2]\n    b = [3, 4]\n    return 0\n}\n')
+        scope = create_scope(file, jobs=1)
+        main = parse(scope).analyse(scope).nodes[0]
+        a, b = [node.type for node in main.body.nodes[:2]]
+        checks.check(
+            a is b and a.intern() is a, 'interned types (array instances are different objects)'
+        )
+
+        files = []
+        for depth in range(1, 21):
+            file = directory / f'arrays{depth}.cure'
+            file.write_text(f'fn main() -> int {{\n    x = {"[" * depth}1{"]" * depth}\n'\
+                            '    return 0\n}\n')
+            files.append(file)
+
+        compile_many(files[:1]) # interns the types of the standard library
+        collect()
+        types_before, keys_before = len(interned_types), len(interned_keys)
+        compile_many(files[1:])
+        collect()
+        checks.check(
+            len(interned_types) <= types_before and len(interned_keys) <= keys_before,
+            f'interned types ({len(interned_types) - types_before} types and '\
+            f'{len(interned_keys) - keys_before} keys kept)'
+        )
+    
+    return checks.result()
+
+def test_visitor():
+    """`NodeVisitor` must visit every node before its children and `NodeTransformer` must rebuild
+only the nodes whose children changed, both without recursing into deeply nested trees."""
+
+    from cure.visitor import NodeVisitor, NodeTransformer
+    from cure.ir import Bracketed, Int, Operation, Position
+
+    class IntCollector(NodeVisitor):
+        def __init__(self):
+            self.values: list[int] = []
+
+        def visit_Int(self, node):
+            self.values.append(node.value)
+
+    class IntIncrementer(NodeTransformer):
+        def visit_Int(self, node):
+            return Int(node.pos, node.type, node.value + 1)
+
+    checks = Checks()
+    with temporary_project('Testing the IR visitor and transformer') as directory:
+        file = directory / 'visitor.cure'
+        file.write_text('')
+        int_type = create_scope(file).type_map.get('int')
+        pos = Position.zero()
+        left = Bracketed(pos, int_type, Int(pos, int_type, 1))
+        tree = Operation(pos, int_type, '+', left, Int(pos, int_type, 2))
+        collector = IntCollector()
+        collector.visit(tree)
+        checks.check(collector.values == [1, 2], f'visitor (visited {collector.values})')
+
+        transformed = IntIncrementer().visit(tree)
+        expected = Operation(
+            pos, int_type, '+', Bracketed(pos, int_type, Int(pos, int_type, 2)),
+            Int(pos, int_type, 3)
+        )
+        checks.check(
+            transformed == expected and tree.left is left, 'visitor (transformed tree)'
+        )
+
+        chain = Int(pos, int_type, 0)
+        for _ in range(sys.getrecursionlimit() * 2):
+            chain = Bracketed(pos, int_type, chain)
+
+        collector = IntCollector()
+        collector.visit(IntIncrementer().visit(chain))
+        checks.check(collector.values == [1], 'visitor (nested tree)')
+    
+    return checks.result()
+
+def test_modules():
+    """The modules of a project must be compiled in worker processes and the file using them must
+compile to the same code as when they are compiled one after another, and a `use` in a string or a
+comment must not make a file a module."""
+
+    from cure.tests.bench import synthetic_project
+    from cure.modules import compile_modules, import_graph
+    from cure.compiler import compile_to_str
+
+    checks = Checks()
+    with temporary_project('Testing the parallel compilation of modules') as directory:
+        main_file = synthetic_project(directory, 2, 3, 1)
+        print(f'Compiling the modules of {main_file.as_posix()} in 2 processes')
+        compiled = compile_modules(main_file, jobs=2)
+        checks.check(compiled == 6, f'modules (compiled {compiled} of 6 modules)')
+        # headers and interfaces are written to temporary files and moved into place
+        temp_files = list(directory.rglob('*.tmp'))
+        checks.check(not temp_files, f'modules ({len(temp_files)} temporary files left)')
+
+        code = compile_to_str(create_scope(main_file, jobs=2))
+        # without their headers the cached modules are not current and are compiled again
+        for file in directory.glob('*_header.hpp'):
+            file.unlink()
+        
+        checks.check(
+            compile_to_str(create_scope(main_file, jobs=1)) == code, 'modules (different code)'
+        )
+
+        file = directory / 'not_uses.cure'
+        file.write_text('// use "module0_0.cure"\n/* use "module0_1.cure" */\n'\
+                        'fn main() -> int {\n    print("use \'module0_2.cure\'")\n    return 0\n}\n')
+        graph = import_graph(file)
+        checks.check(not graph, f'modules ({len(graph)} modules used in strings and comments)')
+    
+    return checks.result()
+
+def test_module_registry():
+    """A module used through several modules must be compiled once per compilation and its header
+included once, and the checked-in standard library manifest must list the standard library's
+files (see `cure stdlib manifest`)."""
+
+    from cure.manifest import MANIFEST_PATH, generate_manifest
+    from cure.tests.bench import synthetic_project
+    from cure.compiler import compile_to_str
+
+    checks = Checks()
+    with temporary_project('Testing the module registry and the standard library manifest')\
+            as directory:
+        checks.check(
+            json.loads(MANIFEST_PATH.read_text()) == json.loads(json.dumps(generate_manifest())),
+            'module registry (stdlib manifest is out of date)'
+        )
+
+        main_file = synthetic_project(directory, 3, 3, 1)
+        scope = create_scope(main_file, jobs=1)
+        code = compile_to_str(scope)
+        # the modules of the project and the builtins wrapper
+        checks.check(
+            len(scope.modules) == 10, f'module registry ({len(scope.modules)} modules used)'
+        )
+
+        includes = [line for line in code.splitlines() if line.startswith('#include')]
+        checks.check(
+            len(scope.dependencies) == len(set(scope.dependencies)) and\
+                len(includes) == len(set(includes)),
+            'module registry (duplicate dependencies)'
+        )
+    
+    return checks.result()
+
+def test_module_interfaces():
+    """Compiling a project again must reuse the interface files of its unchanged modules and leave
+their headers untouched, and only compile a changed module again."""
+
+    from cure.tests.bench import synthetic_project
+    from cure.compiler import compile_to_str
+
+    def modification_times(directory: Path):
+        files = list(directory.glob('*_header.hpp')) + list(directory.glob('build/modules/*'))
+        return {file.name: file.stat().st_mtime_ns for file in files}
+
+    checks = Checks()
+    with temporary_project('Testing module interface files') as directory:
+        main_file = synthetic_project(directory, 2, 2, 1)
+        code = compile_to_str(create_scope(main_file, jobs=1))
+        before = modification_times(directory)
+        checks.check(
+            len([name for name in before if name.endswith('.interface')]) == 4,
+            'module interfaces (interface files not written)'
+        )
+
+        checks.check(
+            compile_to_str(create_scope(main_file, jobs=1)) == code and\
+                modification_times(directory) == before,
+            'module interfaces (unchanged modules compiled again)'
+        )
+
+        changed_file = directory / 'module1_0.cure'
+        changed_file.write_text(
+            changed_file.read_text() + '\nfn added() -> int {\n    return 1\n}\n'
+        )
+        compile_to_str(create_scope(main_file, jobs=1))
+        after = modification_times(directory)
+        changed = sorted(name for name in after if after[name] != before[name])
+        checks.check(
+            changed == ['module1_0.interface', 'module1_0_header.hpp'],
+            f'module interfaces (changed {", ".join(changed)})'
+        )
+    
+    return checks.result()
+
+def test_separate_compilation():
+    """With `--separate`, every module must be compiled to its own C++ source file, listed as a
+source of the build, its header must only declare its functions and a change to a function body
+must only rewrite that module's source file."""
+
+    from cure.tests.bench import synthetic_project
+    from cure.compiler import compile_to_str, write_build_files
+
+    def sources(directory: Path):
+        return {file.name: file.read_text() for file in directory.rglob('*.[ch]pp')}
+
+    checks = Checks()
+    with temporary_project('Testing separate compilation of modules') as directory:
+        main_file = synthetic_project(directory, 2, 2, 1)
+        scope = create_scope(main_file, jobs=1, separate=True)
+        cmakelists = write_build_files(
+            scope, compile_to_str(scope), directory / 'build', main_file.stem
+        )
+        source_files = sorted(directory.glob('build/modules/*.cpp'))
+        checks.check(
+            len(source_files) == 4 and\
+                all(file.as_posix() in cmakelists.read_text() for file in source_files),
+            'separate compilation (modules not listed as sources)'
+        )
+
+        header = (directory / 'module1_0_header.hpp').read_text()
+        declarations = [line for line in header.splitlines() if line and not line.startswith('#')]
+        checks.check(
+            declarations == ['int work2(int a, int b);', 'int uses2(void);'],
+            f'separate compilation (header declares {declarations})'
+        )
+
+        before = sources(directory)
+        changed_file = directory / 'module1_0.cure'
+        changed_file.write_text(changed_file.read_text().replace('total > 100', 'total > 50'))
+        compile_to_str(create_scope(main_file, jobs=1, separate=True))
+        after = sources(directory)
+        changed = sorted(name for name in after if after[name] != before.get(name))
+        checks.check(
+            changed == ['module1_0.cpp'], f'separate compilation (changed {", ".join(changed)})'
+        )
+    
+    return checks.result()
+
+def test_startup():
+    """Commands that fail before compiling anything must stay within the start-up budget and must
+not import the compiler (see cure/tests/startup.py)."""
+
+    from cure.tests.startup import (
+        LIGHT_COMMANDS, HEAVY_MODULES, STARTUP_BUDGET_MS, command_imports, startup_time,
+        format_command
+    )
+
+    fails: list[Path | str] = []
+    for command in LIGHT_COMMANDS:
+        print(f'Measuring the start-up of {format_command(command)}')
+        times = command_imports(command)
+        time = startup_time(times)
+        heavy_modules = sorted(HEAVY_MODULES & set(times))
+        if len(heavy_modules) > 0:
+            fails.append(f'{format_command(command)} (imports {", ".join(heavy_modules)})')
+        elif time > STARTUP_BUDGET_MS:
+            fails.append(f'{format_command(command)} ({time:.1f} ms > {STARTUP_BUDGET_MS} ms)')
+    
+    return fails, len(LIGHT_COMMANDS)
+
 def test_runtime():
     runtime_dir = Path.cwd() / 'cure' / 'tests' / 'runtime'
     files = list(runtime_dir.glob('*.cure'))
@@ -76,7 +582,7 @@ def test_runtime():
             res = run(exec_file)
             if res.returncode != 0:
                 fails.append(file)
-        except SystemExit:
+        except CompileError:
             fails.append(file)
     
     build_dir = runtime_dir / 'build'
@@ -93,9 +599,26 @@ def test():
     compile_fails, compile_num_files = test_compiler()
     runtime_fails, runtime_num_files = test_runtime()
     examples_fails, examples_num_files = test_examples()
+    frontends_fails, frontends_num_files = test_frontends()
+    dfa_fails, dfa_num_files = test_dfa_snapshot()
+    daemon_fails, daemon_num_files = test_daemon()
+    watch_fails, watch_num_checks = test_watch()
+    scopes_fails, scopes_num_checks = test_symbol_tables()
+    types_fails, types_num_checks = test_interned_types()
+    visitor_fails, visitor_num_checks = test_visitor()
+    modules_fails, modules_num_checks = test_modules()
+    registry_fails, registry_num_checks = test_module_registry()
+    interfaces_fails, interfaces_num_checks = test_module_interfaces()
+    separate_fails, separate_num_checks = test_separate_compilation()
+    startup_fails, startup_num_commands = test_startup()
 
-    total_num_files = compile_num_files + runtime_num_files + examples_num_files
-    all_fails = compile_fails + runtime_fails + examples_fails
+    total_num_files = compile_num_files + runtime_num_files + examples_num_files +\
+        frontends_num_files + dfa_num_files + daemon_num_files + watch_num_checks +\
+        scopes_num_checks + types_num_checks + visitor_num_checks + modules_num_checks +\
+        registry_num_checks + interfaces_num_checks + separate_num_checks + startup_num_commands
+    all_fails = compile_fails + runtime_fails + examples_fails + frontends_fails + dfa_fails +\
+        daemon_fails + watch_fails + scopes_fails + types_fails + visitor_fails + modules_fails +\
+        registry_fails + interfaces_fails + separate_fails + startup_fails
     success = len(all_fails) == 0
     if success:
         print(f'{Fore.GREEN}{Style.BRIGHT}All tests passed{Style.RESET_ALL}')
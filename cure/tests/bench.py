@@ -0,0 +1,700 @@
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from subprocess import run
+from pathlib import Path
+from os import environ
+import sys
+
+from colorama import Fore, Style
+
+
+def synthetic_function(index: int):
+    return f"""fn work{index}(int a, int b) -> int {{
+    mut total = 0
+    for i in 0..a {{
+        if i % 2 == 0 {{
+            total += i * b
+        }} else if i > 10 {{
+            total -= 1
+        }} else {{
+            total += Math.floor(2.5)
+        }}
+    }}
+
+    while total > 100 {{
+        total = (total) / 2
+    }}
+
+    arr = [1, 2, 3, total]
+    arr.add(b)
+    message = "work{index}: " + to_string(total)
+    print(message)
+    total += arr.length
+    return total if total > 0 else b
+}}
+"""
+
+def synthetic_source(functions: int):
+    """A valid Cure program with `functions` loop and branch heavy functions plus a main."""
+
+    calls = '\n'.join(f'    print(work{i}({i}, 3))' for i in range(functions))
+    return '\n'.join(synthetic_function(i) for i in range(functions)) + f"""
+fn main() -> int {{
+{calls}
+    return 0
+}}
+"""
+
+def example_files():
+    root = Path(__file__).parent.parent.parent
+    return sorted((root / 'examples').rglob('*.cure'))
+
+def report(name: str, seconds: float, **counts: int):
+    rates = ', '.join(f'{count / seconds:,.0f} {unit}/s' for unit, count in counts.items())
+    print(f'  {name:<32} {seconds * 1000:>10.2f} ms  ({rates})')
+
+def bench_parse():
+    from cure.parse_profiler import reset_parser_dfa
+    from cure.ir_builder import IRBuilder
+    from cure.ir import Scope
+
+    with TemporaryDirectory() as directory:
+        large_file = Path(directory) / 'large.cure'
+        large_file.write_text(synthetic_source(200))
+        files = example_files() + [large_file]
+        scopes = [Scope(file) for file in files]
+        lines = sum(len(scope.src.splitlines()) for scope in scopes)
+        print(f'Parsing {len(files)} files ({lines} lines, including a synthetic '\
+              f'{len(scopes[-1].src.splitlines())} line file)')
+
+        for sll, name in ((False, 'LL'), (True, 'SLL -> LL')):
+            reset_parser_dfa()
+            for label in ('cold', 'warm'):
+                tokens = 0
+                start = perf_counter()
+                for scope in scopes:
+                    tree = IRBuilder(scope).parse(sll)
+                    tokens += tree.stop.tokenIndex + 1
+
+                report(f'{name} ({label})', perf_counter() - start, tokens=tokens, lines=lines)
+
+def count_nodes(node):
+    from cure.visitor import NodeVisitor
+
+    class NodeCounter(NodeVisitor):
+        nodes = 0
+
+        def generic_visit(self, node):
+            self.nodes += 1
+
+    counter = NodeCounter()
+    counter.visit(node)
+    return counter.nodes
+
+def bench_frontend():
+    from cure.parse_profiler import reset_parser_dfa
+    from cure.native_parser import tokenize
+    from cure.compiler import get_frontend, FRONTENDS
+    from cure.ir import Scope
+
+    with TemporaryDirectory() as directory:
+        large_file = Path(directory) / 'large.cure'
+        large_file.write_text(synthetic_source(200))
+        files = example_files() + [large_file]
+        scopes = [Scope(file) for file in files]
+        tokens = sum(len(tokenize(scope.src)) for scope in scopes)
+        print(f'Building the IR of {len(files)} files ({tokens} tokens) with each front end')
+
+        reset_parser_dfa()
+        for name in FRONTENDS:
+            frontend = get_frontend(name)
+            for label in ('cold', 'warm'):
+                nodes = 0
+                start = perf_counter()
+                for scope in scopes:
+                    nodes += count_nodes(frontend(scope).build())
+
+                report(f'{name} ({label})', perf_counter() - start, tokens=tokens, nodes=nodes)
+
+def bench_dfa():
+    """Parses the examples in fresh processes, the way `cure build` does, with no parser DFA in the
+cache and then with the DFA the previous process saved."""
+
+    root = Path(__file__).parent.parent.parent
+    script = f"""import sys; sys.path.insert(0, {root.as_posix()!r})
+from time import perf_counter
+from pathlib import Path
+from cure.ir_builder import IRBuilder
+from cure.ir import Scope
+files = [Path(file) for file in sys.argv[1:]]
+start = perf_counter()
+for file in files:
+    IRBuilder(Scope(file)).parse()
+print(perf_counter() - start)
+"""
+
+    with TemporaryDirectory() as directory:
+        large_file = Path(directory) / 'large.cure'
+        large_file.write_text(synthetic_source(50))
+        files = [file.as_posix() for file in example_files() + [large_file]]
+        env = environ | {'CURE_CACHE_DIR': (Path(directory) / 'cache').as_posix()}
+        print(f'Parsing {len(files)} files in a new process')
+        for label in ('no snapshot', 'snapshot', 'snapshot (again)'):
+            res = run([sys.executable, '-c', script, *files], env=env, cwd=directory,
+                      capture_output=True, text=True)
+            report(label, float(res.stdout), files=len(files))
+
+def count_scopes(scope):
+    return 1 + sum(count_scopes(child) for child in scope.children)
+
+def bench_scopes():
+    """Analyses a file with thousands of nested blocks, every block creates a child scope of the
+file's scope."""
+
+    from cure.compiler import create_scope, parse
+    from cure.source import sources
+
+    with TemporaryDirectory() as directory:
+        large_file = Path(directory) / 'large.cure'
+        large_file.write_text(synthetic_source(500))
+        scope = create_scope(large_file)
+        program = parse(scope)
+        reads = sources.reads
+        start = perf_counter()
+        program.analyse(scope)
+        seconds = perf_counter() - start
+        scopes = count_scopes(scope)
+        print(f'Analysing a {scope.source.line_count} line file, {scopes} scopes, '\
+              f'{sources.reads - reads} source file reads')
+        report('analyse', seconds, scopes=scopes)
+
+        start = perf_counter()
+        for line in range(1, scope.source.line_count + 1):
+            scope.source.line(line)
+
+        report('line lookup', perf_counter() - start, lines=scope.source.line_count)
+
+def nested_source(depth: int, functions: int):
+    """A program with `functions` functions whose bodies nest `depth` if/else, while and for blocks
+inside each other."""
+
+    def block(level: int):
+        indent = '    ' * (level + 1)
+        if level == depth:
+            return f'{indent}total += {level}\n'
+        
+        inner = block(level + 1)
+        match level % 3:
+            case 0:
+                return f'{indent}if total > {level} {{\n{inner}{indent}}} else {{\n'\
+                    f'{indent}    total -= 1\n{indent}}}\n'
+            case 1:
+                return f'{indent}while total < {level} {{\n{inner}{indent}}}\n'
+            case _:
+                return f'{indent}for i{level} in 0..{level} {{\n{inner}{indent}}}\n'
+
+    body = block(0)
+    return '\n'.join(
+        f'fn nested{index}(int a) -> int {{\n    mut total = a\n{body}    return total\n}}\n'
+        for index in range(functions)
+    ) + 'fn main() -> int {\n    return 0\n}\n'
+
+def bench_nesting():
+    """Analyses a deeply nested program and a program with many small functions, every function and
+block creates a child scope, with the standard library's symbols in the file's scope."""
+
+    import tracemalloc
+
+    from cure.compiler import create_scope, parse
+
+    with TemporaryDirectory() as directory:
+        for name, depth, functions in (('deep', 60, 50), ('functions', 2, 2000)):
+            file = Path(directory) / f'{name}.cure'
+            file.write_text(nested_source(depth, functions))
+            scope = create_scope(file)
+            program = parse(scope)
+            tracemalloc.start()
+            start = perf_counter()
+            program.analyse(scope)
+            seconds = perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            report(f'{name} ({peak / 1024 / 1024:.1f} MB peak)', seconds, scopes=count_scopes(scope))
+
+def bench_nodes():
+    """Builds and analyses the IR of a 100,000 line program under tracemalloc, reporting the memory
+the IR nodes take and how many nodes analysis allocates instead of annotating the parsed ones, then
+copies the analysed nodes into the old dict-backed layout and into the slotted one to compare them."""
+
+    from dataclasses import fields, make_dataclass, replace
+    import tracemalloc
+
+    from cure.compiler import create_scope, get_frontend
+    from cure.visitor import NodeVisitor
+    from cure.ir import Node, Position
+
+    class NodeCollector(NodeVisitor):
+        def __init__(self):
+            self.nodes: dict[int, Node] = {}
+
+        def generic_visit(self, node):
+            self.nodes[id(node)] = node
+
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'large.cure'
+        file.write_text(synthetic_source(4350))
+        scope = create_scope(file, 'native')
+        print(f'Building and analysing the IR of a {scope.source.line_count} line file')
+
+        tracemalloc.start()
+        start = perf_counter()
+        program = get_frontend('native')(scope).build()
+        seconds = perf_counter() - start
+        size, _ = tracemalloc.get_traced_memory()
+        nodes = count_nodes(program)
+        report(f'build ({size / nodes:.0f} bytes/node)', seconds, nodes=nodes)
+
+        # keeps the parsed nodes alive, so an allocated node cannot reuse the id of a freed one
+        built = NodeCollector()
+        built.visit(program)
+        size, _ = tracemalloc.get_traced_memory()
+        start = perf_counter()
+        analysed = program.analyse(scope)
+        seconds = perf_counter() - start
+        analysed_size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        collector = NodeCollector()
+        collector.visit(analysed)
+        nodes = count_nodes(analysed)
+        report(
+            f'analyse ({(analysed_size - size) / nodes:.0f} bytes/node, '\
+            f'{len(collector.nodes.keys() - built.nodes.keys())} allocated nodes)', seconds,
+            nodes=nodes
+        )
+
+        # the same nodes in the layout they had before nodes were slotted and positions packed: a
+        # dataclass with a `__dict__` per node, holding a position dataclass with its own `__dict__`
+        DictPosition = make_dataclass('Position', [('line', int), ('column', int)])
+        dict_classes: dict[type, type] = {}
+
+        def dict_node(node: Node):
+            names = [node_field.name for node_field in fields(node)]
+            cls = dict_classes.get(node.__class__)
+            if cls is None:
+                cls = dict_classes[node.__class__] = make_dataclass(node.__class__.__name__, names)
+            
+            values = {name: getattr(node, name) for name in names}
+            values['pos'] = DictPosition(node.pos.line, node.pos.column)
+            return cls(**values)
+        
+        def slotted_node(node: Node):
+            return replace(node, pos=Position(node.pos.line, node.pos.column))
+
+        def object_size(obj):
+            size = sys.getsizeof(obj)
+            return size + sys.getsizeof(obj.__dict__) if hasattr(obj, '__dict__') else size
+
+        nodes = len(collector.nodes)
+        for name, layout in (('dict-backed', dict_node), ('slotted', slotted_node)):
+            tracemalloc.start()
+            start = perf_counter()
+            copies = [layout(node) for node in collector.nodes.values()]
+            seconds = perf_counter() - start
+            size, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            sizes = sum(object_size(copy) + object_size(copy.pos) for copy in copies)
+            del copies
+            report(
+                f'{name} ({size / nodes:.0f} traced, {sizes / nodes:.0f} getsizeof bytes/node)',
+                seconds, nodes=nodes
+            )
+
+def bench_visitor():
+    """Walks the analysed IR of a large program with `NodeVisitor` and rewrites it with
+`NodeTransformer`, then walks a chain of nodes nested deeper than the recursion limit."""
+
+    from cure.visitor import NodeVisitor, NodeTransformer
+    from cure.compiler import create_scope, parse
+    from cure.ir import Bracketed, Int, Position
+
+    class IntIncrementer(NodeTransformer):
+        def visit_Int(self, node):
+            return Int(node.pos, node.type, node.value + 1)
+
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'large.cure'
+        file.write_text(synthetic_source(500))
+        scope = create_scope(file)
+        program = parse(scope).analyse(scope)
+        nodes = count_nodes(program)
+        print(f'Walking the analysed IR of a {scope.source.line_count} line file')
+
+        start = perf_counter()
+        NodeVisitor().visit(program)
+        report('visit', perf_counter() - start, nodes=nodes)
+
+        start = perf_counter()
+        IntIncrementer().visit(program)
+        report('transform', perf_counter() - start, nodes=nodes)
+
+        depth = 100_000
+        chain = Int(Position.zero(), scope.type_map.get('int'), 0)
+        for _ in range(depth):
+            chain = Bracketed(Position.zero(), chain.type, chain)
+
+        start = perf_counter()
+        IntIncrementer().visit(chain)
+        report(f'transform {depth} nested nodes', perf_counter() - start, nodes=depth + 1)
+
+def bench_types():
+    """Compares and hashes the analysed types of a program with nested array and function types, the
+way analysis compares argument, condition and element types, spells them and forms the callee names
+of their operators, then spells the array instantiations of every function."""
+
+    from cure.compiler import create_scope, parse
+
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'types.cure'
+        file.write_text("""fn apply(int[][] values, (int[][], int) -> int[][] func) -> int[][] {
+    return func(values, 1)
+}
+
+fn main() -> int {
+    return 0
+}
+""" + synthetic_source(100))
+        scope = create_scope(file)
+        program = parse(scope)
+        start = perf_counter()
+        program.analyse(scope)
+        report('analyse', perf_counter() - start, lines=len(scope.src.splitlines()))
+
+        apply_type = scope.symbol_table.get('apply').type
+        same_type = scope.symbol_table.get('apply').type
+        other_type = scope.symbol_table.get('work0').type
+        comparisons = 100_000
+        start = perf_counter()
+        for _ in range(comparisons // 2):
+            _ = apply_type == same_type
+            _ = apply_type == other_type
+
+        report('compare', perf_counter() - start, comparisons=comparisons)
+
+        start = perf_counter()
+        for _ in range(comparisons):
+            hash(apply_type)
+
+        report('hash', perf_counter() - start, hashes=comparisons)
+
+        start = perf_counter()
+        for _ in range(comparisons):
+            apply_type.codegen(scope)
+
+        report('spell', perf_counter() - start, spellings=comparisons)
+
+        element_type = apply_type.param_types[0]
+        start = perf_counter()
+        for _ in range(comparisons):
+            f'{element_type.object_type(scope)}_eq_{element_type.object_type(scope)}'
+
+        report('mangle', perf_counter() - start, names=comparisons)
+
+        # every work function has its own `arr = [...]`, an instantiation of the generic array class
+        # that analysis interns, so the spelling and mangled name of all of them are computed once
+        array_types = [
+            node.type
+            for function in program.nodes if function.__class__.__name__ == 'Function'
+            and function.name.startswith('work')
+            for node in function.body.nodes if getattr(node, 'name', None) == 'arr'
+        ]
+        print(f'  {len(array_types)} array instantiations, '\
+              f'{len({id(array_type) for array_type in array_types})} distinct type objects')
+        spellings = comparisons // len(array_types)
+        start = perf_counter()
+        for _ in range(spellings):
+            for array_type in array_types:
+                array_type.codegen(scope)
+                array_type.object_type(scope)
+
+        report('spell and mangle instantiations', perf_counter() - start,
+               names=spellings * len(array_types))
+
+def calls_source(functions: int):
+    """A program calling overloaded standard library functions with arguments of every type, and a
+function with default and labelled arguments."""
+
+    calls = """    print(to_string(a) + to_string(b) + to_string(c) + to_string(d))
+    print(a)
+    print(b)
+    print(c)
+    print(d)
+    print(scale(a))
+    print(scale(a, factor: 3))
+    print(Math.floor(b) + Math.ceil(b))
+"""
+    return """fn scale(int value, int factor = 2) -> int {
+    return value * factor
+}
+""" + '\n'.join(f"""fn calls{index}(int a, float b, string c, bool d) -> int {{
+{calls * 4}    return a
+}}
+""" for index in range(functions)) + """
+fn main() -> int {
+    return 0
+}
+"""
+
+def bench_calls():
+    """Analyses a program with thousands of calls to overloaded functions."""
+
+    from cure.compiler import create_scope, parse
+
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'calls.cure'
+        file.write_text(calls_source(200))
+        scope = create_scope(file)
+        program = parse(scope)
+        calls = file.read_text().count('(') - 1
+        start = perf_counter()
+        program.analyse(scope)
+        report('analyse', perf_counter() - start, calls=calls)
+
+def arrays_source(functions: int):
+    """A program whose functions each create arrays of several element types."""
+
+    return '\n'.join(f"""fn arrays{index}(int a) -> int {{
+    floats = [1.5, 2.5]
+    bools = [true, false]
+    nested = [[a], [a, 1]]
+    floats.add(3.5)
+    nested.add([2])
+    return floats.length + bools.length + nested.length
+}}
+""" for index in range(functions)) + """
+fn main() -> int {
+    return 0
+}
+"""
+
+def bench_classes():
+    """Analyses a program whose functions instantiate the same generic classes (arrays of floats,
+bools and int arrays), each function's scope reuses the instantiation of the first."""
+
+    from cure.compiler import create_scope, parse
+
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'arrays.cure'
+        file.write_text(arrays_source(300))
+        scope = create_scope(file)
+        program = parse(scope)
+        start = perf_counter()
+        program.analyse(scope)
+        instances = scope.class_instances
+        report(f'analyse ({instances.defined} defined, {instances.reused} reused)',
+               perf_counter() - start, functions=300)
+
+def bench_batch():
+    """Compiles hundreds of files in one process with `compile_many`, the second time every file's
+IR and the standard library come from the in-memory cache."""
+
+    from cure.compiler import compile_many
+
+    with TemporaryDirectory() as directory:
+        files = []
+        for i in range(200):
+            file = Path(directory) / f'file{i}.cure'
+            file.write_text(synthetic_source(2) + f'\n// file {i}\n')
+            files.append(file)
+
+        print(f'Compiling {len(files)} files in one process')
+        for label in ('first', 'again'):
+            start = perf_counter()
+            results = compile_many(files)
+            errors = sum(result.error is not None for result in results)
+            report(f'{label} ({errors} errors)', perf_counter() - start, files=len(files))
+
+def bench_logging():
+    """Analyses a large file with the compiler's logging disabled (the default) and with debug
+logging to a file (`--verbose`)."""
+
+    from logging import FileHandler, DEBUG, NOTSET
+
+    from cure.compiler import create_scope, parse
+    from cure.log import logger
+
+    with TemporaryDirectory() as directory:
+        large_file = Path(directory) / 'large.cure'
+        large_file.write_text(synthetic_source(200))
+        print(f'Analysing a {len(large_file.read_text().splitlines())} line file')
+        for label, enabled in (('logging off', False), ('debug logging on', True)):
+            handler = FileHandler(Path(directory) / 'debug.log', 'w', encoding='utf-8')
+            if enabled:
+                logger.addHandler(handler)
+                logger.setLevel(DEBUG)
+
+            try:
+                scope = create_scope(large_file)
+                program = parse(scope)
+                start = perf_counter()
+                program.analyse(scope)
+                seconds = perf_counter() - start
+            finally:
+                logger.removeHandler(handler)
+                logger.setLevel(NOTSET)
+                handler.close()
+
+            report(label, seconds, scopes=count_scopes(scope))
+
+def bench_daemon():
+    """Runs `cure check` on a file as separate commands, compiling in each process and then through a
+daemon that stays warm between the commands."""
+
+    from subprocess import Popen, PIPE
+
+    root = Path(__file__).parent.parent.parent
+    main_file = (root / 'main.py').as_posix()
+    with TemporaryDirectory() as directory:
+        file = Path(directory) / 'large.cure'
+        file.write_text(synthetic_source(50))
+        env = environ | {
+            'CURE_DAEMON_SOCKET': (Path(directory) / 'daemon.sock').as_posix(),
+            'CURE_CACHE_DIR': (Path(directory) / 'cache').as_posix()
+        }
+        print(f'Checking a {len(file.read_text().splitlines())} line file 5 times')
+
+        def check(*args: str):
+            start = perf_counter()
+            for _ in range(5):
+                run([sys.executable, main_file, 'check', file.as_posix(), *args], env=env,
+                    cwd=directory, capture_output=True)
+            
+            return perf_counter() - start
+
+        report('cure check', check(), checks=5)
+        daemon = Popen([sys.executable, main_file, 'daemon', 'start'], env=env, cwd=directory,
+                       stdout=PIPE, text=True)
+        try:
+            assert daemon.stdout is not None
+            daemon.stdout.readline()
+            report('cure check --daemon', check('--daemon'), checks=5)
+        finally:
+            run([sys.executable, main_file, 'daemon', 'stop'], env=env, capture_output=True)
+            daemon.wait(10)
+
+def synthetic_project(directory: Path, layers: int, width: int, functions: int):
+    """Writes a project of `layers * width` modules to the directory, each module uses two modules of
+the layer below it, and returns its main file."""
+
+    def module_name(layer: int, index: int):
+        return f'module{layer}_{index}.cure'
+
+    def first_function(layer: int, index: int):
+        return (layer * width + index) * functions
+
+    for layer in range(layers):
+        for index in range(width):
+            first = first_function(layer, index)
+            uses, calls = ['use "builtins"'], ''
+            if layer > 0:
+                below = [(layer - 1, index), (layer - 1, (index + 1) % width)]
+                uses += [f'use "{module_name(*module)}"' for module in below]
+                calls = ' + '.join(f'work{first_function(*module)}(2, 3)' for module in below)
+            
+            (directory / module_name(layer, index)).write_text('\n'.join(uses) + '\n\n' + '\n'.join(
+                synthetic_function(first + i) for i in range(functions)
+            ) + f"""
+fn uses{first}() -> int {{
+    return {calls or '0'}
+}}
+""")
+
+    main_file = directory / 'main.cure'
+    main_file.write_text('\n'.join(
+        ['use "builtins"'] + [f'use "{module_name(layers - 1, index)}"' for index in range(width)]
+    ) + """
+fn main() -> int {
+    return 0
+}
+""")
+    return main_file
+
+def bench_modules():
+    """Checks a project of 60 modules in a new process, with the modules compiled one after another
+and in parallel (see `modules.compile_modules`), and again with the modules unchanged. The standard
+library and the parser DFA are cached before, the modules and their IR are not."""
+
+    from shutil import rmtree
+    from os import cpu_count
+
+    root = Path(__file__).parent.parent.parent
+    main_file = (root / 'main.py').as_posix()
+    with TemporaryDirectory() as directory:
+        cache_dir = Path(directory) / 'cache'
+        project = synthetic_project(Path(directory), 6, 10, 3)
+        env = environ | {'CURE_CACHE_DIR': cache_dir.as_posix()}
+
+        def check(jobs: int, clear: bool = True):
+            if clear:
+                rmtree(cache_dir / 'ir', ignore_errors=True)
+                rmtree(Path(directory) / 'build' / 'modules', ignore_errors=True)
+            
+            start = perf_counter()
+            res = run([sys.executable, main_file, 'check', project.name, f'--jobs={jobs}'],
+                      env=env, cwd=directory, capture_output=True, text=True)
+            assert res.returncode == 0, res.stdout + res.stderr
+            return perf_counter() - start
+
+        check(1) # caches the standard library and the parser DFA
+        # at least two processes, so the parallel compile is measured on a single CPU as well
+        jobs = max(cpu_count() or 1, 2)
+        print(f'Checking a project of 60 modules in a new process, {cpu_count()} CPUs')
+        report('--jobs=1', check(1), modules=60)
+        report(f'--jobs={jobs}', check(jobs), modules=60)
+        report('unchanged (interface files)', check(1, clear=False), modules=60)
+
+def bench_startup():
+    from cure.tests.startup import (
+        LIGHT_COMMANDS, STARTUP_BUDGET_MS, command_imports, module_imports, startup_time,
+        format_command
+    )
+
+    print(f'Import time of each command on top of the interpreter (budget {STARTUP_BUDGET_MS} ms)')
+    for command in LIGHT_COMMANDS:
+        times = command_imports(command)
+        slowest = sorted(times.items(), key=lambda item: item[1][1], reverse=True)[:3]
+        slowest_str = ', '.join(f'{name} {cumulative / 1000:.1f}' for name, (_, cumulative) in slowest)
+        print(f'  {format_command(command):<32} {startup_time(times):>10.2f} ms  ({slowest_str})')
+
+    for module in ('cure.compiler', 'cure.ir_builder'):
+        times = module_imports(module)
+        print(f'  {f"import {module}":<32} {startup_time(times):>10.2f} ms')
+
+
+BENCHMARKS = {
+    'parse': bench_parse,
+    'frontend': bench_frontend,
+    'dfa': bench_dfa,
+    'scopes': bench_scopes,
+    'nesting': bench_nesting,
+    'nodes': bench_nodes,
+    'visitor': bench_visitor,
+    'types': bench_types,
+    'calls': bench_calls,
+    'classes': bench_classes,
+    'batch': bench_batch,
+    'logging': bench_logging,
+    'daemon': bench_daemon,
+    'modules': bench_modules,
+    'startup': bench_startup,
+}
+
+def bench(name: str | None = None):
+    names = list(BENCHMARKS) if name is None else [name]
+    for bench_name in names:
+        if bench_name not in BENCHMARKS:
+            print(f'{Fore.RED}Unknown benchmark \'{bench_name}\'{Style.RESET_ALL}')
+            print(f'Benchmarks: {", ".join(BENCHMARKS)}')
+            return
+
+        print(f'{Style.BRIGHT}Benchmark {bench_name}{Style.RESET_ALL}')
+        BENCHMARKS[bench_name]()
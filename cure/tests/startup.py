@@ -0,0 +1,64 @@
+from tempfile import TemporaryDirectory
+from subprocess import run
+from pathlib import Path
+import sys
+
+
+ROOT_DIR = Path(__file__).parent.parent.parent
+MAIN_FILE = ROOT_DIR / 'main.py'
+# the start-up budget of the command line: the imports `cure <command>` does on top of the ones
+# the interpreter itself does at start-up (measured with `python -X importtime`) must take less
+# than this many milliseconds for every command that fails before compiling anything
+STARTUP_BUDGET_MS = 50
+# commands that only print usage, they must not import the compiler or the parser
+LIGHT_COMMANDS = [
+    [], ['unknown'], ['build'], ['build', 'missing.cure'], ['check'], ['cache'], ['profile'],
+    ['daemon'], ['stdlib']
+]
+HEAVY_MODULES = {'cure.compiler', 'cure.ir', 'cure.ir_builder', 'cure.native_parser', 'antlr4'}
+
+
+def import_times(args: list[str]):
+    """Runs the interpreter with `-X importtime`, returning the self and cumulative import time in
+microseconds of every module it imported."""
+
+    times: dict[str, tuple[int, int]] = {}
+    with TemporaryDirectory() as directory: # the command may write files to the working directory
+        res = run([sys.executable, '-X', 'importtime', *args], cwd=directory, capture_output=True,
+                  text=True)
+
+    for line in res.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative, name = line.removeprefix('import time:').split('|')
+        times[name.strip()] = (int(self_time), int(cumulative))
+
+    return times
+
+def startup_imports(args: list[str], runs: int = 3):
+    """The imports of running the interpreter with `args` that the bare interpreter does not do,
+taking the fastest of `runs` runs (the first run may also be compiling .pyc files)."""
+
+    baseline = import_times(['-c', 'pass'])
+    best: dict[str, tuple[int, int]] | None = None
+    for _ in range(runs):
+        times = {name: time for name, time in import_times(args).items() if name not in baseline}
+        if best is None or startup_time(times) < startup_time(best):
+            best = times
+
+    assert best is not None
+    return best
+
+def command_imports(command: list[str]):
+    return startup_imports([MAIN_FILE.as_posix(), *command])
+
+def module_imports(module: str):
+    return startup_imports(['-c', f'import sys; sys.path.insert(0, {ROOT_DIR.as_posix()!r}); '\
+                            f'import {module}'])
+
+def startup_time(times: dict[str, tuple[int, int]]):
+    return sum(self_time for self_time, _ in times.values()) / 1000
+
+def format_command(command: list[str]):
+    return ' '.join(['cure'] + command)
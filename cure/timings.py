@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from time import perf_counter
+from pathlib import Path
+from sys import platform
+import json
+
+try:
+    from resource import getrusage, RUSAGE_SELF, RUSAGE_CHILDREN
+except ImportError: # resource is not available on Windows
+    getrusage = None # type: ignore
+
+
+def peak_rss(children: bool = False):
+    """The peak resident set size in kilobytes of this process (or of the largest child process
+if `children` is True). Returns None on platforms without the `resource` module."""
+
+    if getrusage is None:
+        return None
+
+    max_rss = getrusage(RUSAGE_CHILDREN if children else RUSAGE_SELF).ru_maxrss
+    if platform == 'darwin': # macOS reports bytes instead of kilobytes
+        max_rss //= 1024
+
+    return max_rss
+
+@dataclass
+class Phase:
+    name: str
+    depth: int
+    wall_time: float = 0.0
+    peak_rss: int | None = None
+
+@dataclass
+class Timings:
+    enabled: bool = False
+    phases: list[Phase] = field(default_factory=list)
+    depth: int = 0
+
+    def reset(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases.clear()
+        self.depth = 0
+
+    @contextmanager
+    def phase(self, name: str, children: bool = False):
+        if not self.enabled:
+            yield
+            return
+
+        phase = Phase(name, self.depth)
+        self.phases.append(phase)
+        self.depth += 1
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            phase.wall_time = perf_counter() - start
+            phase.peak_rss = peak_rss(children)
+            self.depth -= 1
+
+    @property
+    def total(self):
+        return sum(phase.wall_time for phase in self.phases if phase.depth == 0)
+
+    def table(self):
+        name_width = max([len('Phase')] + [
+            len(phase.name) + phase.depth * 2 for phase in self.phases
+        ])
+        lines = [f'{"Phase":<{name_width}}  {"Wall (ms)":>10}  {"Peak RSS (MB)":>13}']
+        lines.append('-' * len(lines[0]))
+        for phase in self.phases:
+            name = '  ' * phase.depth + phase.name
+            rss = f'{phase.peak_rss / 1024:.1f}' if phase.peak_rss is not None else '-'
+            lines.append(f'{name:<{name_width}}  {phase.wall_time * 1000:>10.2f}  {rss:>13}')
+
+        lines.append('-' * len(lines[0]))
+        lines.append(f'{"Total":<{name_width}}  {self.total * 1000:>10.2f}')
+        return '\n'.join(lines)
+
+    def to_json(self, file: Path):
+        return {
+            'file': file.as_posix(),
+            'total': self.total,
+            'phases': [asdict(phase) for phase in self.phases]
+        }
+
+    def write_json(self, path: Path, file: Path):
+        path.write_text(json.dumps(self.to_json(file), indent=4))
+
+
+timings = Timings()
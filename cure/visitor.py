@@ -0,0 +1,93 @@
+from dataclasses import replace
+from typing import Callable, Any
+
+from cure.ir import Node, child_fields
+
+
+class NodeVisitor:
+    """Walks an IR tree, calling `visit_<node class name>(node)` for every node before its children
+(`Node.children`, which include the nodes' types) and `generic_visit` for nodes without a visit
+method. A visit method that returns False skips the node's children. The walk keeps its own stack,
+so a deeply nested tree does not reach Python's recursion limit, and the visit methods are looked
+up once per node class."""
+
+    dispatch: dict[type[Node], Callable[[Any, Node], Any]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dispatch = {}
+
+    def method(self, node_class: type[Node]):
+        method = self.dispatch.get(node_class)
+        if method is None:
+            method = self.dispatch[node_class] = getattr(
+                self.__class__, f'visit_{node_class.__name__}', self.__class__.generic_visit
+            )
+
+        return method
+
+    def generic_visit(self, node: Node) -> Any:
+        return None
+
+    def visit(self, node: Node):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self.method(node.__class__)(self, node) is False:
+                continue
+
+            children = node.children
+            children.reverse()
+            stack.extend(children)
+
+class NodeTransformer(NodeVisitor):
+    """Rewrites an IR tree from the leaves up, calling `visit_<node class name>(node)` for every
+node after its children were transformed and replacing the node with what the method returns. None
+removes the node from a list (or leaves an optional field empty) and `generic_visit` keeps the node.
+Nodes whose children did not change are kept, the others are copied with the new children, so the
+transformed tree shares the unchanged parts of the original. Types are interned (see `Type.intern`),
+a method that returns a new type should return an interned one."""
+
+    def generic_visit(self, node: Node) -> Node | None:
+        return node
+
+    def rebuild(self, node: Node, children: list[Node | None]):
+        changes: dict[str, Any] = {}
+        index = 0
+        for name, is_list in child_fields(node.__class__):
+            value = getattr(node, name)
+            if value is None:
+                continue
+
+            if is_list:
+                new_value = children[index:index + len(value)]
+                index += len(value)
+                if any(new_child is not child for new_child, child in zip(new_value, value)):
+                    changes[name] = [child for child in new_value if child is not None]
+            else:
+                if children[index] is not value:
+                    changes[name] = children[index]
+
+                index += 1
+
+        return replace(node, **changes) if changes else node
+
+    def visit(self, node: Node) -> Node | None:
+        # a node is on the stack twice, with no child count before its children and with their
+        # count after them, when the results of its children are the last ones in `results`
+        results: list[Node | None] = []
+        stack: list[tuple[Node, int | None]] = [(node, None)]
+        while stack:
+            node, count = stack.pop()
+            if count is None:
+                children = node.children
+                stack.append((node, len(children)))
+                stack.extend((child, None) for child in reversed(children))
+                continue
+
+            start = len(results) - count
+            node = self.rebuild(node, results[start:])
+            del results[start:]
+            results.append(self.method(node.__class__)(self, node))
+
+        return results[0]
@@ -0,0 +1,107 @@
+from time import perf_counter, sleep
+from pathlib import Path
+
+from cure.compiler import create_scope, compile_to_exe, source_files
+from cure.diagnostics import CompileError
+from cure.modules import import_graph
+from cure.ir import Scope
+from cure.log import info
+
+
+# how often the watched files are polled and for how long they must stay unchanged before a rebuild
+# (editors often save a file in several writes), in seconds
+POLL_INTERVAL = 0.25
+DEBOUNCE_TIME = 0.1
+
+
+def watched_files(scope: Scope):
+    """Every file a rebuild depends on: the scope's file, the .cure modules it used, their
+dependencies.txt files and the C++ sources these list."""
+
+    return list(dict.fromkeys(source_files(scope) + [
+        dep.path for dep in scope.dependencies if dep.type in ('manifest', 'src')
+    ]))
+
+def used_modules(file: Path, frontend: str = 'antlr'):
+    """The local modules the file uses directly or through other modules, found without compiling
+it, so a module that fails to compile is watched as well."""
+
+    try:
+        return list(import_graph(file, frontend))
+    except (OSError, CompileError): # the file was removed or does not parse, rebuilding reports it
+        return []
+
+def modification_times(files: list[Path]):
+    times: dict[Path, int | None] = {}
+    for file in files:
+        try:
+            times[file] = file.stat().st_mtime_ns
+        except OSError: # removed, rebuilding reports it
+            times[file] = None
+
+    return times
+
+def wait_for_changes(files: list[Path], interval: float = POLL_INTERVAL,
+                     debounce: float = DEBOUNCE_TIME, timeout: float | None = None):
+    """Polls the files until one of them changes and then until none of them changed for `debounce`
+seconds, returning the files that changed, or no files if none changed within `timeout` seconds."""
+
+    start = perf_counter()
+    before = modification_times(files)
+    current = before
+    while current == before:
+        if timeout is not None and perf_counter() - start > timeout:
+            return []
+        
+        sleep(interval)
+        current = modification_times(files)
+
+    settled = None
+    while current != settled:
+        settled = current
+        sleep(debounce)
+        current = modification_times(files)
+
+    return [file for file in files if current[file] != before[file]]
+
+def rebuild(file: Path, frontend: str, jobs: int | None = None, separate: bool = False,
+            watched: list[Path] | None = None):
+    """Builds the file, returning the files to watch for the next build. Only the modules whose
+files changed are compiled again, the others come from their interface files (see
+`Scope.compile_module`), and the CMake build directory is not configured again. The file and the
+modules it uses are always watched, and after a failed build the files `watched` before as well."""
+
+    start = perf_counter()
+    scope = None
+    try:
+        scope = create_scope(file, frontend, jobs, separate)
+        success = compile_to_exe(scope) is not None
+    except CompileError as e:
+        e.report()
+        success = False
+    except OSError as e: # a file was removed or is being written
+        print(f'error: {e}')
+        success = False
+
+    latency = (perf_counter() - start) * 1000
+    print(f'{"Rebuilt" if success else "Failed to build"} {file.as_posix()} in {latency:.0f} ms')
+    info(f'Rebuild of {file} took {latency:.0f} ms')
+    files = [file] + used_modules(file, frontend)
+    files += [] if scope is None else watched_files(scope)
+    if not success and watched is not None:
+        files += watched
+    
+    return list(dict.fromkeys(files))
+
+def watch(file: Path, frontend: str, jobs: int | None = None, separate: bool = False):
+    """Rebuilds the file whenever it or a file it depends on changes, until interrupted."""
+
+    try:
+        files: list[Path] = []
+        while True:
+            files = rebuild(file, frontend, jobs, separate, files)
+            print(f'Watching {len(files)} files for changes, press Ctrl+C to stop')
+            changed = wait_for_changes(files)
+            print(f'{", ".join(changed_file.name for changed_file in changed)} changed')
+    except KeyboardInterrupt:
+        print('Stopped watching')
@@ -1,32 +1,32 @@
-from platform import system, architecture, platform, processor, machine
-from logging import info, DEBUG, basicConfig
-from sys import argv
-
-from colorama import init
+from logging import DEBUG, basicConfig
+from sys import argv, platform
 
+from cure.log import info
 from cure import ArgParser
 
 
 def main():
-    info(f"""Running Cure compiler
-System = {system()}
-Architecture = {architecture()[0]}
-Platform = {platform()}
-Processor = {processor()}
-Machine = {machine()}
-""")
-    
     arg_parser = ArgParser(argv[1:])
+
+    # debug logging formats a message for nearly every node the compiler analyses, so it is only
+    # enabled on request
+    log_file = arg_parser.option('log-file', 'debug.log' if arg_parser.flag('verbose') else None)
+    if log_file is not None:
+        basicConfig(
+            filename=log_file, filemode='w',
+            format='[%(levelname)s] %(filename)s (line %(lineno)d) - %(message)s',
+            datefmt='%H:%M:%S', encoding='utf-8', level=DEBUG
+        )
+    
+    info('Running Cure compiler')
     arg_parser.parse()
 
     info('Successfully ran Cure compiler')
 
 
 if __name__ == '__main__':
-    init()
-    basicConfig(
-        filename='debug.log', filemode='w',
-        format='[%(levelname)s] %(filename)s (line %(lineno)d) - %(message)s',
-        datefmt='%H:%M:%S', encoding='utf-8', level=DEBUG
-    )
+    if platform == 'win32': # colorama is only needed to enable ANSI colors in Windows consoles
+        from colorama import init
+        init()
+    
     main()